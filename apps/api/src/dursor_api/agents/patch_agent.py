@@ -7,6 +7,7 @@ from pathlib import Path
 from dursor_api.agents.base import BaseAgent
 from dursor_api.agents.llm_router import LLMClient
 from dursor_api.domain.models import AgentRequest, AgentResult, FileDiff
+from dursor_api.services.diff_parser import parse_diff
 
 SYSTEM_PROMPT = """You are a code editing assistant that generates unified diff patches.
 
@@ -123,7 +124,7 @@ class PatchAgent(BaseAgent):
         logs.append(f"Generated patch with {len(patch)} characters")
 
         # Parse patch to get file changes
-        files_changed = self._parse_patch(patch)
+        files_changed = parse_diff(patch)
         logs.append(f"Patch affects {len(files_changed)} files")
 
         # Check for forbidden path modifications
@@ -318,82 +319,6 @@ class PatchAgent(BaseAgent):
 
         return response.strip()
 
-    def _parse_patch(self, patch: str) -> list[FileDiff]:
-        """Parse unified diff patch to extract file changes.
-
-        Args:
-            patch: Unified diff patch string.
-
-        Returns:
-            List of FileDiff objects.
-        """
-        files: list[FileDiff] = []
-        current_file: str | None = None
-        current_patch_lines: list[str] = []
-        added = 0
-        removed = 0
-
-        for line in patch.split("\n"):
-            if line.startswith("--- "):
-                # Save previous file
-                if current_file:
-                    files.append(
-                        FileDiff(
-                            path=current_file,
-                            added_lines=added,
-                            removed_lines=removed,
-                            patch="\n".join(current_patch_lines),
-                        )
-                    )
-
-                # Start new file
-                current_patch_lines = [line]
-                added = 0
-                removed = 0
-
-            elif line.startswith("+++ "):
-                # Extract file path
-                path = line[4:].strip()
-                if path.startswith("b/"):
-                    path = path[2:]
-                elif path == "/dev/null":
-                    # File deletion - use previous file path
-                    pass
-                else:
-                    current_file = path
-
-                if current_file is None and path != "/dev/null":
-                    current_file = path
-
-                current_patch_lines.append(line)
-
-            elif line.startswith("@@"):
-                current_patch_lines.append(line)
-
-            elif line.startswith("+") and not line.startswith("+++"):
-                added += 1
-                current_patch_lines.append(line)
-
-            elif line.startswith("-") and not line.startswith("---"):
-                removed += 1
-                current_patch_lines.append(line)
-
-            else:
-                current_patch_lines.append(line)
-
-        # Save last file
-        if current_file:
-            files.append(
-                FileDiff(
-                    path=current_file,
-                    added_lines=added,
-                    removed_lines=removed,
-                    patch="\n".join(current_patch_lines),
-                )
-            )
-
-        return files
-
     async def _generate_summary(
         self,
         instruction: str,
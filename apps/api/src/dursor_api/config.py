@@ -112,12 +112,48 @@ class Settings(BaseSettings):
     github_app_id: str = Field(default="")
     github_app_private_key: str = Field(default="")  # Base64 encoded
     github_app_installation_id: str = Field(default="")
+    github_webhook_secret: str = Field(default="")  # Webhooks are rejected when unset
 
     # CLI Executor Paths (optional, defaults to executable name in PATH)
     claude_cli_path: str = Field(default="claude")
     codex_cli_path: str = Field(default="codex")
     gemini_cli_path: str = Field(default="gemini")
 
+    # Output streaming (run/breakdown logs)
+    output_history_lines: int = Field(default=1000)  # In-memory tail per stream
+    output_cleanup_after_seconds: float = Field(default=3600.0)
+    output_memory_budget_mb: int = Field(default=64)  # Across all streams
+    output_maintenance_interval_seconds: float = Field(default=60.0)  # 0 disables
+    # Cross-process fan-out for multiple uvicorn workers: "file" tails the shared
+    # log store; "redis" pushes lines over pub/sub (requires the redis extra)
+    output_transport: Literal["file", "redis"] = "file"
+    output_file_poll_seconds: float = Field(default=0.25)
+    redis_url: str = Field(default="redis://localhost:6379/0")
+
+    # Managed repositories (workspaces cloned by dursor)
+    git_performance_profile: bool = True  # untracked cache, fsmonitor, commit-graph, ...
+    git_maintenance_interval_seconds: float = Field(default=3600.0)  # 0 disables
+    git_mirror_cache: bool = True  # share objects via bare mirrors under workspaces_dir
+    git_mirror_refresh_seconds: float = Field(default=30.0)
+
+    # Worktree garbage collection (run worktrees under workspaces_dir/worktrees)
+    worktree_gc_interval_seconds: float = Field(default=900.0)  # 0 disables
+    worktree_max_age_days: float = Field(default=14.0)  # Since last run activity; 0 disables
+    worktree_quota_per_repo_gb: float = Field(default=0.0)  # 0 = unlimited
+    worktree_quota_total_gb: float = Field(default=0.0)  # 0 = unlimited
+
+    # Background sync of open PR statuses from GitHub (batched GraphQL)
+    pr_status_sync_interval_seconds: float = Field(default=300.0)  # 0 disables
+
+    # Draft PR titles/descriptions in the background as soon as a run is committed
+    pr_speculative_drafts: bool = False
+
+    # Model for PR titles/descriptions and commit messages, called directly through
+    # LLMRouter (API key from the provider's *_API_KEY). Opt-in: with no model name
+    # (the default), a missing key or a failed call, the run's CLI executor is used.
+    text_model_provider: Literal["anthropic", "openai", "google"] = "anthropic"
+    text_model_name: str = ""
+
     def model_post_init(self, __context: object) -> None:
         """Set derived paths after initialization."""
         if self.workspaces_dir is None:
@@ -1,21 +1,30 @@
 """FastAPI dependency injection."""
 
+from datetime import timedelta
+
 from dursor_api.config import settings
 from dursor_api.services.breakdown_service import BreakdownService
 from dursor_api.services.crypto_service import CryptoService
 from dursor_api.services.git_service import GitService
 from dursor_api.services.github_service import GitHubService
+from dursor_api.services.github_webhook import GitHubWebhookService
 from dursor_api.services.kanban_service import KanbanService
+from dursor_api.services.log_transport import FileTailTransport, LogTransport, RedisTransport
 from dursor_api.services.model_service import ModelService
 from dursor_api.services.output_manager import OutputManager
+from dursor_api.services.post_run_pipeline import PostRunPipeline
 from dursor_api.services.pr_service import PRService
 from dursor_api.services.repo_service import RepoService
+from dursor_api.services.run_log_store import RunLogStore
 from dursor_api.services.run_service import RunService
+from dursor_api.services.worktree_gc import WorktreeGC
 from dursor_api.storage.dao import (
     PRDAO,
     BacklogDAO,
+    GitHubWebhookDeliveryDAO,
     MessageDAO,
     ModelProfileDAO,
+    PRDraftDAO,
     RepoDAO,
     RunDAO,
     TaskDAO,
@@ -29,6 +38,8 @@ _run_service: RunService | None = None
 _git_service: GitService | None = None
 _output_manager: OutputManager | None = None
 _breakdown_service: BreakdownService | None = None
+_post_run_pipeline: PostRunPipeline | None = None
+_github_service: GitHubService | None = None
 
 
 def get_crypto_service() -> CryptoService:
@@ -75,6 +86,12 @@ async def get_pr_dao() -> PRDAO:
     return PRDAO(db)
 
 
+async def get_pr_draft_dao() -> PRDraftDAO:
+    """Get PRDraft DAO."""
+    db = await get_db()
+    return PRDraftDAO(db)
+
+
 async def get_model_service() -> ModelService:
     """Get the model service."""
     dao = await get_model_profile_dao()
@@ -96,11 +113,57 @@ def get_git_service() -> GitService:
     return _git_service
 
 
+async def get_post_run_pipeline() -> PostRunPipeline:
+    """Get the post-run pipeline singleton (shared by runs and PRs)."""
+    global _post_run_pipeline
+    if _post_run_pipeline is None:
+        _post_run_pipeline = PostRunPipeline(
+            await get_run_dao(),
+            get_git_service(),
+            await get_github_service(),
+        )
+        if settings.pr_speculative_drafts:
+            pr_service = await get_pr_service()
+            _post_run_pipeline.pr_prep = pr_service.prepare_draft
+    return _post_run_pipeline
+
+
+async def get_worktree_gc() -> WorktreeGC:
+    """Get the worktree garbage collector."""
+    gib = 1024**3
+    return WorktreeGC(
+        await get_run_dao(),
+        await get_repo_dao(),
+        get_git_service(),
+        max_age=(
+            timedelta(days=settings.worktree_max_age_days)
+            if settings.worktree_max_age_days > 0
+            else None
+        ),
+        quota_per_repo_bytes=int(settings.worktree_quota_per_repo_gb * gib),
+        quota_total_bytes=int(settings.worktree_quota_total_gb * gib),
+        output_manager=get_output_manager(),
+        post_run_pipeline=await get_post_run_pipeline(),
+    )
+
+
 def get_output_manager() -> OutputManager:
     """Get the output manager singleton."""
     global _output_manager
     if _output_manager is None:
-        _output_manager = OutputManager()
+        log_store = RunLogStore()
+        transport: LogTransport
+        if settings.output_transport == "redis":
+            transport = RedisTransport(log_store, settings.redis_url)
+        else:
+            transport = FileTailTransport(log_store, settings.output_file_poll_seconds)
+        _output_manager = OutputManager(
+            max_history=settings.output_history_lines,
+            cleanup_after=settings.output_cleanup_after_seconds,
+            log_store=log_store,
+            memory_budget_bytes=settings.output_memory_budget_mb * 1024 * 1024,
+            transport=transport,
+        )
     return _output_manager
 
 
@@ -116,6 +179,8 @@ async def get_run_service() -> RunService:
         user_preferences_dao = await get_user_preferences_dao()
         github_service = await get_github_service()
         output_manager = get_output_manager()
+        backlog_dao = await get_backlog_dao()
+        post_run_pipeline = await get_post_run_pipeline()
         _run_service = RunService(
             run_dao,
             task_dao,
@@ -125,6 +190,8 @@ async def get_run_service() -> RunService:
             user_preferences_dao,
             github_service,
             output_manager,
+            backlog_dao,
+            post_run_pipeline,
         )
     return _run_service
 
@@ -138,15 +205,28 @@ async def get_pr_service() -> PRService:
     github_service = await get_github_service()
     model_service = await get_model_service()
     git_service = get_git_service()
+    post_run_pipeline = await get_post_run_pipeline()
+    pr_draft_dao = await get_pr_draft_dao()
     return PRService(
-        pr_dao, task_dao, run_dao, repo_service, github_service, model_service, git_service
+        pr_dao,
+        task_dao,
+        run_dao,
+        repo_service,
+        github_service,
+        model_service,
+        git_service,
+        post_run_pipeline,
+        pr_draft_dao,
     )
 
 
 async def get_github_service() -> GitHubService:
-    """Get the GitHub service."""
-    db = await get_db()
-    return GitHubService(db)
+    """Get the GitHub service singleton (shares token and response caches)."""
+    global _github_service
+    if _github_service is None:
+        db = await get_db()
+        _github_service = GitHubService(db)
+    return _github_service
 
 
 async def get_user_preferences_dao() -> UserPreferencesDAO:
@@ -179,3 +259,9 @@ async def get_kanban_service() -> KanbanService:
     pr_dao = await get_pr_dao()
     github_service = await get_github_service()
     return KanbanService(task_dao, run_dao, pr_dao, github_service)
+
+
+async def get_github_webhook_service() -> GitHubWebhookService:
+    """Get the GitHub webhook service."""
+    db = await get_db()
+    return GitHubWebhookService(PRDAO(db), GitHubWebhookDeliveryDAO(db))
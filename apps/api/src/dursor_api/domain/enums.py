@@ -21,6 +21,16 @@ class RunStatus(str, Enum):
     CANCELED = "canceled"
 
 
+class PostRunStatus(str, Enum):
+    """Status of a background post-run stage (commit, push)."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
 class MessageRole(str, Enum):
     """Message role in conversation."""
 
@@ -38,6 +48,16 @@ class ExecutorType(str, Enum):
     GEMINI_CLI = "gemini_cli"  # Google Gemini CLI execution
 
 
+class FileChangeType(str, Enum):
+    """Kind of change made to a file in a diff."""
+
+    ADDED = "added"
+    MODIFIED = "modified"
+    DELETED = "deleted"
+    RENAMED = "renamed"
+    COPIED = "copied"
+
+
 class PRCreationMode(str, Enum):
     """Default behavior for 'Create PR' actions."""
 
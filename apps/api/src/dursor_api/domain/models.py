@@ -11,7 +11,9 @@ from dursor_api.domain.enums import (
     BrokenDownTaskType,
     EstimatedSize,
     ExecutorType,
+    FileChangeType,
     MessageRole,
+    PostRunStatus,
     PRCreationMode,
     Provider,
     RunStatus,
@@ -57,6 +59,12 @@ class RepoCloneRequest(BaseModel):
 
     repo_url: str = Field(..., description="Git repository URL")
     ref: str | None = Field(None, description="Branch or commit to checkout")
+    full_clone: bool = Field(
+        False, description="Fetch all file contents up front instead of a blobless clone"
+    )
+    sparse_paths: list[str] | None = Field(
+        None, description="Directories to check out (sparse checkout); omit for the whole tree"
+    )
 
 
 class Repo(BaseModel):
@@ -67,6 +75,8 @@ class Repo(BaseModel):
     default_branch: str
     latest_commit: str
     workspace_path: str
+    full_clone: bool = False
+    sparse_paths: list[str] | None = None
     created_at: datetime
 
     class Config:
@@ -176,6 +186,30 @@ class RunCreate(BaseModel):
         description="Executor type: patch_agent (LLM) or claude_code (CLI)",
     )
     message_id: str | None = Field(None, description="ID of the triggering message")
+    sparse_checkout: bool = Field(
+        False,
+        description="Check out only the task's target files (from its backlog item) "
+        "in a sparse worktree (CLI executors)",
+    )
+    sparse_paths: list[str] | None = Field(
+        None, description="Files/directories for a sparse worktree; overrides target files"
+    )
+
+
+class SparseCheckoutUpdate(BaseModel):
+    """Request for widening a run's sparse worktree."""
+
+    paths: list[str] | None = Field(
+        None, description="Files/directories to add; omit to check out the full tree"
+    )
+
+
+class SparseCheckoutState(BaseModel):
+    """Sparse checkout state of a run's worktree."""
+
+    sparse_dirs: list[str] | None = Field(
+        None, description="Checked-out directories (plus top-level files); null for full tree"
+    )
 
 
 class RunSummary(BaseModel):
@@ -197,6 +231,8 @@ class FileDiff(BaseModel):
 
     path: str
     old_path: str | None = None
+    change_type: FileChangeType = FileChangeType.MODIFIED
+    is_binary: bool = False
     added_lines: int = 0
     removed_lines: int = 0
     patch: str = ""
@@ -219,6 +255,10 @@ class Run(BaseModel):
     base_ref: str | None
     commit_sha: str | None = None  # Latest commit SHA for the run
     status: RunStatus
+    # Background stages after a CLI run (None when not applicable)
+    commit_status: PostRunStatus | None = None
+    push_status: PostRunStatus | None = None
+    post_run_error: str | None = None
     summary: str | None = None
     patch: str | None = None
     files_changed: list[FileDiff] = []
@@ -233,6 +273,58 @@ class Run(BaseModel):
         from_attributes = True
 
 
+class RunWorktree(BaseModel):
+    """A run's worktree with the state used to decide when it can be removed."""
+
+    run_id: str
+    task_id: str
+    repo_id: str
+    worktree_path: str
+    status: RunStatus
+    task_kanban_status: str
+    pr_status: str | None = None
+    commit_status: PostRunStatus | None = None
+    last_active_at: datetime
+
+
+class RunFile(BaseModel):
+    """Change stats for one file of a run (no patch text)."""
+
+    path: str
+    old_path: str | None = None
+    change_type: FileChangeType = FileChangeType.MODIFIED
+    is_binary: bool = False
+    added_lines: int = 0
+    removed_lines: int = 0
+    hunk_count: int = 0  # 0 for CLI run files until their patch is first loaded
+
+
+class RunFilePatch(BaseModel):
+    """Patch for one file of a run, limited to a range of hunks."""
+
+    path: str
+    old_path: str | None = None
+    header: str = Field("", description="Diff header lines before the first hunk")
+    hunks: list[str] = Field(default_factory=list, description="Requested hunks, in order")
+    hunk_start: int = 0
+    hunk_count: int = Field(0, description="Total number of hunks in the file")
+
+
+class RunSearchResult(BaseModel):
+    """A run matching a full-text search."""
+
+    id: str
+    task_id: str
+    repo_id: str
+    model_name: str | None
+    executor_type: ExecutorType
+    status: RunStatus
+    instruction: str
+    summary: str | None = None
+    snippet: str = Field("", description="Matching text with hits wrapped in ** markers")
+    created_at: datetime
+
+
 # ============================================================
 # Pull Request
 # ============================================================
@@ -288,6 +380,17 @@ class PR(BaseModel):
         from_attributes = True
 
 
+class PRDraft(BaseModel):
+    """PR title and description generated ahead of PR creation."""
+
+    commit_sha: str
+    template_hash: str
+    run_id: str
+    title: str
+    body: str
+    created_at: datetime
+
+
 # ============================================================
 # Agent I/F
 # ============================================================
@@ -463,12 +566,25 @@ class GitHubRepository(BaseModel):
     private: bool
 
 
+class GitHubRateLimit(BaseModel):
+    """GitHub API rate limit of one resource, from the latest response headers."""
+
+    resource: str  # core, graphql, search, ...
+    limit: int
+    remaining: int
+    used: int
+    reset_at: datetime
+    updated_at: datetime
+
+
 class RepoSelectRequest(BaseModel):
     """Request for selecting a repository by name."""
 
     owner: str
     repo: str
     branch: str | None = None
+    full_clone: bool = False
+    sparse_paths: list[str] | None = None
 
 
 # ============================================================
@@ -517,6 +633,22 @@ class PRSyncResult(BaseModel):
     pr: "PRCreated | None" = None
 
 
+class PRStatusSyncResult(BaseModel):
+    """Result of a bulk PR status sync."""
+
+    checked: int
+    updated: int
+
+
+class GitHubWebhookResult(BaseModel):
+    """Result of ingesting a GitHub webhook delivery."""
+
+    event: str
+    delivery_id: str
+    duplicate: bool = False
+    updated: int = 0  # PR records changed by the delivery
+
+
 class PRLinkJob(BaseModel):
     """Response for starting async PR link generation."""
 
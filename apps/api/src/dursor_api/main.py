@@ -1,5 +1,7 @@
 """dursor API - FastAPI application entry point."""
 
+import asyncio
+import contextlib
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -7,6 +9,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from dursor_api.config import settings
+from dursor_api.dependencies import (
+    get_kanban_service,
+    get_output_manager,
+    get_repo_service,
+    get_run_service,
+    get_worktree_gc,
+)
 from dursor_api.routes import (
     backlog_router,
     breakdown_router,
@@ -17,7 +26,9 @@ from dursor_api.routes import (
     prs_router,
     repos_router,
     runs_router,
+    streams_router,
     tasks_router,
+    webhooks_router,
 )
 from dursor_api.storage.db import get_db
 
@@ -29,8 +40,56 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     db = await get_db()
     await db.initialize()
 
+    # Startup: background maintenance (output stream cleanup and memory caps)
+    output_manager = get_output_manager()
+    maintenance_tasks: list[asyncio.Task[None]] = []
+    if settings.output_maintenance_interval_seconds > 0:
+        maintenance_tasks.append(
+            asyncio.create_task(
+                output_manager.run_maintenance_loop(settings.output_maintenance_interval_seconds)
+            )
+        )
+
+    # Startup: periodic git maintenance of managed workspaces
+    if settings.git_maintenance_interval_seconds > 0:
+        repo_service = await get_repo_service()
+        maintenance_tasks.append(
+            asyncio.create_task(
+                repo_service.run_maintenance_loop(settings.git_maintenance_interval_seconds)
+            )
+        )
+
+    # Startup: worktree garbage collection and disk quotas
+    if settings.worktree_gc_interval_seconds > 0:
+        worktree_gc = await get_worktree_gc()
+        maintenance_tasks.append(
+            asyncio.create_task(worktree_gc.run_gc_loop(settings.worktree_gc_interval_seconds))
+        )
+
+    # Startup: periodic sync of open PR statuses (keeps the Done column accurate)
+    if settings.pr_status_sync_interval_seconds > 0:
+        kanban_service = await get_kanban_service()
+        maintenance_tasks.append(
+            asyncio.create_task(
+                kanban_service.run_pr_sync_loop(settings.pr_status_sync_interval_seconds)
+            )
+        )
+
+    # Startup: resume commit/push stages interrupted by the last shutdown
+    run_service = await get_run_service()
+    await run_service.resume_post_run_stages()
+
     yield
 
+    # Shutdown: stop background maintenance
+    for task in maintenance_tasks:
+        task.cancel()
+    for task in maintenance_tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await output_manager.close()
+    await run_service.post_run_pipeline.close()
+
     # Shutdown: close database
     await db.disconnect()
 
@@ -63,6 +122,8 @@ app.include_router(repos_router, prefix="/v1")
 app.include_router(tasks_router, prefix="/v1")
 app.include_router(runs_router, prefix="/v1")
 app.include_router(prs_router, prefix="/v1")
+app.include_router(streams_router, prefix="/v1")
+app.include_router(webhooks_router, prefix="/v1")
 
 
 @app.get("/health")
@@ -71,6 +132,12 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy", "version": "0.1.0"}
 
 
+@app.get("/stats")
+async def stats() -> dict[str, object]:
+    """Runtime statistics for in-process resources."""
+    return {"output": await get_output_manager().get_stats()}
+
+
 @app.get("/")
 async def root() -> dict[str, str]:
     """Root endpoint with API info."""
@@ -9,7 +9,9 @@ from dursor_api.routes.preferences import router as preferences_router
 from dursor_api.routes.prs import router as prs_router
 from dursor_api.routes.repos import router as repos_router
 from dursor_api.routes.runs import router as runs_router
+from dursor_api.routes.streams import router as streams_router
 from dursor_api.routes.tasks import router as tasks_router
+from dursor_api.routes.webhooks import router as webhooks_router
 
 __all__ = [
     "backlog_router",
@@ -22,4 +24,6 @@ __all__ = [
     "tasks_router",
     "runs_router",
     "prs_router",
+    "streams_router",
+    "webhooks_router",
 ]
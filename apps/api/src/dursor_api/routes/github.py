@@ -6,6 +6,7 @@ from dursor_api.dependencies import get_github_service
 from dursor_api.domain.models import (
     GitHubAppConfig,
     GitHubAppConfigSave,
+    GitHubRateLimit,
     GitHubRepository,
 )
 from dursor_api.services.github_service import GitHubService
@@ -59,3 +60,11 @@ async def list_branches(
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list branches: {str(e)}")
+
+
+@router.get("/rate-limit", response_model=list[GitHubRateLimit])
+async def get_rate_limits(
+    github_service: GitHubService = Depends(get_github_service),
+) -> list[GitHubRateLimit]:
+    """Get GitHub API rate limits as of the latest API responses."""
+    return github_service.rate_limits()
@@ -3,7 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 
 from dursor_api.dependencies import get_kanban_service
-from dursor_api.domain.models import PR, KanbanBoard, Task
+from dursor_api.domain.models import PR, KanbanBoard, PRStatusSyncResult, Task
 from dursor_api.services.kanban_service import KanbanService
 
 router = APIRouter(prefix="/kanban", tags=["kanban"])
@@ -77,3 +77,15 @@ async def sync_pr_status(
         return await kanban_service.sync_pr_status(task_id, pr_id)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/prs/sync-status", response_model=PRStatusSyncResult)
+async def sync_open_pr_statuses(
+    repo_id: str | None = None,
+    kanban_service: KanbanService = Depends(get_kanban_service),
+) -> PRStatusSyncResult:
+    """Sync the status of all open PRs (optionally of one repository) from GitHub."""
+    try:
+        return await kanban_service.sync_open_pr_statuses(repo_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -8,7 +8,17 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 from dursor_api.dependencies import get_output_manager, get_run_service
-from dursor_api.domain.models import Run, RunCreate, RunsCreated
+from dursor_api.domain.enums import ExecutorType, RunStatus
+from dursor_api.domain.models import (
+    Run,
+    RunCreate,
+    RunFile,
+    RunFilePatch,
+    RunsCreated,
+    RunSearchResult,
+    SparseCheckoutState,
+    SparseCheckoutUpdate,
+)
 from dursor_api.services.output_manager import OutputManager
 from dursor_api.services.run_service import RunService
 
@@ -40,6 +50,29 @@ async def list_runs(
     return await run_service.list(task_id)
 
 
+@router.get("/runs/search", response_model=list[RunSearchResult])
+async def search_runs(
+    q: str = Query(
+        ..., min_length=1, description="Search text (terms are ANDed, term* for prefix)"
+    ),
+    repo_id: str | None = Query(None, description="Filter by repository"),
+    task_id: str | None = Query(None, description="Filter by task"),
+    executor_type: ExecutorType | None = Query(None, description="Filter by executor type"),
+    status: RunStatus | None = Query(None, description="Filter by run status"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of results"),
+    run_service: RunService = Depends(get_run_service),
+) -> list[RunSearchResult]:
+    """Search runs by instruction, summary, error, logs and changed file paths."""
+    return await run_service.search(
+        q,
+        repo_id=repo_id,
+        task_id=task_id,
+        executor_type=executor_type,
+        status=status,
+        limit=limit,
+    )
+
+
 @router.get("/runs/{run_id}", response_model=Run)
 async def get_run(
     run_id: str,
@@ -52,6 +85,33 @@ async def get_run(
     return run
 
 
+@router.get("/runs/{run_id}/files", response_model=list[RunFile])
+async def list_run_files(
+    run_id: str,
+    run_service: RunService = Depends(get_run_service),
+) -> list[RunFile]:
+    """List changed files of a run with stats only (no patch text)."""
+    files = await run_service.list_files(run_id)
+    if files is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return files
+
+
+@router.get("/runs/{run_id}/files/{path:path}/diff", response_model=RunFilePatch)
+async def get_run_file_diff(
+    run_id: str,
+    path: str,
+    hunk_start: int = Query(0, ge=0, description="Index of the first hunk to return"),
+    hunk_limit: int | None = Query(None, ge=1, description="Maximum number of hunks"),
+    run_service: RunService = Depends(get_run_service),
+) -> RunFilePatch:
+    """Get one file's diff from a run, optionally limited to a range of hunks."""
+    file_patch = await run_service.get_file_patch(run_id, path, hunk_start, hunk_limit)
+    if file_patch is None:
+        raise HTTPException(status_code=404, detail="File not found in run")
+    return file_patch
+
+
 @router.post("/runs/{run_id}/cancel", status_code=204)
 async def cancel_run(
     run_id: str,
@@ -63,6 +123,22 @@ async def cancel_run(
         raise HTTPException(status_code=400, detail="Run cannot be cancelled")
 
 
+@router.post("/runs/{run_id}/sparse-checkout", response_model=SparseCheckoutState)
+async def expand_sparse_checkout(
+    run_id: str,
+    data: SparseCheckoutUpdate,
+    run_service: RunService = Depends(get_run_service),
+) -> SparseCheckoutState:
+    """Widen a run's sparse worktree, or check out the full tree if no paths are given."""
+    try:
+        sparse_dirs = await run_service.expand_sparse_checkout(run_id, data.paths)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to update sparse checkout: {e}")
+    return SparseCheckoutState(sparse_dirs=sparse_dirs)
+
+
 @router.delete("/runs/{run_id}/worktree", status_code=204)
 async def cleanup_worktree(
     run_id: str,
@@ -82,28 +158,29 @@ async def cleanup_worktree(
 async def get_run_logs(
     run_id: str,
     from_line: int = Query(0, ge=0, description="Line number to start from (0-based)"),
+    limit: int | None = Query(None, ge=1, description="Maximum number of lines to return"),
     run_service: RunService = Depends(get_run_service),
     output_manager: OutputManager = Depends(get_output_manager),
 ) -> dict[str, object]:
     """Get run logs (for polling).
 
-    Returns logs from OutputManager if the run is in progress,
-    or from the Run record if completed.
+    Returns logs from the OutputManager's durable log store when the run has
+    streamed output (in progress or completed), or from the Run record otherwise.
 
     Returns:
-        Object with logs array, is_complete flag, and total line count.
+        Object with logs array, is_complete flag, total line count, and the
+        source of the lines ("output" for streamed output, "run" for run.logs).
     """
     # Verify run exists
     run = await run_service.get(run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
 
-    # Get logs from OutputManager (for in-progress runs)
-    output_logs = await output_manager.get_history(run_id, from_line)
-    is_complete = await output_manager.is_complete(run_id)
-
-    # If we have output logs, use them
-    if output_logs:
+    # Get logs from OutputManager (memory tail or on-disk segments)
+    if await output_manager.has_stream(run_id):
+        output_logs = await output_manager.get_history(run_id, from_line, limit)
+        is_complete = await output_manager.is_complete(run_id)
+        has_more = limit is not None and len(output_logs) == limit
         return {
             "logs": [
                 {
@@ -113,21 +190,27 @@ async def get_run_logs(
                 }
                 for ol in output_logs
             ],
-            "is_complete": is_complete or run.status in ("succeeded", "failed", "canceled"),
+            "is_complete": not has_more
+            and (is_complete or run.status in ("succeeded", "failed", "canceled")),
             "total_lines": from_line + len(output_logs),
             "run_status": run.status,
+            "source": "output",
         }
 
-    # Fallback to run.logs (for completed runs or when OutputManager has no data)
+    # Fallback to run.logs (PatchAgent runs or runs recorded before the log store)
     run_logs = run.logs[from_line:] if run.logs else []
+    has_more = limit is not None and len(run_logs) > limit
+    if limit is not None:
+        run_logs = run_logs[:limit]
     return {
         "logs": [
             {"line_number": from_line + i, "content": log, "timestamp": 0}
             for i, log in enumerate(run_logs)
         ],
-        "is_complete": run.status in ("succeeded", "failed", "canceled"),
-        "total_lines": len(run.logs) if run.logs else 0,
+        "is_complete": not has_more and run.status in ("succeeded", "failed", "canceled"),
+        "total_lines": from_line + len(run_logs),
         "run_status": run.status,
+        "source": "run",
     }
 
 
@@ -0,0 +1,139 @@
+"""Multiplexed log streaming over a single WebSocket."""
+
+import asyncio
+import contextlib
+import json
+import logging
+from typing import Any
+
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+
+from dursor_api.dependencies import get_output_manager, get_run_service
+from dursor_api.services.output_manager import OutputManager
+from dursor_api.services.run_service import RunService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/streams", tags=["streams"])
+
+# Stream kinds a client may subscribe to. Runs are checked against the DB;
+# breakdown sessions only exist in the output manager.
+STREAM_KINDS = ("run", "breakdown")
+
+# Maximum number of concurrent subscriptions per connection
+MAX_SUBSCRIPTIONS = 50
+
+
+@router.websocket("/logs")
+async def multiplex_logs(
+    websocket: WebSocket,
+    run_service: RunService = Depends(get_run_service),
+    output_manager: OutputManager = Depends(get_output_manager),
+) -> None:
+    """Stream output for many runs and breakdowns over one WebSocket.
+
+    Client messages:
+    - {"type": "subscribe", "stream_id": str, "kind": "run" | "breakdown",
+      "from_line": int}
+    - {"type": "unsubscribe", "stream_id": str}
+
+    Server messages:
+    - {"type": "line", "stream_id": str, "line_number": int, "content": str,
+      "timestamp": float}
+    - {"type": "complete", "stream_id": str}
+    - {"type": "error", "stream_id": str | None, "detail": str}
+
+    Each subscription is served by OutputManager.subscribe, so history
+    replay and live delivery behave exactly like the SSE endpoint.
+    """
+    await websocket.accept()
+    send_lock = asyncio.Lock()
+    subscriptions: dict[str, asyncio.Task[None]] = {}
+
+    async def send(message: dict[str, Any]) -> None:
+        async with send_lock:
+            await websocket.send_json(message)
+
+    async def forward(stream_id: str, from_line: int) -> None:
+        try:
+            async for output_line in output_manager.subscribe(stream_id, from_line):
+                await send(
+                    {
+                        "type": "line",
+                        "stream_id": stream_id,
+                        "line_number": output_line.line_number,
+                        "content": output_line.content,
+                        "timestamp": output_line.timestamp,
+                    }
+                )
+            await send({"type": "complete", "stream_id": stream_id})
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"WebSocket stream error for {stream_id}: {e}")
+            with contextlib.suppress(Exception):
+                await send({"type": "error", "stream_id": stream_id, "detail": str(e)})
+        finally:
+            if subscriptions.get(stream_id) is asyncio.current_task():
+                del subscriptions[stream_id]
+
+    async def handle(message: dict[str, Any]) -> None:
+        msg_type = message.get("type")
+        stream_id = message.get("stream_id")
+        if not isinstance(stream_id, str) or not stream_id:
+            await send({"type": "error", "stream_id": None, "detail": "stream_id is required"})
+            return
+
+        if msg_type == "unsubscribe":
+            task = subscriptions.pop(stream_id, None)
+            if task:
+                task.cancel()
+            return
+
+        if msg_type != "subscribe":
+            await send(
+                {"type": "error", "stream_id": stream_id, "detail": f"Unknown type: {msg_type}"}
+            )
+            return
+
+        kind = message.get("kind", "run")
+        from_line = message.get("from_line", 0)
+        if kind not in STREAM_KINDS:
+            detail = f"Unknown kind: {kind}"
+        elif not isinstance(from_line, int) or from_line < 0:
+            detail = "from_line must be a non-negative integer"
+        elif stream_id not in subscriptions and len(subscriptions) >= MAX_SUBSCRIPTIONS:
+            detail = f"Too many subscriptions (max {MAX_SUBSCRIPTIONS})"
+        elif kind == "run" and not await run_service.get(stream_id):
+            detail = "Run not found"
+        else:
+            # Re-subscribing restarts the stream from the requested line.
+            previous = subscriptions.pop(stream_id, None)
+            if previous:
+                previous.cancel()
+            subscriptions[stream_id] = asyncio.create_task(forward(stream_id, from_line))
+            return
+        await send({"type": "error", "stream_id": stream_id, "detail": detail})
+
+    logger.info("WebSocket log multiplexer connected")
+    try:
+        while True:
+            raw = await websocket.receive_text()
+            try:
+                message = json.loads(raw)
+            except json.JSONDecodeError:
+                await send({"type": "error", "stream_id": None, "detail": "Invalid JSON"})
+                continue
+            if not isinstance(message, dict):
+                await send({"type": "error", "stream_id": None, "detail": "Invalid message"})
+                continue
+            await handle(message)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        tasks = list(subscriptions.values())
+        subscriptions.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info(f"WebSocket log multiplexer closed ({len(tasks)} active subscriptions)")
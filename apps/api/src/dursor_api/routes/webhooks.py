@@ -0,0 +1,45 @@
+"""Webhook API routes."""
+
+import json
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+
+from dursor_api.config import settings
+from dursor_api.dependencies import get_github_webhook_service
+from dursor_api.domain.models import GitHubWebhookResult
+from dursor_api.services.github_webhook import GitHubWebhookService, verify_signature
+
+router = APIRouter(prefix="/webhooks", tags=["webhooks"])
+
+
+@router.post("/github", response_model=GitHubWebhookResult)
+async def github_webhook(
+    request: Request,
+    x_github_event: str = Header(...),
+    x_github_delivery: str = Header(...),
+    x_hub_signature_256: str | None = Header(default=None),
+    webhook_service: GitHubWebhookService = Depends(get_github_webhook_service),
+) -> GitHubWebhookResult:
+    """Ingest a GitHub webhook delivery (pull_request and push events).
+
+    The webhook must use the JSON content type and the secret configured as
+    DURSOR_GITHUB_WEBHOOK_SECRET.
+    """
+    if not settings.github_webhook_secret:
+        raise HTTPException(status_code=503, detail="GitHub webhook secret is not configured")
+
+    body = await request.body()
+    if not verify_signature(settings.github_webhook_secret, body, x_hub_signature_256):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Payload is not JSON")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Payload is not a JSON object")
+
+    try:
+        return await webhook_service.handle(x_github_event, x_github_delivery, payload)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
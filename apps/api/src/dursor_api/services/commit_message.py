@@ -10,8 +10,8 @@ from __future__ import annotations
 
 import re
 
-from dursor_api.agents.llm_router import LLMConfig, LLMRouter
-from dursor_api.domain.enums import Provider
+from dursor_api.agents.llm_router import LLMRouter
+from dursor_api.services.text_generation import generate_text
 
 _CJK_RE = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uff66-\uff9f]")
 
@@ -85,25 +85,18 @@ async def ensure_english_commit_message(
         ]
     ).strip()
 
-    try:
-        config = LLMConfig(
-            provider=Provider.ANTHROPIC,
-            model_name="claude-3-haiku-20240307",
-            api_key="",  # Loaded from environment
-        )
-        llm_client = router.get_client(config)
-        rewritten = await llm_client.generate(
-            messages=[{"role": "user", "content": prompt}],
-            system=(
-                "You rewrite git commit messages into clear, idiomatic English. "
-                "Output only the commit message text."
-            ),
-        )
+    rewritten = await generate_text(
+        prompt,
+        llm_router=router,
+        system=(
+            "You rewrite git commit messages into clear, idiomatic English. "
+            "Output only the commit message text."
+        ),
+    )
+    if rewritten:
         rewritten = _normalize_commit_message(rewritten)
         if not contains_cjk(rewritten):
             return rewritten
-    except Exception:
-        pass
 
     # Last resort: safe English fallback
     return "Update changes"
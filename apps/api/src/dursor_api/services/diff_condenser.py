@@ -0,0 +1,189 @@
+"""Condense large diffs for LLM prompts.
+
+Cutting a diff at a fixed number of characters shows the model the first few
+files and nothing else. ``condense_diff`` keeps every file visible instead:
+
+1. A summary line per file: change type, path, added/removed lines, hunk
+   count and the symbols the change touches (taken from hunk headers and
+   from definitions on changed lines).
+2. The remaining budget is filled with the most significant hunks, ranked by
+   the number of changed lines and by how many words of the run instruction
+   they mention. Lock files and other generated files rank last. Selected
+   hunks are emitted in diff order under their file headers.
+
+Diffs that already fit the budget are returned unchanged.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from dursor_api.domain.enums import FileChangeType
+from dursor_api.domain.models import FileDiff
+from dursor_api.services.diff_parser import iter_file_diffs, split_hunks
+
+_CHANGE_LETTER = {
+    FileChangeType.ADDED: "A",
+    FileChangeType.DELETED: "D",
+    FileChangeType.RENAMED: "R",
+    FileChangeType.COPIED: "C",
+    FileChangeType.MODIFIED: "M",
+}
+
+# Definitions on changed lines: Python, JS/TS, Go, Rust, Java/C#-style types, ...
+_DEFINITION_RE = re.compile(
+    r"^[+-]\s*(?:export\s+)?(?:default\s+)?(?:pub(?:\(\w+\))?\s+)?(?:async\s+)?"
+    r"(?:def|class|function|func|fn|interface|struct|enum|trait|type)\s+"
+    r"(?:\([^)]*\)\s*)?([A-Za-z_$][\w$]*)",
+    re.MULTILINE,
+)
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_$][\w$]*")
+_WORD_RE = re.compile(r"[a-z0-9_]{3,}")
+_HUNK_CONTEXT_RE = re.compile(r"^@@ [^@]* @@ ?(.*)$", re.MULTILINE)
+
+_KEYWORDS = {"def", "class", "function", "func", "fn", "async", "export", "public", "static"}
+_STOP_WORDS = {"the", "and", "for", "with", "that", "this", "from", "into", "add", "use"}
+
+# Generated files whose hunks say little about the change
+_LOW_SIGNAL_SUFFIXES = (".lock", "-lock.json", ".min.js", ".min.css", ".snap", ".map")
+_LOW_SIGNAL_NAMES = {"package-lock.json", "yarn.lock", "pnpm-lock.yaml", "uv.lock", "go.sum"}
+
+_MAX_SYMBOLS = 6
+
+
+@dataclass
+class _Hunk:
+    file_index: int
+    position: int
+    text: str
+    score: float
+
+
+def condense_diff(diff: str, budget: int = 10000, instruction: str | None = None) -> str:
+    """Condense a unified diff to about ``budget`` characters.
+
+    Args:
+        diff: Unified diff string.
+        budget: Maximum size of the result in characters.
+        instruction: Run instruction or task title; hunks mentioning its
+            words are preferred.
+
+    Returns:
+        The diff itself if it fits, otherwise a per-file summary followed by
+        the most significant hunks.
+    """
+    if len(diff) <= budget:
+        return diff
+
+    files = list(iter_file_diffs(diff))
+    if not files:
+        return diff[:budget]
+
+    words = _instruction_words(instruction)
+    headers: list[str] = []
+    hunks: list[_Hunk] = []
+    summary_lines: list[str] = []
+    for index, file_diff in enumerate(files):
+        header, file_hunks = split_hunks(file_diff.patch or "")
+        headers.append(header)
+        summary_lines.append(_summarize_file(file_diff, file_hunks))
+        weight = 0.1 if _is_low_signal(file_diff.path) else 1.0
+        path_hits = _relevance(file_diff.path.lower(), words)
+        for position, text in enumerate(file_hunks):
+            changed = text.count("\n+") + text.count("\n-")
+            relevance = path_hits + _relevance(text.lower(), words)
+            hunks.append(_Hunk(index, position, text, weight * changed * (1 + relevance)))
+
+    summary = _fit_summary(summary_lines, budget // 2)
+    remaining = budget - len(summary) - 64  # Room for the hunks section title
+
+    # Greedily take the best hunks that still fit, paying for each file's
+    # header the first time one of its hunks is taken.
+    selected: dict[int, list[_Hunk]] = {}
+    for hunk in sorted(hunks, key=lambda h: h.score, reverse=True):
+        cost = len(hunk.text) + 1
+        if hunk.file_index not in selected:
+            cost += len(headers[hunk.file_index]) + 1
+        if cost > remaining:
+            continue
+        selected.setdefault(hunk.file_index, []).append(hunk)
+        remaining -= cost
+
+    taken = sum(len(file_hunks) for file_hunks in selected.values())
+    parts = [summary, "", f"# Most significant hunks ({taken} of {len(hunks)})"]
+    for index in sorted(selected):
+        parts.append(headers[index])
+        parts.extend(h.text for h in sorted(selected[index], key=lambda h: h.position))
+    return "\n".join(parts)[:budget]
+
+
+def _summarize_file(file_diff: FileDiff, hunks: list[str]) -> str:
+    """Build the summary line for one file."""
+    letter = _CHANGE_LETTER.get(file_diff.change_type, "M")
+    path = file_diff.path
+    if file_diff.old_path:
+        path = f"{file_diff.old_path} -> {path}"
+    if file_diff.is_binary:
+        return f"{letter} {path} (binary)"
+
+    line = f"{letter} {path} (+{file_diff.added_lines} -{file_diff.removed_lines}"
+    line += f", {len(hunks)} hunk{'s' if len(hunks) != 1 else ''})"
+    symbols = _changed_symbols(hunks)
+    if symbols:
+        line += ": " + ", ".join(symbols)
+    return line
+
+
+def _changed_symbols(hunks: list[str]) -> list[str]:
+    """Collect symbols from hunk header contexts and definitions on changed lines."""
+    symbols: list[str] = []
+    for text in hunks:
+        candidates = [m.group(1) for m in _DEFINITION_RE.finditer(text)]
+        for context in _HUNK_CONTEXT_RE.findall(text):
+            name = _context_symbol(context)
+            if name:
+                candidates.append(name)
+        for name in candidates:
+            if name not in symbols:
+                symbols.append(name)
+                if len(symbols) == _MAX_SYMBOLS:
+                    return symbols
+    return symbols
+
+
+def _context_symbol(context: str) -> str | None:
+    """Get the symbol name from a hunk header's function context."""
+    for identifier in _IDENTIFIER_RE.findall(context):
+        if identifier not in _KEYWORDS:
+            return identifier
+    return None
+
+
+def _fit_summary(lines: list[str], budget: int) -> str:
+    """Join summary lines, dropping the tail if they exceed the budget."""
+    title = f"# Changed files ({len(lines)})"
+    size = len(title)
+    kept: list[str] = []
+    for line in lines:
+        if size + len(line) + 1 > budget:
+            kept.append(f"... and {len(lines) - len(kept)} more files")
+            break
+        kept.append(line)
+        size += len(line) + 1
+    return "\n".join([title, *kept])
+
+
+def _instruction_words(instruction: str | None) -> set[str]:
+    """Get distinctive lowercase words of the instruction."""
+    return set(_WORD_RE.findall((instruction or "").lower())) - _STOP_WORDS
+
+
+def _relevance(text: str, words: set[str]) -> int:
+    """Count instruction words mentioned in a text."""
+    return sum(1 for word in words if word in text)
+
+
+def _is_low_signal(path: str) -> bool:
+    name = path.rsplit("/", 1)[-1]
+    return name in _LOW_SIGNAL_NAMES or name.endswith(_LOW_SIGNAL_SUFFIXES)
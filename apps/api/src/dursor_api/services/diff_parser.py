@@ -0,0 +1,260 @@
+"""Unified diff parsing.
+
+One parser shared by RunService, the CLI executors and PatchAgent. It works
+on offsets into the original diff string instead of splitting it into a list
+of lines: file sections are located with ``str.find``, added/removed lines
+are counted with ``str.count`` over the hunk region, and the only copy made
+per file is the slice stored in ``FileDiff.patch``. Only the short header of
+each section is split into lines.
+
+Both ``git diff`` output (``diff --git`` headers, renames, copies, binary
+files, mode changes) and plain ``---``/``+++`` unified diffs (as produced by
+LLMs) are supported.
+
+``parse_raw_numstat`` handles the much smaller ``--raw --numstat -z`` output,
+for callers that only need per-file stats.
+"""
+
+from __future__ import annotations
+
+import codecs
+from collections.abc import Iterator
+
+from dursor_api.domain.enums import FileChangeType
+from dursor_api.domain.models import FileDiff
+
+_GIT_MARKER = "diff --git "
+_DEV_NULL = "/dev/null"
+
+# First letter of a --raw status (e.g. "R087") -> change type
+_RAW_STATUS = {
+    "A": FileChangeType.ADDED,
+    "D": FileChangeType.DELETED,
+    "R": FileChangeType.RENAMED,
+    "C": FileChangeType.COPIED,
+}
+
+
+def iter_file_diffs(diff: str) -> Iterator[FileDiff]:
+    """Lazily parse a unified diff into per-file FileDiff objects.
+
+    Args:
+        diff: Unified diff string.
+
+    Yields:
+        FileDiff objects in diff order.
+    """
+    for start, end in _file_sections(diff):
+        file_diff = _parse_section(diff, start, end)
+        if file_diff is not None:
+            yield file_diff
+
+
+def parse_diff(diff: str) -> list[FileDiff]:
+    """Parse a unified diff into per-file FileDiff objects.
+
+    Args:
+        diff: Unified diff string.
+
+    Returns:
+        List of FileDiff objects.
+    """
+    return list(iter_file_diffs(diff))
+
+
+def parse_raw_numstat(output: str) -> list[FileDiff]:
+    """Parse ``git diff --raw --numstat -z`` output into FileDiff stats.
+
+    The returned FileDiff objects carry paths, change type and line counts
+    but no patch text.
+
+    Args:
+        output: NUL-separated output of git diff/diff-tree with both --raw
+            and --numstat.
+
+    Returns:
+        List of FileDiff objects in git's order.
+    """
+    files: dict[str, FileDiff] = {}
+    tokens = iter(output.split("\0"))
+    for token in tokens:
+        if token.startswith(":"):
+            # :<old mode> <new mode> <old sha> <new sha> <status>\0<path>[\0<new path>]
+            status = token.split(" ")[4]
+            change_type = _RAW_STATUS.get(status[0], FileChangeType.MODIFIED)
+            old_path: str | None = None
+            path = next(tokens)
+            if change_type in (FileChangeType.RENAMED, FileChangeType.COPIED):
+                old_path, path = path, next(tokens)
+            files[path] = FileDiff(path=path, old_path=old_path, change_type=change_type)
+        elif token:
+            # <added>\t<removed>\t<path>, or an empty path followed by \0<old>\0<new>
+            added, removed, path = token.split("\t", 2)
+            if not path:
+                next(tokens)
+                path = next(tokens)
+            file_diff = files.get(path)
+            if file_diff is None:
+                file_diff = files[path] = FileDiff(path=path)
+            if added == "-":
+                file_diff.is_binary = True
+            else:
+                file_diff.added_lines = int(added)
+                file_diff.removed_lines = int(removed)
+    return list(files.values())
+
+
+def split_hunks(patch: str) -> tuple[str, list[str]]:
+    """Split a single file's patch into its header and hunks.
+
+    Args:
+        patch: Patch text for one file.
+
+    Returns:
+        Tuple of (header lines before the first hunk, list of hunk texts).
+    """
+    starts = list(_line_starts(patch, "@@"))
+    if not starts:
+        return patch, []
+    header = patch[: starts[0]].rstrip("\n")
+    ends = starts[1:] + [len(patch) + 1]
+    return header, [patch[start : end - 1] for start, end in zip(starts, ends, strict=True)]
+
+
+def _file_sections(diff: str) -> Iterator[tuple[int, int]]:
+    """Yield ``(start, end)`` offsets of each file's section in the diff."""
+    if diff.startswith(_GIT_MARKER) or ("\n" + _GIT_MARKER) in diff:
+        starts = _line_starts(diff, _GIT_MARKER)
+    else:
+        starts = _plain_file_starts(diff)
+
+    start = next(starts, None)
+    while start is not None:
+        following = next(starts, None)
+        yield start, len(diff) if following is None else following
+        start = following
+
+
+def _line_starts(diff: str, marker: str, pos: int = 0) -> Iterator[int]:
+    """Yield offsets of lines beginning with marker, starting at pos."""
+    if diff.startswith(marker, pos):
+        yield pos
+    needle = "\n" + marker
+    pos = diff.find(needle, pos)
+    while pos != -1:
+        yield pos + 1
+        pos = diff.find(needle, pos + 1)
+
+
+def _plain_file_starts(diff: str) -> Iterator[int]:
+    """Yield offsets of ``--- `` lines directly followed by a ``+++ `` line."""
+    for start in _line_starts(diff, "--- "):
+        newline = diff.find("\n", start)
+        if newline != -1 and diff.startswith("+++ ", newline + 1):
+            yield start
+
+
+def _parse_section(diff: str, start: int, end: int) -> FileDiff | None:
+    """Parse one file section ``diff[start:end]``."""
+    hunks = diff.find("\n@@", start, end)
+    header_end = end if hunks == -1 else hunks + 1
+
+    git_old: str | None = None
+    git_new: str | None = None
+    old_path: str | None = None
+    new_path: str | None = None
+    change_type = FileChangeType.MODIFIED
+    is_binary = False
+
+    for line in diff[start:header_end].split("\n"):
+        if line.startswith(_GIT_MARKER):
+            git_old, git_new = _split_git_paths(line[len(_GIT_MARKER) :])
+        elif line.startswith("--- "):
+            old_path = _parse_path(line[4:], "a/")
+        elif line.startswith("+++ "):
+            new_path = _parse_path(line[4:], "b/")
+        elif line.startswith("new file mode"):
+            change_type = FileChangeType.ADDED
+        elif line.startswith("deleted file mode"):
+            change_type = FileChangeType.DELETED
+        elif line.startswith("rename from "):
+            change_type = FileChangeType.RENAMED
+            old_path = _unquote(line[12:])
+        elif line.startswith("rename to "):
+            new_path = _unquote(line[10:])
+        elif line.startswith("copy from "):
+            change_type = FileChangeType.COPIED
+            old_path = _unquote(line[10:])
+        elif line.startswith("copy to "):
+            new_path = _unquote(line[8:])
+        elif line.startswith("Binary files ") or line == "GIT binary patch":
+            is_binary = True
+
+    if old_path == _DEV_NULL:
+        change_type = FileChangeType.ADDED
+        old_path = None
+    if new_path == _DEV_NULL:
+        change_type = FileChangeType.DELETED
+        new_path = None
+    if is_binary and new_path is None and old_path is None:
+        # "Binary files a/x and /dev/null differ" carries no ---/+++ lines.
+        new_path, old_path = git_new, git_old
+
+    path = new_path or old_path or git_new or git_old
+    if not path:
+        return None
+    if change_type not in (FileChangeType.RENAMED, FileChangeType.COPIED):
+        old_path = None
+
+    added = removed = 0
+    if hunks != -1:
+        added = diff.count("\n+", hunks, end)
+        removed = diff.count("\n-", hunks, end)
+
+    patch_end = end - 1 if end > start and diff[end - 1] == "\n" else end
+    return FileDiff(
+        path=path,
+        old_path=old_path,
+        change_type=change_type,
+        is_binary=is_binary,
+        added_lines=added,
+        removed_lines=removed,
+        patch=diff[start:patch_end],
+    )
+
+
+def _parse_path(raw: str, prefix: str) -> str:
+    """Parse the path from a ``---``/``+++`` line, dropping the a/ or b/ prefix."""
+    # Plain diffs may append a tab and a timestamp after the path.
+    path = _unquote(raw.split("\t", 1)[0].strip())
+    if path.startswith(prefix):
+        return path[len(prefix) :]
+    return path
+
+
+def _split_git_paths(raw: str) -> tuple[str | None, str | None]:
+    """Split the ``a/<old> b/<new>`` part of a ``diff --git`` line."""
+    if raw.startswith('"'):
+        end = raw.find('" ', 1)
+        if end == -1:
+            return None, None
+        old, new = raw[: end + 1], raw[end + 2 :]
+    else:
+        # Unquoted paths may contain spaces; both sides are usually identical.
+        split = raw.rfind(" b/")
+        if split == -1:
+            return None, None
+        old, new = raw[:split], raw[split + 1 :]
+    old, new = _unquote(old), _unquote(new)
+    return old[2:] if old.startswith("a/") else old, new[2:] if new.startswith("b/") else new
+
+
+def _unquote(path: str) -> str:
+    """Decode a C-style quoted path as emitted by git for unusual file names."""
+    if len(path) < 2 or not (path.startswith('"') and path.endswith('"')):
+        return path
+    try:
+        escaped = codecs.escape_decode(path[1:-1].encode("utf-8"))[0]
+        return escaped.decode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        return path[1:-1]
@@ -0,0 +1,206 @@
+"""Local bare mirror cache shared by all workspaces of the same remote.
+
+Each remote URL gets one bare repository under ``<workspaces_dir>/mirrors``.
+Workspaces are cloned with ``--reference-if-able`` pointing at the mirror, so
+their object store borrows the mirror's objects through
+``objects/info/alternates``; run worktrees share their workspace's object
+store and therefore the mirror as well. Re-cloning a repository that is
+already mirrored transfers almost nothing, and the objects are stored once.
+
+Fetching is done into the mirror: one refresh serves every workspace and
+worktree of the remote, and refreshes within ``refresh_interval`` seconds of
+each other are collapsed. The last refresh time is the mtime of the mirror's
+``FETCH_HEAD``, so it is shared across service instances.
+
+Mirrors are blobless promisor repositories (``--filter=blob:none``), like
+the workspaces that borrow from them: they hold commits and trees, and blobs
+are downloaded by each workspace on demand. Full-clone workspaces need every
+blob locally, so they neither borrow from nor fetch through a mirror.
+
+Workspaces depend on the mirror's objects, so the mirror never prunes
+unreachable objects (``gc.auto=0``, ``gc.pruneExpire=never``).
+"""
+
+from __future__ import annotations
+
+import builtins
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+import git
+
+from dursor_api.services.git_clone import BLOBLESS_FILTER, auth_options
+
+logger = logging.getLogger(__name__)
+
+# Refspecs fetched into mirrors (branches and tags, no pull request refs)
+MIRROR_REFSPECS = ("+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*")
+
+# One lock per mirror path, shared by all GitMirrorCache instances
+_locks: dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(path: Path) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(os.fspath(path), threading.Lock())
+
+
+def normalize_remote_url(url: str) -> str:
+    """Normalize a remote URL so that equivalent URLs share a mirror.
+
+    Credentials, a trailing slash and a trailing ``.git`` are dropped and
+    the host is lowercased.
+
+    Args:
+        url: Remote URL (may contain credentials).
+
+    Returns:
+        Normalized URL without credentials.
+    """
+    url = url.strip().rstrip("/")
+    url = url.removesuffix(".git")
+    parts = urlsplit(url)
+    if parts.scheme and parts.hostname:
+        netloc = parts.hostname.lower()
+        if parts.port:
+            netloc += f":{parts.port}"
+        url = urlunsplit((parts.scheme.lower(), netloc, parts.path, "", ""))
+    return url
+
+
+class GitMirrorCache:
+    """Bare mirror repositories keyed by remote URL."""
+
+    def __init__(self, mirrors_dir: Path, refresh_interval: float = 30.0):
+        """Initialize GitMirrorCache.
+
+        Args:
+            mirrors_dir: Directory holding the bare mirrors.
+            refresh_interval: Refreshes within this many seconds of the last
+                fetch are skipped.
+        """
+        self.mirrors_dir = mirrors_dir
+        self.refresh_interval = refresh_interval
+
+    def path_for(self, repo_url: str) -> Path:
+        """Get the mirror path for a remote URL (whether or not it exists).
+
+        Args:
+            repo_url: Remote URL.
+
+        Returns:
+            Path of the bare mirror repository.
+        """
+        normalized = normalize_remote_url(repo_url)
+        digest = hashlib.sha256(normalized.encode()).hexdigest()[:16]
+        name = normalized.rsplit("/", 1)[-1] or "repo"
+        return self.mirrors_dir / f"{name}-{digest}.git"
+
+    def list(self) -> builtins.list[Path]:
+        """List existing mirrors.
+
+        Returns:
+            Paths of the bare mirror repositories.
+        """
+        if not self.mirrors_dir.exists():
+            return []
+        return sorted(p for p in self.mirrors_dir.glob("*.git") if (p / "HEAD").exists())
+
+    def ensure(self, repo_url: str, fetch_url: str | None = None) -> Path | None:
+        """Create the mirror for a remote if needed and bring it up to date.
+
+        Best effort: failures are logged and None is returned, in which case
+        callers clone without a reference.
+
+        Args:
+            repo_url: Remote URL identifying the mirror.
+            fetch_url: URL to fetch from, e.g. with credentials (defaults to
+                repo_url). It is passed to each fetch and never stored in the
+                mirror's config; its credentials are passed through the
+                environment of the git process.
+
+        Returns:
+            Path to the mirror, or None if it could not be created or fetched.
+        """
+        path = self.path_for(repo_url)
+        with _lock_for(path):
+            try:
+                if not (path / "HEAD").exists():
+                    self._create(path)
+                self._fetch(path, fetch_url or repo_url, force=False)
+            except git.GitCommandError as e:
+                logger.warning(f"Mirror fetch failed for {path.name}: {e}")
+                return None
+            except OSError as e:
+                logger.warning(f"Mirror cache unavailable for {path.name}: {e}")
+                return None
+        return path
+
+    def refresh(self, repo_url: str, fetch_url: str | None = None, force: bool = False) -> bool:
+        """Fetch an existing mirror, unless it was fetched very recently.
+
+        Args:
+            repo_url: Remote URL identifying the mirror.
+            fetch_url: URL to fetch from (defaults to repo_url).
+            force: Fetch even within refresh_interval of the last fetch.
+
+        Returns:
+            True if a fetch ran, False if the mirror does not exist, was
+            fresh enough, or the fetch failed.
+        """
+        path = self.path_for(repo_url)
+        if not (path / "HEAD").exists():
+            return False
+        with _lock_for(path):
+            try:
+                return self._fetch(path, fetch_url or repo_url, force=force)
+            except git.GitCommandError as e:
+                logger.warning(f"Mirror refresh failed for {path.name}: {e}")
+                return False
+
+    def _create(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        repo = git.Repo.init(path, bare=True)
+        with repo, repo.config_writer("repository") as writer:
+            # Workspaces borrow objects from the mirror; never prune them.
+            writer.set_value("gc", "auto", "0")
+            writer.set_value("gc", "pruneExpire", "never")
+            writer.set_value("core", "commitGraph", "true")
+            writer.set_value("fetch", "writeCommitGraph", "true")
+            # Blobless promisor remote. No URL is stored: each fetch passes
+            # it, as it may carry credentials.
+            writer.set_value('remote "origin"', "promisor", "true")
+            writer.set_value('remote "origin"', "partialclonefilter", BLOBLESS_FILTER)
+            # Workspaces fetch from the mirror with the same filter.
+            writer.set_value("uploadpack", "allowFilter", "true")
+
+    def _fetch(self, path: Path, fetch_url: str, force: bool) -> bool:
+        fetch_head = path / "FETCH_HEAD"
+        if not force and fetch_head.exists():
+            if time.time() - fetch_head.stat().st_mtime < self.refresh_interval:
+                return False
+        options, env = auth_options(fetch_url, "remote.origin.url")
+        with git.Repo(path) as repo:
+            # Fetching a URL with a filter would record it as a promisor remote
+            repo.git.execute(
+                [
+                    "git",
+                    *options,
+                    "fetch",
+                    f"--filter={BLOBLESS_FILTER}",
+                    "--prune",
+                    "--no-tags",
+                    "origin",
+                    *MIRROR_REFSPECS,
+                ],
+                env=env,
+            )
+        # Touch even when nothing changed so the interval applies.
+        fetch_head.touch()
+        return True
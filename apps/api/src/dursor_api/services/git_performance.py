@@ -0,0 +1,118 @@
+"""Git performance profile for repositories managed by dursor.
+
+Workspaces cloned by RepoService serve every run's worktree, so the hot-path
+commands (``git add -A``, ``git status``, ``merge-base --is-ancestor``) run
+against them over and over. This module applies config that keeps those
+commands fast on large repositories and runs periodic ``git maintenance``.
+
+Worktrees share their main repository's config, so applying the profile to
+the workspace covers all of its run worktrees.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import subprocess
+from pathlib import Path
+
+import git
+
+logger = logging.getLogger(__name__)
+
+# Bump when PROFILE_CONFIG changes so existing workspaces are updated.
+PROFILE_VERSION = 1
+
+PROFILE_CONFIG: dict[tuple[str, str], str] = {
+    # Pin index v2: GitPython (index.commit/index.diff) cannot read the v4
+    # index that feature.manyFiles would select for new worktrees.
+    ("index", "version"): "2",
+    ("core", "untrackedCache"): "true",
+    # Commit-graph speeds up merge-base, ancestry checks and log walks
+    ("core", "commitGraph"): "true",
+    ("fetch", "writeCommitGraph"): "true",
+    ("gc", "writeCommitGraph"): "true",
+}
+
+# Tasks run by run_maintenance (all work offline)
+MAINTENANCE_TASKS = ("commit-graph", "loose-objects", "incremental-repack")
+
+
+@functools.cache
+def fsmonitor_supported() -> bool:
+    """Check whether this git build has a builtin fsmonitor daemon for this platform."""
+    try:
+        result = subprocess.run(
+            ["git", "fsmonitor--daemon", "status"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    output = result.stdout + result.stderr
+    # Unsupported platforms and older gits report an error instead of a status.
+    return "not supported" not in output and "is not a git command" not in output
+
+
+def apply_performance_profile(repo: git.Repo, force: bool = False) -> bool:
+    """Apply the performance profile to a managed repository.
+
+    The applied version is recorded in the repository config so repeated
+    calls are cheap.
+
+    Args:
+        repo: Repository (main workspace, not a worktree).
+        force: Re-apply even if the current version is recorded.
+
+    Returns:
+        True if the profile was (re)applied, False if already up to date.
+    """
+    reader = repo.config_reader("repository")
+    try:
+        applied = reader.get_value("dursor", "performanceProfile", 0)
+    finally:
+        reader.release()
+    if not force and applied == PROFILE_VERSION:
+        return False
+
+    with repo.config_writer("repository") as writer:
+        for (section, option), value in PROFILE_CONFIG.items():
+            writer.set_value(section, option, value)
+        if fsmonitor_supported():
+            writer.set_value("core", "fsmonitor", "true")
+        writer.set_value("dursor", "performanceProfile", PROFILE_VERSION)
+
+    # Build the initial commit-graph and multi-pack-index right away.
+    try:
+        repo.git.commit_graph("write", "--reachable", "--changed-paths")
+        if _has_packs(repo):
+            repo.git.multi_pack_index("write")
+    except git.GitCommandError as e:
+        logger.warning(f"Initial commit-graph/multi-pack-index write failed: {e}")
+
+    logger.info(f"Applied git performance profile v{PROFILE_VERSION} to {repo.working_dir}")
+    return True
+
+
+def run_maintenance(repo: git.Repo) -> None:
+    """Run offline maintenance tasks (commit-graph, loose objects, repack).
+
+    Args:
+        repo: Repository (main workspace, not a worktree).
+
+    Raises:
+        git.GitCommandError: If git maintenance fails.
+    """
+    tasks = [
+        f"--task={task}"
+        for task in MAINTENANCE_TASKS
+        # incremental-repack fails when there are no packs to index yet
+        if task != "incremental-repack" or _has_packs(repo)
+    ]
+    repo.git.maintenance("run", "--quiet", *tasks)
+
+
+def _has_packs(repo: git.Repo) -> bool:
+    """Check whether the repository has any pack files."""
+    return any((Path(repo.common_dir) / "objects" / "pack").glob("*.pack"))
@@ -0,0 +1,89 @@
+"""Reuse of GitPython Repo objects across GitService calls.
+
+Opening ``git.Repo`` walks the filesystem to discover the repository, and
+every fresh Repo object starts its own ``git cat-file --batch`` and
+``git cat-file --batch-check`` processes the first time it reads an object.
+Keeping Repo objects around means those long-lived processes serve all
+subsequent object lookups (HEAD, refs, commits) for that repository without
+spawning anything.
+
+Repo objects and their cat-file pipes are not thread-safe. GitService runs
+blocking git work in the default thread pool, so each worker thread keeps
+its own small LRU of Repo objects; the pool's fixed size bounds the number
+of live processes.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import git
+
+logger = logging.getLogger(__name__)
+
+
+class GitRepoCache:
+    """Per-thread LRU cache of ``git.Repo`` objects keyed by path."""
+
+    def __init__(self, max_repos_per_thread: int = 16):
+        """Initialize GitRepoCache.
+
+        Args:
+            max_repos_per_thread: Repo objects kept open per worker thread.
+        """
+        self.max_repos_per_thread = max_repos_per_thread
+        self._local = threading.local()
+
+    def _cache(self) -> OrderedDict[str, git.Repo]:
+        cache: OrderedDict[str, git.Repo] | None = getattr(self._local, "repos", None)
+        if cache is None:
+            cache = OrderedDict()
+            self._local.repos = cache
+        return cache
+
+    def get(self, path: Path | str) -> git.Repo:
+        """Get a Repo object for path, reusing this thread's cached one.
+
+        Args:
+            path: Repository or worktree path.
+
+        Returns:
+            git.Repo for the path.
+
+        Raises:
+            git.InvalidGitRepositoryError: If path is not a git repository.
+            git.NoSuchPathError: If path does not exist.
+        """
+        key = os.fspath(path)
+        cache = self._cache()
+        repo = cache.get(key)
+        if repo is not None:
+            # A removed worktree leaves a Repo pointing at a deleted git dir.
+            if os.path.isdir(repo.git_dir):
+                cache.move_to_end(key)
+                return repo
+            del cache[key]
+            repo.close()
+
+        repo = git.Repo(key)
+        cache[key] = repo
+        while len(cache) > self.max_repos_per_thread:
+            _, evicted = cache.popitem(last=False)
+            evicted.close()
+        return repo
+
+    def evict(self, path: Path | str) -> None:
+        """Close this thread's cached Repo for path, if any.
+
+        Other threads notice removed repositories on their next ``get``.
+
+        Args:
+            path: Repository or worktree path.
+        """
+        repo = self._cache().pop(os.fspath(path), None)
+        if repo is not None:
+            repo.close()
@@ -1,7 +1,11 @@
 """GitHub App service for dursor API."""
 
 import base64
+import logging
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from typing import Any
 
 import httpx
@@ -11,10 +15,28 @@ from dursor_api.config import settings
 from dursor_api.domain.models import (
     GitHubAppConfig,
     GitHubAppConfigSave,
+    GitHubRateLimit,
     GitHubRepository,
 )
 from dursor_api.storage.db import Database
 
+logger = logging.getLogger(__name__)
+
+# PRs per GraphQL query in get_pull_request_statuses (well below node limits)
+PR_STATUS_BATCH_SIZE = 50
+
+# GET responses kept for conditional requests (least recently used are evicted)
+RESPONSE_CACHE_SIZE = 256
+
+
+@dataclass
+class _CachedResponse:
+    """A GET response body with the validators to revalidate it."""
+
+    etag: str | None
+    last_modified: str | None
+    data: Any
+
 
 class GitHubService:
     """Service for GitHub App operations."""
@@ -22,6 +44,8 @@ class GitHubService:
     def __init__(self, db: Database):
         self.db = db
         self._token_cache: dict[str, tuple[str, float]] = {}
+        self._response_cache: OrderedDict[str, _CachedResponse] = OrderedDict()
+        self._rate_limits: dict[str, GitHubRateLimit] = {}
 
     def _mask_value(self, value: str, visible_chars: int = 4) -> str:
         """Mask a value, showing only the last few characters."""
@@ -110,8 +134,9 @@ class GitHubService:
                 (data.app_id, encoded_key, data.installation_id),
             )
 
-        # Clear token cache
+        # Clear token and response caches (the installation may have changed)
         self._token_cache.clear()
+        self._response_cache.clear()
 
         return GitHubAppConfig(
             app_id=data.app_id,
@@ -207,25 +232,87 @@ class GitHubService:
         return token
 
     async def _github_request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
-        """Make authenticated request to GitHub API."""
+        """Make authenticated request to GitHub API.
+
+        GET responses are cached and revalidated with ``If-None-Match`` /
+        ``If-Modified-Since``. A 304 is answered from the cache and does not
+        count against the primary rate limit. Rate limit headers of every
+        response are recorded (see ``rate_limits``).
+        """
         token = await self._get_installation_token()
         if not token:
             raise ValueError("GitHub App not configured")
 
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        url = f"https://api.github.com{endpoint}"
+        cache_key = None
+        cached = None
+        if method == "GET":
+            params = httpx.QueryParams(sorted((kwargs.get("params") or {}).items()))
+            cache_key = f"GET {url}?{params}"
+            cached = self._response_cache.get(cache_key)
+            if cached and cached.etag:
+                headers["If-None-Match"] = cached.etag
+            elif cached and cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
         async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method,
-                f"https://api.github.com{endpoint}",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
-                },
-                **kwargs,
-            )
+            response = await client.request(method, url, headers=headers, **kwargs)
+        self._record_rate_limit(response)
+
+        if cache_key is None:
             response.raise_for_status()
             return response.json()
 
+        if response.status_code == 304 and cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            return cached.data
+
+        response.raise_for_status()
+        data = response.json()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._response_cache[cache_key] = _CachedResponse(etag, last_modified, data)
+            self._response_cache.move_to_end(cache_key)
+            while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        else:
+            self._response_cache.pop(cache_key, None)
+        return data
+
+    def _record_rate_limit(self, response: httpx.Response) -> None:
+        """Record the ``X-RateLimit-*`` headers of a response."""
+        headers = response.headers
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset = int(headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+        resource = headers.get("X-RateLimit-Resource", "core")
+        self._rate_limits[resource] = GitHubRateLimit(
+            resource=resource,
+            limit=limit,
+            remaining=remaining,
+            used=int(headers.get("X-RateLimit-Used") or limit - remaining),
+            reset_at=datetime.fromtimestamp(reset, tz=UTC),
+            updated_at=datetime.now(UTC),
+        )
+        if remaining < limit // 10:
+            logger.warning(
+                f"GitHub {resource} rate limit low: {remaining}/{limit} left "
+                f"until {self._rate_limits[resource].reset_at.isoformat()}"
+            )
+
+    def rate_limits(self) -> list[GitHubRateLimit]:
+        """Get the latest known rate limit of each GitHub API resource."""
+        return sorted(self._rate_limits.values(), key=lambda r: r.resource)
+
     async def list_repos(self) -> list[GitHubRepository]:
         """List repositories accessible to the GitHub App."""
         data = await self._github_request(
@@ -410,3 +497,56 @@ class GitHubService:
             "merged": pr_data.get("merged", False),
             "merged_at": pr_data.get("merged_at"),
         }
+
+    async def get_pull_request_statuses(
+        self,
+        owner: str,
+        repo: str,
+        pr_numbers: list[int],
+    ) -> dict[int, dict]:
+        """Get the status of many PRs with batched GraphQL queries.
+
+        One request is made per PR_STATUS_BATCH_SIZE PRs, each PR being an
+        aliased ``pullRequest`` field of the repository.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            pr_numbers: PR numbers.
+
+        Returns:
+            Dict mapping PR number to the same shape as
+            get_pull_request_status. PRs that were not found are omitted.
+        """
+        statuses: dict[int, dict] = {}
+        numbers = sorted(set(pr_numbers))
+        for start in range(0, len(numbers), PR_STATUS_BATCH_SIZE):
+            chunk = numbers[start : start + PR_STATUS_BATCH_SIZE]
+            fields = " ".join(
+                f"pr{number}: pullRequest(number: {number}) {{ number state merged mergedAt }}"
+                for number in chunk
+            )
+            query = (
+                "query($owner: String!, $name: String!) { "
+                f"repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            )
+            result = await self._github_request(
+                "POST",
+                "/graphql",
+                json={"query": query, "variables": {"owner": owner, "name": repo}},
+            )
+            repository = (result.get("data") or {}).get("repository")
+            if repository is None:
+                errors = result.get("errors") or []
+                message = errors[0].get("message") if errors else "no data"
+                raise ValueError(f"GitHub GraphQL query failed for {owner}/{repo}: {message}")
+
+            for pr_data in repository.values():
+                if not pr_data:
+                    continue  # Not found (reported in "errors")
+                statuses[pr_data["number"]] = {
+                    "state": "open" if pr_data["state"] == "OPEN" else "closed",
+                    "merged": bool(pr_data["merged"]),
+                    "merged_at": pr_data.get("mergedAt"),
+                }
+        return statuses
@@ -0,0 +1,141 @@
+"""GitHub webhook ingestion for PR status and head commits.
+
+Polling GitHub leaves PR records stale for up to a sync interval. With a
+webhook pointed at ``/v1/webhooks/github``, ``pull_request`` and ``push``
+events update the matching ``prs`` rows as soon as GitHub delivers them:
+
+- ``pull_request``: the PR is matched by its URL (falling back to its head
+  branch in the same repository); status becomes open/closed/merged and
+  ``latest_commit`` the head SHA.
+- ``push``: PRs of the pushed branch in the same repository get the new
+  head SHA as ``latest_commit``.
+
+Deliveries are authenticated with the ``X-Hub-Signature-256`` HMAC of the
+configured secret and processed at most once per ``X-GitHub-Delivery`` ID,
+so GitHub's redeliveries are no-ops. Polling (``KanbanService``) remains
+the fallback for missed deliveries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from dursor_api.domain.models import PR, GitHubWebhookResult
+from dursor_api.storage.dao import PRDAO, GitHubWebhookDeliveryDAO
+
+logger = logging.getLogger(__name__)
+
+# Delivery IDs are kept this long; GitHub only redelivers recent deliveries.
+DELIVERY_RETENTION = timedelta(days=7)
+
+_NULL_SHA = "0" * 40
+
+
+def verify_signature(secret: str, body: bytes, signature: str | None) -> bool:
+    """Verify the ``X-Hub-Signature-256`` header of a delivery.
+
+    Args:
+        secret: Webhook secret configured on GitHub.
+        body: Raw request body.
+        signature: Header value (``sha256=<hex digest>``).
+
+    Returns:
+        True if the signature matches the body.
+    """
+    if not secret or not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(signature.removeprefix("sha256="), expected)
+
+
+class GitHubWebhookService:
+    """Apply GitHub webhook deliveries to PR records."""
+
+    def __init__(self, pr_dao: PRDAO, delivery_dao: GitHubWebhookDeliveryDAO):
+        self.pr_dao = pr_dao
+        self.delivery_dao = delivery_dao
+
+    async def handle(
+        self, event: str, delivery_id: str, payload: dict[str, Any]
+    ) -> GitHubWebhookResult:
+        """Process a delivery unless it was already processed.
+
+        Args:
+            event: ``X-GitHub-Event`` header value.
+            delivery_id: ``X-GitHub-Delivery`` header value.
+            payload: Decoded JSON payload.
+
+        Returns:
+            GitHubWebhookResult with the number of PR records changed.
+
+        Raises:
+            ValueError: If the payload lacks fields the event requires.
+        """
+        if await self.delivery_dao.exists(delivery_id):
+            return GitHubWebhookResult(event=event, delivery_id=delivery_id, duplicate=True)
+
+        if event == "pull_request":
+            updated = await self._handle_pull_request(payload)
+        elif event == "push":
+            updated = await self._handle_push(payload)
+        else:
+            updated = 0  # ping and events we don't subscribe to
+
+        # Recorded after processing: a delivery that failed is processed again
+        # when GitHub redelivers it. Applying one twice is harmless.
+        await self.delivery_dao.record(delivery_id, event)
+        await self.delivery_dao.delete_older_than(datetime.utcnow() - DELIVERY_RETENTION)
+        if updated:
+            logger.info(f"Webhook {event} ({delivery_id}) updated {updated} PR(s)")
+        return GitHubWebhookResult(event=event, delivery_id=delivery_id, updated=updated)
+
+    async def _handle_pull_request(self, payload: dict[str, Any]) -> int:
+        pull_request = payload.get("pull_request")
+        if not isinstance(pull_request, dict):
+            raise ValueError("pull_request payload without pull_request")
+        try:
+            url = pull_request["html_url"]
+            head = pull_request["head"]
+            branch, head_sha = head["ref"], head["sha"]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Malformed pull_request payload: missing {e}")
+
+        if pull_request.get("merged"):
+            status = "merged"
+        elif pull_request.get("state") == "closed":
+            status = "closed"
+        else:
+            status = "open"
+
+        prs = await self.pr_dao.list_by_url(url)
+        if not prs:
+            prs = await self.pr_dao.list_by_branch(url.rsplit("/", 1)[0] + "/", branch)
+
+        statuses = {pr.id: status for pr in prs if pr.status != status}
+        await self.pr_dao.update_statuses(statuses)
+        commits = await self._update_latest_commit(prs, head_sha)
+        return len(statuses.keys() | commits)
+
+    async def _handle_push(self, payload: dict[str, Any]) -> int:
+        ref = payload.get("ref", "")
+        after = payload.get("after", "")
+        repo_url = (payload.get("repository") or {}).get("html_url")
+        if not ref.startswith("refs/heads/") or not repo_url:
+            return 0  # Tag pushes
+        if payload.get("deleted") or not after or after == _NULL_SHA:
+            return 0
+
+        branch = ref.removeprefix("refs/heads/")
+        prs = await self.pr_dao.list_by_branch(f"{repo_url}/pull/", branch)
+        return len(await self._update_latest_commit(prs, after))
+
+    async def _update_latest_commit(self, prs: list[PR], sha: str) -> set[str]:
+        """Set ``latest_commit`` of PRs, returning the IDs that changed."""
+        changed = {pr.id for pr in prs if pr.latest_commit != sha}
+        for pr_id in changed:
+            await self.pr_dao.update(pr_id, sha)
+        return changed
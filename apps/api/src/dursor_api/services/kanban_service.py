@@ -1,16 +1,22 @@
 """Kanban board service for task status management."""
 
+import asyncio
+import logging
+
 from dursor_api.domain.enums import TaskBaseKanbanStatus, TaskKanbanStatus
 from dursor_api.domain.models import (
     PR,
     KanbanBoard,
     KanbanColumn,
+    PRStatusSyncResult,
     Task,
     TaskWithKanbanStatus,
 )
 from dursor_api.services.github_service import GitHubService
 from dursor_api.storage.dao import PRDAO, RunDAO, TaskDAO
 
+logger = logging.getLogger(__name__)
+
 
 class KanbanService:
     """Kanban status management service.
@@ -183,26 +189,11 @@ class KanbanService:
         if pr.task_id != task_id:
             raise ValueError(f"PR {pr_id} does not belong to task {task_id}")
 
-        # Parse owner/repo from PR URL
-        # URL format: https://github.com/{owner}/{repo}/pull/{number}
-        url_parts = pr.url.split("/")
-        if len(url_parts) < 5:
-            raise ValueError(f"Invalid PR URL format: {pr.url}")
-
-        owner = url_parts[-4]
-        repo = url_parts[-3]
+        owner, repo = _parse_pr_url(pr.url)
 
         # Get PR status from GitHub
         pr_data = await self.github_service.get_pull_request_status(owner, repo, pr.number)
-
-        # Determine status
-        new_status: str
-        if pr_data.get("merged"):
-            new_status = "merged"
-        elif pr_data.get("state") == "closed":
-            new_status = "closed"
-        else:
-            new_status = "open"
+        new_status = _pr_status(pr_data)
 
         # Update local PR status
         await self.pr_dao.update_status(pr_id, new_status)
@@ -211,3 +202,80 @@ class KanbanService:
         if not updated_pr:
             raise ValueError(f"PR not found after update: {pr_id}")
         return updated_pr
+
+    async def sync_open_pr_statuses(self, repo_id: str | None = None) -> PRStatusSyncResult:
+        """Sync the status of all open PRs from GitHub in bulk.
+
+        PRs are grouped by GitHub repository and fetched with batched GraphQL
+        queries; changed statuses are written in one transaction. A repository
+        whose query fails is logged and skipped.
+
+        Args:
+            repo_id: Only sync PRs of this repository's tasks.
+
+        Returns:
+            Number of PRs checked and updated.
+        """
+        by_repo: dict[tuple[str, str], list[PR]] = {}
+        for pr in await self.pr_dao.list_open(repo_id):
+            try:
+                by_repo.setdefault(_parse_pr_url(pr.url), []).append(pr)
+            except ValueError:
+                logger.warning(f"Skipping PR {pr.id} with invalid URL: {pr.url}")
+
+        checked = 0
+        changes: dict[str, str] = {}
+        for (owner, repo), prs in by_repo.items():
+            # One inaccessible or renamed repository must not stall the others.
+            try:
+                statuses = await self.github_service.get_pull_request_statuses(
+                    owner, repo, [pr.number for pr in prs]
+                )
+            except Exception:
+                logger.exception(f"Failed to sync PR statuses of {owner}/{repo}")
+                continue
+            for pr in prs:
+                pr_data = statuses.get(pr.number)
+                if pr_data is None:
+                    continue
+                checked += 1
+                new_status = _pr_status(pr_data)
+                if new_status != pr.status:
+                    changes[pr.id] = new_status
+
+        await self.pr_dao.update_statuses(changes)
+        if changes:
+            logger.info(f"PR status sync updated {len(changes)} of {checked} open PRs")
+        return PRStatusSyncResult(checked=checked, updated=len(changes))
+
+    async def run_pr_sync_loop(self, interval: float) -> None:
+        """Sync open PR statuses periodically until cancelled.
+
+        Intended to be started as a background task from the app lifespan.
+
+        Args:
+            interval: Seconds between syncs.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.sync_open_pr_statuses()
+            except Exception:
+                logger.exception("PR status sync failed")
+
+
+def _parse_pr_url(url: str) -> tuple[str, str]:
+    """Parse (owner, repo) from a PR URL (https://github.com/{owner}/{repo}/pull/{number})."""
+    url_parts = url.split("/")
+    if len(url_parts) < 5:
+        raise ValueError(f"Invalid PR URL format: {url}")
+    return url_parts[-4], url_parts[-3]
+
+
+def _pr_status(pr_data: dict) -> str:
+    """Map GitHub PR state to the local PR status (open/merged/closed)."""
+    if pr_data.get("merged"):
+        return "merged"
+    if pr_data.get("state") == "closed":
+        return "closed"
+    return "open"
@@ -0,0 +1,232 @@
+"""Cross-process transports for live run output.
+
+OutputManager fans out lines to subscribers in its own process through
+asyncio queues. When the API runs with several uvicorn workers, the SSE
+client may be attached to a different process than the one executing the
+run; a LogTransport lets any worker follow any run's stream.
+
+History always comes from the shared on-disk RunLogStore. Transports only
+carry "something new happened" between processes:
+
+- FileTailTransport (default): followers tail the log segments on disk.
+  Needs no extra services, works whenever workers share ``data_dir``.
+- RedisTransport: publishers also push each line over Redis pub/sub, so
+  followers see new lines immediately instead of on the next poll.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from typing import Any
+
+from dursor_api.services.run_log_store import OutputLine, RunLogStore
+
+logger = logging.getLogger(__name__)
+
+# Number of lines read from disk per batch while catching up
+_CATCH_UP_BATCH_SIZE = 500
+
+
+class LogTransport(ABC):
+    """Base class for cross-process output fan-out."""
+
+    def __init__(self, log_store: RunLogStore):
+        """Initialize LogTransport.
+
+        Args:
+            log_store: Shared on-disk log store used for history and catch-up.
+        """
+        self.log_store = log_store
+
+    @abstractmethod
+    async def publish(self, run_id: str, line: OutputLine) -> None:
+        """Announce a line that has already been appended to the log store.
+
+        Args:
+            run_id: The run ID.
+            line: The published line.
+        """
+
+    @abstractmethod
+    async def publish_complete(self, run_id: str) -> None:
+        """Announce that a stream has been marked complete.
+
+        Args:
+            run_id: The run ID.
+        """
+
+    @abstractmethod
+    def follow(self, run_id: str, from_line: int = 0) -> AsyncIterator[OutputLine]:
+        """Follow a stream published by any process until it completes.
+
+        Args:
+            run_id: The run ID.
+            from_line: Line number to start from (0-based).
+
+        Yields:
+            OutputLine objects in order.
+        """
+
+    async def close(self) -> None:
+        """Release transport resources."""
+
+    async def _catch_up(self, run_id: str, position: int) -> list[OutputLine]:
+        """Read the next batch of lines at or after position from disk."""
+        loop = asyncio.get_event_loop()
+        count = await loop.run_in_executor(None, self.log_store.line_count, run_id)
+        if position >= count:
+            return []
+        return await loop.run_in_executor(
+            None,
+            self.log_store.read,
+            run_id,
+            position,
+            min(count, position + _CATCH_UP_BATCH_SIZE),
+        )
+
+
+class FileTailTransport(LogTransport):
+    """Follows streams by polling the shared on-disk log store."""
+
+    def __init__(self, log_store: RunLogStore, poll_interval: float = 0.25):
+        """Initialize FileTailTransport.
+
+        Args:
+            log_store: Shared on-disk log store.
+            poll_interval: Seconds between checks for new lines.
+        """
+        super().__init__(log_store)
+        self.poll_interval = poll_interval
+
+    async def publish(self, run_id: str, line: OutputLine) -> None:
+        """Lines are already on disk; nothing to send."""
+
+    async def publish_complete(self, run_id: str) -> None:
+        """The completion marker is already on disk; nothing to send."""
+
+    async def follow(self, run_id: str, from_line: int = 0) -> AsyncIterator[OutputLine]:
+        """Tail the stream's log segments until the completion marker appears."""
+        position = from_line
+        while True:
+            # Check completion before reading so lines written just before the
+            # marker are never missed.
+            complete = self.log_store.is_complete(run_id)
+            batch = await self._catch_up(run_id, position)
+            for line in batch:
+                yield line
+            if batch:
+                position = batch[-1].line_number + 1
+                continue
+            if complete:
+                return
+            await asyncio.sleep(self.poll_interval)
+
+
+class RedisTransport(LogTransport):
+    """Pushes live lines over Redis pub/sub, with the log store as backstop."""
+
+    def __init__(
+        self,
+        log_store: RunLogStore,
+        url: str,
+        channel_prefix: str = "dursor:logs:",
+        poll_interval: float = 1.0,
+    ):
+        """Initialize RedisTransport.
+
+        Args:
+            log_store: Shared on-disk log store.
+            url: Redis connection URL (any Redis-compatible server).
+            channel_prefix: Prefix for per-run pub/sub channels.
+            poll_interval: Seconds to wait for a message before re-checking disk.
+
+        Raises:
+            RuntimeError: If the redis package is not installed.
+        """
+        super().__init__(log_store)
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError(
+                "The redis output transport requires the 'redis' package "
+                "(install with: uv sync --extra redis)"
+            ) from e
+
+        self._redis: Any = redis_asyncio.from_url(url)
+        self.channel_prefix = channel_prefix
+        self.poll_interval = poll_interval
+
+    def _channel(self, run_id: str) -> str:
+        return f"{self.channel_prefix}{run_id}"
+
+    async def publish(self, run_id: str, line: OutputLine) -> None:
+        """Publish a line to the run's channel."""
+        message = {
+            "line_number": line.line_number,
+            "content": line.content,
+            "timestamp": line.timestamp,
+        }
+        try:
+            await self._redis.publish(self._channel(run_id), json.dumps(message))
+        except Exception as e:
+            # Followers fall back to the log store, so a lost message only adds latency.
+            logger.warning(f"Redis publish failed for run {run_id}: {e}")
+
+    async def publish_complete(self, run_id: str) -> None:
+        """Publish a completion message to the run's channel."""
+        try:
+            await self._redis.publish(self._channel(run_id), json.dumps({"complete": True}))
+        except Exception as e:
+            logger.warning(f"Redis publish failed for run {run_id}: {e}")
+
+    async def follow(self, run_id: str, from_line: int = 0) -> AsyncIterator[OutputLine]:
+        """Follow a stream via pub/sub, catching up from disk on gaps or timeouts."""
+        pubsub = self._redis.pubsub()
+        # Subscribe before reading history so no line falls between the two.
+        await pubsub.subscribe(self._channel(run_id))
+        position = from_line
+        try:
+            while True:
+                complete = self.log_store.is_complete(run_id)
+                batch = await self._catch_up(run_id, position)
+                for line in batch:
+                    yield line
+                if batch:
+                    position = batch[-1].line_number + 1
+                    continue
+                if complete:
+                    return
+
+                # Caught up with disk: consume live messages until a gap or timeout.
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=self.poll_interval
+                    )
+                    if message is None:
+                        break
+                    data = json.loads(message["data"])
+                    if data.get("complete"):
+                        break
+                    line_number = data["line_number"]
+                    if line_number < position:
+                        continue
+                    if line_number > position:
+                        # Missed a message; re-read the gap from disk.
+                        break
+                    yield OutputLine(
+                        line_number=line_number,
+                        content=data["content"],
+                        timestamp=data["timestamp"],
+                    )
+                    position += 1
+        finally:
+            await pubsub.unsubscribe(self._channel(run_id))
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
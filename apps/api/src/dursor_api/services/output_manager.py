@@ -2,26 +2,33 @@
 
 This module provides a pub/sub mechanism for streaming CLI tool output
 (Claude Code, Codex, Gemini) in real-time to connected clients via SSE.
+Every published line is persisted to a RunLogStore on disk, so history
+survives restarts and only a short tail per run is kept in memory.
+Streams published by another worker process are followed through a
+LogTransport (see log_transport.py).
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 import time
+from collections import deque
 from collections.abc import AsyncIterator
-from dataclasses import dataclass, field
+
+from dursor_api.services.log_transport import FileTailTransport, LogTransport
+from dursor_api.services.run_log_store import OutputLine, RunLogStore
 
 logger = logging.getLogger(__name__)
 
+__all__ = ["OutputLine", "OutputManager"]
 
-@dataclass
-class OutputLine:
-    """Represents a single line of CLI output."""
+# Number of lines read from disk per batch when replaying history
+_HISTORY_BATCH_SIZE = 500
 
-    line_number: int
-    content: str
-    timestamp: float = field(default_factory=time.time)
+# Approximate per-line overhead of an OutputLine object beyond its content string
+_LINE_OVERHEAD_BYTES = 200
 
 
 class OutputManager:
@@ -29,9 +36,12 @@ class OutputManager:
 
     This class provides:
     - Publishing output lines from CLI executors
-    - Subscribing to output streams for SSE endpoints
+    - Durable history in append-only on-disk log segments
+    - Subscribing to output streams for SSE endpoints, including streams
+      published by other worker processes (via a LogTransport)
     - History retention for late-joining subscribers
     - Automatic cleanup of completed runs
+    - A global memory budget for buffered lines with LRU eviction
 
     Thread-safety: This class is designed for asyncio and uses asyncio.Queue
     for safe communication between publishers and subscribers.
@@ -39,20 +49,35 @@ class OutputManager:
 
     def __init__(
         self,
-        max_history: int = 10000,
+        max_history: int = 1000,
         cleanup_after: float = 3600.0,
+        log_store: RunLogStore | None = None,
+        memory_budget_bytes: int | None = 64 * 1024 * 1024,
+        transport: LogTransport | None = None,
     ):
         """Initialize OutputManager.
 
         Args:
-            max_history: Maximum number of lines to retain per run.
+            max_history: Maximum number of recent lines to keep in memory per run.
+                Older lines are served from the on-disk log store.
             cleanup_after: Seconds after completion to cleanup stream.
+            log_store: Durable log storage. Defaults to a store under data_dir.
+            memory_budget_bytes: Approximate cap on memory used by buffered lines
+                across all streams. None disables the budget.
+            transport: Cross-process fan-out. Defaults to tailing the log store.
         """
         self.max_history = max_history
         self.cleanup_after = cleanup_after
+        self.log_store = log_store or RunLogStore()
+        self.memory_budget_bytes = memory_budget_bytes
+        self.transport = transport or FileTailTransport(self.log_store)
+
+        # run_id -> recent OutputLines (in-memory tail of the on-disk log).
+        # Only streams published by this process live here.
+        self._streams: dict[str, deque[OutputLine]] = {}
 
-        # run_id -> list of OutputLine (history)
-        self._streams: dict[str, list[OutputLine]] = {}
+        # run_id -> total number of lines published (including ones only on disk)
+        self._line_counts: dict[str, int] = {}
 
         # run_id -> list of subscriber queues
         self._subscribers: dict[str, list[asyncio.Queue[OutputLine | None]]] = {}
@@ -60,9 +85,86 @@ class OutputManager:
         # run_id -> completion timestamp (None if still running)
         self._completed: dict[str, float | None] = {}
 
+        # run_id -> approximate bytes held by the in-memory tail
+        self._buffered_bytes: dict[str, int] = {}
+
+        # run_id -> last publish/read time, used for LRU eviction
+        self._last_access: dict[str, float] = {}
+
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
 
+    def _ensure_stream(self, run_id: str) -> None:
+        """Load stream state into memory, recovering it from disk if present.
+
+        Must be called with the lock held.
+        """
+        if run_id in self._streams:
+            return
+        self._streams[run_id] = deque()
+        self._subscribers[run_id] = []
+        self._buffered_bytes[run_id] = 0
+        self._last_access[run_id] = time.time()
+        if self.log_store.exists(run_id):
+            self._line_counts[run_id] = self.log_store.line_count(run_id)
+            self._completed[run_id] = self.log_store.completed_at(run_id)
+        else:
+            self._line_counts[run_id] = 0
+            self._completed[run_id] = None
+
+    def _buffer_line(self, run_id: str, output_line: OutputLine) -> None:
+        """Append a line to the in-memory tail, keeping it within max_history.
+
+        Must be called with the lock held.
+        """
+        tail = self._streams[run_id]
+        tail.append(output_line)
+        self._buffered_bytes[run_id] += _line_size(output_line)
+        while len(tail) > self.max_history:
+            self._buffered_bytes[run_id] -= _line_size(tail.popleft())
+
+    def _drop_stream(self, run_id: str) -> None:
+        """Forget all in-memory state for a stream (its log stays on disk).
+
+        Must be called with the lock held.
+        """
+        self._streams.pop(run_id, None)
+        self._line_counts.pop(run_id, None)
+        self._subscribers.pop(run_id, None)
+        self._completed.pop(run_id, None)
+        self._buffered_bytes.pop(run_id, None)
+        self._last_access.pop(run_id, None)
+        self.log_store.close(run_id)
+
+    def _reopen_log(self, run_id: str) -> None:
+        """Resynchronize a stream with its log after a failed append.
+
+        Closing the writer makes the next append reopen it, which drops any
+        record left half-written; the line count is re-read from disk.
+
+        Must be called with the lock held.
+        """
+        try:
+            self.log_store.close(run_id)
+            self._line_counts[run_id] = self.log_store.line_count(run_id)
+        except OSError as e:
+            logger.error(f"Failed to reopen log for run {run_id}: {e}")
+
+    def _read_lines(
+        self,
+        run_id: str,
+        tail: list[OutputLine],
+        from_line: int,
+        to_line: int,
+    ) -> list[OutputLine]:
+        """Read lines [from_line, to_line) from the memory tail or disk."""
+        if from_line >= to_line:
+            return []
+        if tail and tail[0].line_number <= from_line:
+            start = from_line - tail[0].line_number
+            return tail[start : start + (to_line - from_line)]
+        return self.log_store.read(run_id, from_line, to_line)
+
     def publish(self, run_id: str, line: str) -> None:
         """Publish an output line for a run (sync version).
 
@@ -102,23 +204,29 @@ class OutputManager:
         async with self._lock:
             # Initialize stream if needed
             if run_id not in self._streams:
-                self._streams[run_id] = []
-                self._subscribers[run_id] = []
-                self._completed[run_id] = None
+                self._ensure_stream(run_id)
                 logger.debug(f"Initialized stream for run {run_id}")
 
             # Create output line
-            line_number = len(self._streams[run_id])
+            line_number = self._line_counts[run_id]
             output_line = OutputLine(
                 line_number=line_number,
                 content=line,
             )
 
-            # Add to history (with limit)
-            self._streams[run_id].append(output_line)
-            if len(self._streams[run_id]) > self.max_history:
-                # Remove oldest lines
-                self._streams[run_id] = self._streams[run_id][-self.max_history :]
+            # Persist before notifying so subscribers can always re-read from disk
+            try:
+                self.log_store.append(run_id, output_line)
+            except OSError as e:
+                # The line is dropped rather than numbered past what is on disk.
+                logger.error(f"Failed to persist log line {line_number} for run {run_id}: {e}")
+                self._reopen_log(run_id)
+                return
+            self._line_counts[run_id] = line_number + 1
+
+            # Keep a bounded in-memory tail of recent lines
+            self._buffer_line(run_id, output_line)
+            self._last_access[run_id] = time.time()
 
             # Notify all subscribers
             subscriber_count = len(self._subscribers[run_id])
@@ -131,6 +239,11 @@ class OutputManager:
                 except asyncio.QueueFull:
                     logger.warning(f"Queue full for subscriber of run {run_id}")
 
+        # Notify subscribers in other worker processes. Done outside the lock:
+        # the transport may do network I/O, and followers re-read gaps and
+        # out-of-order lines from disk.
+        await self.transport.publish(run_id, output_line)
+
     async def subscribe(
         self,
         run_id: str,
@@ -139,10 +252,14 @@ class OutputManager:
         """Subscribe to output stream for a run.
 
         This yields:
-        1. Historical lines from from_line onwards
+        1. Historical lines from from_line onwards (memory tail or disk)
         2. New lines as they are published
         3. Stops when the run is marked complete
 
+        Streams published by this process are served from in-memory queues.
+        Any other stream (published by another worker, not started yet, or
+        already evicted from memory) is followed through the transport.
+
         Args:
             run_id: The run ID.
             from_line: Line number to start from (0-based).
@@ -153,31 +270,46 @@ class OutputManager:
         queue: asyncio.Queue[OutputLine | None] = asyncio.Queue(maxsize=1000)
 
         async with self._lock:
-            # Initialize stream if needed
-            if run_id not in self._streams:
-                self._streams[run_id] = []
-                self._subscribers[run_id] = []
-                self._completed[run_id] = None
-                logger.info(f"Subscriber initialized new stream for run {run_id}")
-
-            # Register subscriber
-            self._subscribers[run_id].append(queue)
-            logger.info(
-                f"Subscriber registered for run {run_id}, "
-                f"total subscribers: {len(self._subscribers[run_id])}"
-            )
-
-            # Get existing history
-            history = self._streams[run_id][from_line:]
-            is_completed = self._completed[run_id] is not None
-            logger.info(
-                f"Subscribe to run {run_id}: history={len(history)} lines, completed={is_completed}"
-            )
+            is_local = run_id in self._streams
+            if is_local:
+                # Register subscriber
+                self._subscribers[run_id].append(queue)
+                logger.info(
+                    f"Subscriber registered for run {run_id}, "
+                    f"total subscribers: {len(self._subscribers[run_id])}"
+                )
+
+                # Snapshot history bounds; anything newer arrives through the queue
+                self._last_access[run_id] = time.time()
+                history_end = self._line_counts[run_id]
+                tail = list(self._streams[run_id])
+                is_completed = self._completed[run_id] is not None
+                logger.info(
+                    f"Subscribe to run {run_id}: "
+                    f"history={max(history_end - from_line, 0)} lines, "
+                    f"completed={is_completed}"
+                )
+
+        if not is_local:
+            logger.info(f"Following run {run_id} via {type(self.transport).__name__}")
+            async for output_line in self.transport.follow(run_id, from_line):
+                yield output_line
+            return
 
         try:
-            # Yield historical lines
-            for output_line in history:
-                yield output_line
+            # Yield historical lines in batches so long logs are never fully loaded
+            loop = asyncio.get_event_loop()
+            position = from_line
+            while position < history_end:
+                batch_end = min(position + _HISTORY_BATCH_SIZE, history_end)
+                batch = await loop.run_in_executor(
+                    None, self._read_lines, run_id, tail, position, batch_end
+                )
+                if not batch:
+                    break
+                for output_line in batch:
+                    yield output_line
+                position = batch[-1].line_number + 1
 
             # If already completed, we're done
             if is_completed:
@@ -197,6 +329,9 @@ class OutputManager:
                         # Completion signal
                         break
 
+                    if output_line.line_number < from_line:
+                        continue
+
                     yield output_line
 
                 except TimeoutError:
@@ -218,16 +353,18 @@ class OutputManager:
     async def mark_complete(self, run_id: str) -> None:
         """Mark a run as complete.
 
-        This notifies all subscribers that no more output will be published.
+        This notifies all subscribers that no more output will be published
+        and finalizes the run's on-disk log. The completion marker is written
+        even for streams that never published a line, so followers of runs
+        without output stop too.
 
         Args:
             run_id: The run ID.
         """
         async with self._lock:
-            if run_id not in self._completed:
-                return
-
-            self._completed[run_id] = time.time()
+            if run_id in self._completed:
+                self._completed[run_id] = time.time()
+            self.log_store.mark_complete(run_id)
 
             # Send completion signal to all subscribers
             for queue in self._subscribers.get(run_id, []):
@@ -236,22 +373,71 @@ class OutputManager:
                 except asyncio.QueueFull:
                     pass
 
+        await self.transport.publish_complete(run_id)
         logger.info(f"Marked run {run_id} as complete")
 
-    async def get_history(self, run_id: str, from_line: int = 0) -> list[OutputLine]:
+    async def delete_stream(self, run_id: str) -> None:
+        """Delete a stream from memory and disk.
+
+        Subscribers still attached are sent the completion signal.
+
+        Args:
+            run_id: The run ID.
+        """
+        async with self._lock:
+            for queue in self._subscribers.get(run_id, []):
+                try:
+                    queue.put_nowait(None)
+                except asyncio.QueueFull:
+                    pass
+            self._drop_stream(run_id)
+            self.log_store.delete(run_id)
+        logger.info(f"Deleted output stream {run_id}")
+
+    async def has_stream(self, run_id: str) -> bool:
+        """Check if any output exists for a run, in memory or on disk.
+
+        Args:
+            run_id: The run ID.
+
+        Returns:
+            True if the run has published output.
+        """
+        async with self._lock:
+            if self._line_counts.get(run_id):
+                return True
+        return self.log_store.exists(run_id)
+
+    async def get_history(
+        self,
+        run_id: str,
+        from_line: int = 0,
+        limit: int | None = None,
+    ) -> list[OutputLine]:
         """Get historical output lines for a run.
 
         Args:
             run_id: The run ID.
             from_line: Line number to start from (0-based).
+            limit: Maximum number of lines to return. None returns all.
 
         Returns:
             List of OutputLine objects.
         """
         async with self._lock:
-            if run_id not in self._streams:
+            if run_id in self._streams:
+                line_count = self._line_counts[run_id]
+                tail = list(self._streams[run_id])
+                self._last_access[run_id] = time.time()
+            elif self.log_store.exists(run_id):
+                line_count = self.log_store.line_count(run_id)
+                tail = []
+            else:
                 return []
-            return self._streams[run_id][from_line:]
+
+        to_line = line_count if limit is None else min(line_count, from_line + limit)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._read_lines, run_id, tail, from_line, to_line)
 
     async def is_complete(self, run_id: str) -> bool:
         """Check if a run is marked as complete.
@@ -263,10 +449,16 @@ class OutputManager:
             True if complete, False otherwise.
         """
         async with self._lock:
-            return self._completed.get(run_id) is not None
+            if run_id in self._completed:
+                return self._completed[run_id] is not None
+        return self.log_store.is_complete(run_id)
 
     async def cleanup_old_streams(self) -> int:
-        """Clean up streams for completed runs that are past cleanup_after.
+        """Clean up in-memory state for streams that are past cleanup_after.
+
+        This covers completed runs as well as abandoned streams that never
+        completed and have had no activity or subscribers for cleanup_after
+        seconds. Logs stay on disk and are reloaded on demand.
 
         Returns:
             Number of streams cleaned up.
@@ -279,17 +471,100 @@ class OutputManager:
                 if completed_at is not None:
                     if now - completed_at > self.cleanup_after:
                         to_cleanup.append(run_id)
+                elif not self._subscribers.get(run_id):
+                    last_access = self._last_access.get(run_id, now)
+                    if now - last_access > self.cleanup_after:
+                        to_cleanup.append(run_id)
 
             for run_id in to_cleanup:
-                self._streams.pop(run_id, None)
-                self._subscribers.pop(run_id, None)
-                self._completed.pop(run_id, None)
+                self._drop_stream(run_id)
 
         if to_cleanup:
             logger.info(f"Cleaned up {len(to_cleanup)} old output streams")
 
         return len(to_cleanup)
 
+    async def enforce_memory_budget(self) -> int:
+        """Evict buffered lines until total memory use is within the budget.
+
+        Completed streams without subscribers are evicted first, least recently
+        used first. If that is not enough, the in-memory tails of the remaining
+        streams are trimmed (their lines are still available on disk).
+
+        Returns:
+            Number of streams evicted.
+        """
+        if self.memory_budget_bytes is None:
+            return 0
+
+        evicted = 0
+        async with self._lock:
+            total = sum(self._buffered_bytes.values())
+            if total <= self.memory_budget_bytes:
+                return 0
+
+            by_lru = sorted(self._last_access, key=lambda run_id: self._last_access[run_id])
+
+            for run_id in by_lru:
+                if total <= self.memory_budget_bytes:
+                    break
+                if self._completed.get(run_id) is None or self._subscribers.get(run_id):
+                    continue
+                total -= self._buffered_bytes.get(run_id, 0)
+                self._drop_stream(run_id)
+                evicted += 1
+
+            for run_id in by_lru:
+                if total <= self.memory_budget_bytes:
+                    break
+                tail = self._streams.get(run_id)
+                while tail and total > self.memory_budget_bytes:
+                    size = _line_size(tail.popleft())
+                    self._buffered_bytes[run_id] -= size
+                    total -= size
+
+        if evicted:
+            logger.info(f"Evicted {evicted} output streams to stay within memory budget")
+
+        return evicted
+
+    async def run_maintenance(self) -> dict:
+        """Run one maintenance pass: cleanup, memory budget, and stats.
+
+        Returns:
+            Stats after maintenance (see get_stats), plus counts of streams
+            cleaned up and evicted during this pass.
+        """
+        cleaned = await self.cleanup_old_streams()
+        evicted = await self.enforce_memory_budget()
+        stats = await self.get_stats()
+        stats["cleaned_up"] = cleaned
+        stats["evicted"] = evicted
+        logger.debug(f"OutputManager maintenance: {stats}")
+        return stats
+
+    async def run_maintenance_loop(self, interval: float) -> None:
+        """Run maintenance periodically until cancelled.
+
+        Intended to be started as a background task from the app lifespan.
+
+        Args:
+            interval: Seconds between maintenance passes.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.run_maintenance()
+            except Exception:
+                logger.exception("OutputManager maintenance failed")
+
+    async def close(self) -> None:
+        """Close the transport and all open log writers."""
+        async with self._lock:
+            for run_id in list(self._streams):
+                self.log_store.close(run_id)
+        await self.transport.close()
+
     async def get_stats(self) -> dict:
         """Get statistics about the output manager.
 
@@ -301,12 +576,22 @@ class OutputManager:
             completed_runs = sum(
                 1 for completed in self._completed.values() if completed is not None
             )
-            total_lines = sum(len(lines) for lines in self._streams.values())
+            total_lines = sum(self._line_counts.values())
+            buffered_lines = sum(len(lines) for lines in self._streams.values())
+            buffered_bytes = sum(self._buffered_bytes.values())
             total_subscribers = sum(len(subs) for subs in self._subscribers.values())
 
             return {
                 "active_runs": active_runs,
                 "completed_runs": completed_runs,
                 "total_lines": total_lines,
+                "buffered_lines": buffered_lines,
+                "buffered_bytes": buffered_bytes,
+                "memory_budget_bytes": self.memory_budget_bytes,
                 "total_subscribers": total_subscribers,
             }
+
+
+def _line_size(output_line: OutputLine) -> int:
+    """Approximate memory held by a buffered OutputLine."""
+    return sys.getsizeof(output_line.content) + _LINE_OVERHEAD_BYTES
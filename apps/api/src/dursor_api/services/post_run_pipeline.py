@@ -0,0 +1,250 @@
+"""Background stages that follow a CLI run.
+
+A CLI run is marked succeeded as soon as its changes are staged and its diff
+is stored. Committing (including the LLM rewrite of non-English commit
+messages) and pushing then run here, outside the run queue, each with its own
+status on the run (``commit_status``, ``push_status``) and with retries.
+
+Stages of runs sharing a worktree are serialized: a job waits for the
+previous job on the same worktree, and RunService waits for pending jobs
+before starting a new run in that worktree, so a commit never picks up the
+next run's edits. PRService waits for a run's job before creating a PR from
+it.
+
+Optionally (``pr_prep``), the PR title and description are drafted in the
+background once a run is committed, so creating the PR later only reads the
+draft cache. This stage runs alongside the push and next runs; it is best
+effort and PRService generates the text itself on a cache miss.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+from dursor_api.agents.llm_router import LLMRouter
+from dursor_api.domain.enums import PostRunStatus
+from dursor_api.services.commit_message import ensure_english_commit_message
+from dursor_api.services.git_service import GitService
+from dursor_api.storage.dao import RunDAO
+
+if TYPE_CHECKING:
+    from dursor_api.services.github_service import GitHubService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class PostRunJob:
+    """Work left to do after a CLI run's changes were staged."""
+
+    run_id: str
+    worktree_path: Path
+    branch: str
+    commit_message: str  # Draft; made English in the commit stage
+    summary: str
+    # (owner, repo) to push to; None skips the push stage
+    github_repo: tuple[str, str] | None = None
+    # Set when resuming a job whose commit stage already succeeded
+    commit_sha: str | None = None
+
+
+class PostRunPipeline:
+    """Runs commit and push stages for finished CLI runs in the background."""
+
+    def __init__(
+        self,
+        run_dao: RunDAO,
+        git_service: GitService,
+        github_service: GitHubService | None = None,
+        llm_router: LLMRouter | None = None,
+        max_attempts: int = 3,
+        retry_delay: float = 2.0,
+    ):
+        """Initialize PostRunPipeline.
+
+        Args:
+            run_dao: Run DAO.
+            git_service: Git service.
+            github_service: GitHub service for push credentials.
+            llm_router: LLM router for commit message rewriting.
+            max_attempts: Attempts per stage before it is marked failed.
+            retry_delay: Delay before the first retry; doubles per attempt.
+        """
+        self.run_dao = run_dao
+        self.git_service = git_service
+        self.github_service = github_service
+        self.llm_router = llm_router or LLMRouter()
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._runs: dict[str, asyncio.Task[None]] = {}
+        self._worktrees: dict[str, asyncio.Task[None]] = {}
+        self._pr_preps: dict[str, asyncio.Task[None]] = {}
+        # Drafts the PR title/description of a committed run (set by dependencies)
+        self.pr_prep: Callable[[str], Awaitable[object]] | None = None
+
+    def submit(self, job: PostRunJob) -> None:
+        """Start the post-run stages of a run in the background.
+
+        Args:
+            job: Job to run.
+        """
+        key = os.fspath(job.worktree_path)
+        task = asyncio.create_task(self._run(job, self._worktrees.get(key)))
+        self._runs[job.run_id] = task
+        self._worktrees[key] = task
+
+        def _forget(done: asyncio.Task[None]) -> None:
+            if self._runs.get(job.run_id) is done:
+                del self._runs[job.run_id]
+            if self._worktrees.get(key) is done:
+                del self._worktrees[key]
+
+        task.add_done_callback(_forget)
+
+    async def wait_for_run(self, run_id: str) -> None:
+        """Wait until a run's post-run stages have finished.
+
+        Args:
+            run_id: Run ID.
+        """
+        task = self._runs.get(run_id)
+        if task:
+            await asyncio.wait([task])
+
+    async def wait_for_worktree(self, worktree_path: Path) -> None:
+        """Wait until no post-run stages are pending for a worktree.
+
+        Args:
+            worktree_path: Worktree path.
+        """
+        task = self._worktrees.get(os.fspath(worktree_path))
+        if task:
+            await asyncio.wait([task])
+
+    async def wait_for_pr_prep(self, run_id: str) -> None:
+        """Wait until a run's PR draft stage (if any) has finished.
+
+        Args:
+            run_id: Run ID.
+        """
+        task = self._pr_preps.get(run_id)
+        if task:
+            await asyncio.wait([task])
+
+    def is_pending(self, run_id: str) -> bool:
+        """Check whether a run's post-run stages are still in progress.
+
+        Args:
+            run_id: Run ID.
+
+        Returns:
+            True if stages are pending or running.
+        """
+        task = self._runs.get(run_id)
+        return task is not None and not task.done()
+
+    async def close(self) -> None:
+        """Cancel all in-flight jobs (they are resumed on next startup)."""
+        tasks = [*self._runs.values(), *self._pr_preps.values()]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self, job: PostRunJob, previous: asyncio.Task[None] | None) -> None:
+        if previous and not previous.done():
+            await asyncio.wait([previous])
+
+        if job.commit_sha is None:
+            commit_sha = await self._stage(job, "commit", lambda: self._commit(job))
+            if commit_sha is None:
+                await self.run_dao.update_post_run(job.run_id, push_status=PostRunStatus.SKIPPED)
+                return
+            await self.run_dao.update_post_run(
+                job.run_id, commit_status=PostRunStatus.SUCCEEDED, commit_sha=commit_sha
+            )
+        self._start_pr_prep(job.run_id)
+
+        if job.github_repo is None or self.github_service is None:
+            await self.run_dao.update_post_run(job.run_id, push_status=PostRunStatus.SKIPPED)
+            return
+        pushed = await self._stage(job, "push", lambda: self._push(job))
+        if pushed:
+            await self.run_dao.update_post_run(job.run_id, push_status=PostRunStatus.SUCCEEDED)
+
+    def _start_pr_prep(self, run_id: str) -> None:
+        if self.pr_prep is None or run_id in self._pr_preps:
+            return
+        pr_prep = self.pr_prep
+
+        async def _prepare() -> None:
+            try:
+                await pr_prep(run_id)
+                logger.info(f"[{run_id[:8]}] Prepared PR draft")
+            except Exception:
+                logger.exception(f"[{run_id[:8]}] PR draft failed")
+
+        task = asyncio.create_task(_prepare())
+        self._pr_preps[run_id] = task
+        task.add_done_callback(lambda _: self._pr_preps.pop(run_id, None))
+
+    async def _stage(
+        self, job: PostRunJob, name: str, action: Callable[[], Awaitable[T]]
+    ) -> T | None:
+        """Run one stage with retries, recording its status.
+
+        Returns:
+            The action's result, or None if every attempt failed.
+        """
+        await self._set_status(job.run_id, name, PostRunStatus.RUNNING)
+        delay = self.retry_delay
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await action()
+            except Exception as e:
+                logger.warning(
+                    f"[{job.run_id[:8]}] {name} attempt {attempt}/{self.max_attempts} failed: {e}"
+                )
+                error = f"{name} failed: {e}"
+                if attempt == self.max_attempts:
+                    await self._set_status(job.run_id, name, PostRunStatus.FAILED, error)
+                    return None
+                await asyncio.sleep(delay)
+                delay *= 2
+        return None
+
+    async def _set_status(
+        self, run_id: str, stage: str, status: PostRunStatus, error: str | None = None
+    ) -> None:
+        if stage == "commit":
+            await self.run_dao.update_post_run(run_id, commit_status=status, post_run_error=error)
+        else:
+            await self.run_dao.update_post_run(run_id, push_status=status, post_run_error=error)
+
+    async def _commit(self, job: PostRunJob) -> str:
+        message = await ensure_english_commit_message(
+            job.commit_message,
+            llm_router=self.llm_router,
+            hint=job.summary,
+        )
+        sha = await self.git_service.commit(job.worktree_path, message=message)
+        logger.info(f"[{job.run_id[:8]}] Committed: {sha[:8]}")
+        return sha
+
+    async def _push(self, job: PostRunJob) -> bool:
+        assert self.github_service is not None and job.github_repo is not None
+        owner, repo_name = job.github_repo
+        auth_url = await self.github_service.get_auth_url(owner, repo_name)
+        await self.git_service.push(job.worktree_path, branch=job.branch, auth_url=auth_url)
+        logger.info(f"[{job.run_id[:8]}] Pushed to branch: {job.branch}")
+        return True
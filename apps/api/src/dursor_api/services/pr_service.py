@@ -8,6 +8,7 @@ pushed by RunService, so this service only handles GitHub API operations.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import re
 import uuid
@@ -16,14 +17,18 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import urlencode, urlparse
 
+import git
+
+from dursor_api.agents.llm_router import LLMRouter
 from dursor_api.config import settings
-from dursor_api.domain.enums import ExecutorType
+from dursor_api.domain.enums import ExecutorType, PostRunStatus, RunStatus
 from dursor_api.domain.models import (
     PR,
     PRCreate,
     PRCreateAuto,
     PRCreated,
     PRCreateLink,
+    PRDraft,
     PRLinkJob,
     PRLinkJobResult,
     PRSyncResult,
@@ -36,10 +41,13 @@ from dursor_api.executors.claude_code_executor import ClaudeCodeExecutor, Claude
 from dursor_api.executors.codex_executor import CodexExecutor, CodexOptions
 from dursor_api.executors.gemini_executor import GeminiExecutor, GeminiOptions
 from dursor_api.services.commit_message import ensure_english_commit_message
+from dursor_api.services.diff_condenser import condense_diff
 from dursor_api.services.git_service import GitService
 from dursor_api.services.model_service import ModelService
+from dursor_api.services.post_run_pipeline import PostRunPipeline
 from dursor_api.services.repo_service import RepoService
-from dursor_api.storage.dao import PRDAO, RunDAO, TaskDAO
+from dursor_api.services.text_generation import generate_text
+from dursor_api.storage.dao import PRDAO, PRDraftDAO, RunDAO, TaskDAO
 
 if TYPE_CHECKING:
     from dursor_api.services.github_service import GitHubService
@@ -47,6 +55,16 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _instruction_text(task: Task, run: Run) -> str:
+    """Get the text a diff's hunks are ranked against when condensing it."""
+    return f"{task.title or ''}\n{run.instruction}"
+
+
+def _template_hash(template: str | None) -> str:
+    """Hash a PR template for the draft cache key ('' when there is none)."""
+    return hashlib.sha256(template.encode()).hexdigest() if template else ""
+
+
 class GitHubPermissionError(Exception):
     """Raised when GitHub App lacks required permissions."""
 
@@ -135,6 +153,8 @@ class PRService:
         github_service: GitHubService,
         model_service: ModelService,
         git_service: GitService | None = None,
+        post_run_pipeline: PostRunPipeline | None = None,
+        pr_draft_dao: PRDraftDAO | None = None,
     ):
         self.pr_dao = pr_dao
         self.task_dao = task_dao
@@ -143,6 +163,9 @@ class PRService:
         self.github_service = github_service
         self.model_service = model_service
         self.git_service = git_service or GitService()
+        self.post_run_pipeline = post_run_pipeline
+        self.pr_draft_dao = pr_draft_dao
+        self.llm_router = LLMRouter()
         # Job queue for async PR link generation
         self.link_job_queue = PRLinkJobQueue()
         # Initialize executors for PR description generation
@@ -176,6 +199,53 @@ class PRService:
 
         return parts[0], parts[1]
 
+    async def _get_settled_run(self, run_id: str) -> Run | None:
+        """Get a run once its background commit and push stages have finished.
+
+        Args:
+            run_id: Run ID.
+
+        Returns:
+            Run object or None if not found.
+
+        Raises:
+            ValueError: If the run's changes could not be committed (its branch
+                does not contain them).
+        """
+        if self.post_run_pipeline:
+            await self.post_run_pipeline.wait_for_run(run_id)
+        run = await self.run_dao.get(run_id)
+        if run and run.commit_status == PostRunStatus.FAILED:
+            raise ValueError(
+                f"Committing the changes of run {run_id} failed: "
+                f"{run.post_run_error or 'unknown error'}"
+            )
+        return run
+
+    async def _settle_branch_worktrees(self, task_id: str, branch: str) -> None:
+        """Wait until no run or post-run stage is using a worktree of a branch.
+
+        Args:
+            task_id: Task ID.
+            branch: Branch whose run worktrees are checked.
+
+        Raises:
+            ValueError: If a queued or running run works on the branch.
+        """
+        worktree_paths = set()
+        for other in await self.run_dao.list(task_id):
+            if other.working_branch != branch or not other.worktree_path:
+                continue
+            if other.status in (RunStatus.QUEUED, RunStatus.RUNNING):
+                raise ValueError(
+                    f"Run {other.id} is still working on {branch}; "
+                    "update the PR once it has finished"
+                )
+            worktree_paths.add(other.worktree_path)
+        if self.post_run_pipeline:
+            for worktree_path in sorted(worktree_paths):
+                await self.post_run_pipeline.wait_for_worktree(Path(worktree_path))
+
     async def _ensure_branch_pushed(
         self, *, owner: str, repo: str, repo_obj: Repo, run: Run
     ) -> None:
@@ -247,7 +317,7 @@ class PRService:
             raise ValueError(f"Repo not found: {task.repo_id}")
 
         # Get run
-        run = await self.run_dao.get(data.selected_run_id)
+        run = await self._get_settled_run(data.selected_run_id)
         if not run:
             raise ValueError(f"Run not found: {data.selected_run_id}")
 
@@ -316,7 +386,7 @@ class PRService:
             raise ValueError(f"Repo not found: {task.repo_id}")
 
         # Get run
-        run = await self.run_dao.get(data.selected_run_id)
+        run = await self._get_settled_run(data.selected_run_id)
         if not run:
             raise ValueError(f"Run not found: {data.selected_run_id}")
 
@@ -339,26 +409,8 @@ class PRService:
         # Diagnostics: confirm PR branch is based on latest default (origin/<default>)
         await self._log_pr_branch_base_state(repo_obj, run)
 
-        # Get diff for AI generation
-        diff = ""
-        if run.worktree_path:
-            worktree_path = Path(run.worktree_path)
-            if worktree_path.exists():
-                diff = await self.git_service.get_diff_from_base(
-                    worktree_path,
-                    base_ref=run.base_ref or repo_obj.default_branch,
-                )
-        if not diff and run.patch:
-            diff = run.patch
-
-        # Generate title and description with AI in a single call
-        template = await self._load_pr_template(repo_obj)
-        title, description = await self._generate_title_and_description(
-            diff=diff,
-            template=template,
-            task=task,
-            run=run,
-        )
+        # Title and description: generated ahead of time if possible, else now
+        title, description = await self._get_title_and_description(task, run, repo_obj)
 
         # Create PR via GitHub API
         pr_data = await self.github_service.create_pull_request(
@@ -391,7 +443,7 @@ class PRService:
         if not repo_obj:
             raise ValueError(f"Repo not found: {task.repo_id}")
 
-        run = await self.run_dao.get(data.selected_run_id)
+        run = await self._get_settled_run(data.selected_run_id)
         if not run:
             raise ValueError(f"Run not found: {data.selected_run_id}")
 
@@ -422,7 +474,7 @@ class PRService:
         if not repo_obj:
             raise ValueError(f"Repo not found: {task.repo_id}")
 
-        run = await self.run_dao.get(data.selected_run_id)
+        run = await self._get_settled_run(data.selected_run_id)
         if not run:
             raise ValueError(f"Run not found: {data.selected_run_id}")
 
@@ -432,26 +484,8 @@ class PRService:
         owner, repo_name = self._parse_github_url(repo_obj.repo_url)
         await self._ensure_branch_pushed(owner=owner, repo=repo_name, repo_obj=repo_obj, run=run)
 
-        # Get diff for AI generation
-        diff = ""
-        if run.worktree_path:
-            worktree_path = Path(run.worktree_path)
-            if worktree_path.exists():
-                diff = await self.git_service.get_diff_from_base(
-                    worktree_path,
-                    base_ref=run.base_ref or repo_obj.default_branch,
-                )
-        if not diff and run.patch:
-            diff = run.patch
-
-        # Generate title and description with AI in a single call
-        template = await self._load_pr_template(repo_obj)
-        title, description = await self._generate_title_and_description(
-            diff=diff,
-            template=template,
-            task=task,
-            run=run,
-        )
+        # Title and description: generated ahead of time if possible, else now
+        title, description = await self._get_title_and_description(task, run, repo_obj)
 
         base = repo_obj.default_branch
         url = self._build_github_compare_url(
@@ -474,7 +508,7 @@ class PRService:
         if not repo_obj:
             raise ValueError(f"Repo not found: {task.repo_id}")
 
-        run = await self.run_dao.get(selected_run_id)
+        run = await self._get_settled_run(selected_run_id)
         if not run:
             raise ValueError(f"Run not found: {selected_run_id}")
 
@@ -580,6 +614,101 @@ class PRService:
             error=job.error,
         )
 
+    async def prepare_draft(self, run_id: str) -> PRDraft | None:
+        """Generate and cache the PR title and description for a run ahead of time.
+
+        Called by the post-run pipeline once a run's changes are committed, so
+        that creating a PR later only has to read the cache.
+
+        Args:
+            run_id: Run ID.
+
+        Returns:
+            The cached draft, or None if the run cannot have a PR yet.
+        """
+        run = await self.run_dao.get(run_id)
+        if not run or not run.commit_sha or not run.working_branch:
+            return None
+        task = await self.task_dao.get(run.task_id)
+        if not task:
+            return None
+        repo_obj = await self.repo_service.get(task.repo_id)
+        if not repo_obj:
+            return None
+
+        template = await self._load_pr_template(repo_obj)
+        await self._draft_title_and_description(task, run, repo_obj, template)
+        return await self._get_draft(run, template)
+
+    async def _get_title_and_description(
+        self, task: Task, run: Run, repo_obj: Repo
+    ) -> tuple[str, str]:
+        """Get a run's PR title and description from the draft cache or generate them.
+
+        Drafts are keyed by (commit SHA, template hash), so a new commit or a
+        changed PR template invalidates them.
+
+        Args:
+            task: Task object.
+            run: Run object.
+            repo_obj: Repository object.
+
+        Returns:
+            Tuple of (title, description).
+        """
+        if self.post_run_pipeline:
+            # A draft for this run may be in the making; don't generate it twice.
+            await self.post_run_pipeline.wait_for_pr_prep(run.id)
+        template = await self._load_pr_template(repo_obj)
+        return await self._draft_title_and_description(task, run, repo_obj, template)
+
+    async def _draft_title_and_description(
+        self, task: Task, run: Run, repo_obj: Repo, template: str | None
+    ) -> tuple[str, str]:
+        """Read the cached draft for a run or generate and cache it."""
+        draft = await self._get_draft(run, template)
+        if draft:
+            logger.info(f"Using cached PR draft for commit {draft.commit_sha[:8]}")
+            return draft.title, draft.body
+
+        # Get diff for AI generation. The draft is cached under run.commit_sha,
+        # so diff up to that commit: the worktree's HEAD may have moved on.
+        diff = ""
+        base_ref = run.base_ref or repo_obj.default_branch
+        worktree_path = Path(run.worktree_path) if run.worktree_path else None
+        if worktree_path is not None and not worktree_path.exists():
+            worktree_path = None
+        if run.commit_sha:
+            # The workspace shares the worktree's objects if it was removed.
+            diff = await self.git_service.get_diff_from_base(
+                worktree_path or Path(repo_obj.workspace_path),
+                base_ref=base_ref,
+                head=run.commit_sha,
+            )
+        elif worktree_path is not None:
+            diff = await self.git_service.get_diff_from_base(worktree_path, base_ref=base_ref)
+        if not diff:
+            diff = await self.run_dao.get_patch(run.id)
+
+        # Generate title and description with AI in a single call
+        title, description = await self._generate_title_and_description(
+            diff=diff,
+            template=template,
+            task=task,
+            run=run,
+        )
+        if self.pr_draft_dao and run.commit_sha:
+            await self.pr_draft_dao.upsert(
+                run.commit_sha, _template_hash(template), run.id, title, description
+            )
+        return title, description
+
+    async def _get_draft(self, run: Run, template: str | None) -> PRDraft | None:
+        """Look up the cached draft for a run's commit and PR template."""
+        if not self.pr_draft_dao or not run.commit_sha:
+            return None
+        return await self.pr_draft_dao.get(run.commit_sha, _template_hash(template))
+
     async def _generate_title_and_description(
         self,
         diff: str,
@@ -619,8 +748,8 @@ class PRService:
             )
             return fallback_title, fallback_desc
 
-        # Truncate diff if too long
-        truncated_diff = diff[:10000] if len(diff) > 10000 else diff
+        # Condense diff if too long (per-file summary plus the most significant hunks)
+        truncated_diff = condense_diff(diff, 10000, instruction=_instruction_text(task, run))
 
         # Build combined prompt
         prompt_parts = [
@@ -763,8 +892,8 @@ class PRService:
         if not worktree_path.exists():
             return self._generate_fallback_title(run)
 
-        # Truncate diff if too long
-        truncated_diff = diff[:5000] if len(diff) > 5000 else diff
+        # Condense diff if too long
+        truncated_diff = condense_diff(diff, 5000, instruction=_instruction_text(task, run))
 
         prompt = f"""Generate a concise Pull Request title based on the following information.
 
@@ -868,18 +997,25 @@ DO NOT edit any files. Only output the title text.
         executor_type: ExecutorType,
         prompt: str,
     ) -> str | None:
-        """Execute Agent Tool to generate PR description.
+        """Generate PR text (title and/or description) for a prompt.
 
-        Writes the result to a temp file in /tmp and reads it back.
+        The configured text model is called directly through LLMRouter first.
+        If it is unavailable or fails, the run's Agent Tool is executed in the
+        worktree instead, writing the result to a temp file in /tmp that is
+        read back.
 
         Args:
             worktree_path: Path to the worktree.
-            executor_type: Type of executor to use.
+            executor_type: Type of executor to use as fallback.
             prompt: Prompt for description generation.
 
         Returns:
             Generated description or None if failed.
         """
+        text = await generate_text(prompt, llm_router=self.llm_router)
+        if text:
+            return text
+
         # Create a unique temp file path (outside worktree)
         temp_file = Path(f"/tmp/dursor_pr_desc_{uuid.uuid4().hex}.md")
 
@@ -938,8 +1074,8 @@ IMPORTANT INSTRUCTIONS:
         Returns:
             Prompt string.
         """
-        # Truncate diff if too long
-        truncated_diff = diff[:10000] if len(diff) > 10000 else diff
+        # Condense diff if too long
+        truncated_diff = condense_diff(diff, 10000, instruction=_instruction_text(task, run))
 
         prompt_parts = [
             "Create a PR Description based on the template, user instruction, and diff below.",
@@ -1051,7 +1187,7 @@ IMPORTANT INSTRUCTIONS:
             raise ValueError(f"Repo not found: {task.repo_id}")
 
         # Get run
-        run = await self.run_dao.get(data.selected_run_id)
+        run = await self._get_settled_run(data.selected_run_id)
         if not run:
             raise ValueError(f"Run not found: {data.selected_run_id}")
 
@@ -1067,50 +1203,41 @@ IMPORTANT INSTRUCTIONS:
 
         # For PatchAgent runs or different branches, we need to apply the patch
         # This is backward compatibility code
-        if not run.patch:
+        workspace_path = Path(repo_obj.workspace_path)
+        if run.commit_sha:
+            # CLI runs do not store their full patch; take it from their commit.
+            patch = await self.git_service.get_diff(workspace_path, commit=run.commit_sha)
+        else:
+            patch = await self.run_dao.get_patch(run.id)
+        if not patch:
             raise ValueError("Run has no patch to apply")
 
         # Parse GitHub info
         owner, repo_name = self._parse_github_url(repo_obj.repo_url)
 
-        # Apply patch to PR branch using GitService
-        workspace_path = Path(repo_obj.workspace_path)
-
-        # Checkout PR branch, apply patch, commit, and push
-        await self.git_service.checkout(workspace_path, pr.branch)
-
-        # Apply patch manually
-        import subprocess
-
-        patch_file = workspace_path / ".dursor_patch.diff"
-        try:
-            patch_file.write_text(run.patch)
-            result = subprocess.run(
-                ["git", "apply", "--whitespace=fix", str(patch_file)],
-                cwd=workspace_path,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                await self.git_service.checkout(workspace_path, repo_obj.default_branch)
-                error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
-                raise ValueError(f"Failed to apply patch: {error_msg}")
-        finally:
-            patch_file.unlink(missing_ok=True)
-
-        # Stage and commit
-        await self.git_service.stage_all(workspace_path)
+        # Commit the patch onto the PR branch with plumbing (no checkout), so
+        # the shared workspace and run worktrees are never touched.
         commit_message = data.message or f"Update: {run.summary or ''}"
         commit_message = await ensure_english_commit_message(
             commit_message,
+            llm_router=self.llm_router,
             hint=run.summary or "",
         )
-        commit_sha = await self.git_service.commit(workspace_path, commit_message)
+        # commit_patch fast-forwards the worktree that has the PR branch checked
+        # out; don't move it under a run or its pending background commit.
+        await self._settle_branch_worktrees(task_id, pr.branch)
+        try:
+            commit_sha = await self.git_service.commit_patch(
+                workspace_path, pr.branch, patch, commit_message
+            )
+        except git.GitCommandError as e:
+            error_msg = str(e.stderr or "").strip() or "Unknown error"
+            raise ValueError(f"Failed to apply patch: {error_msg}") from e
 
-        # Push
+        # Push the new commit to the PR branch
         auth_url = await self.github_service.get_auth_url(owner, repo_name)
         try:
-            await self.git_service.push(workspace_path, pr.branch, auth_url)
+            await self.git_service.push(workspace_path, pr.branch, auth_url, source_ref=commit_sha)
         except Exception as e:
             if "403" in str(e) or "Write access" in str(e):
                 raise GitHubPermissionError(
@@ -1120,9 +1247,6 @@ IMPORTANT INSTRUCTIONS:
                 ) from e
             raise
 
-        # Switch back to default branch
-        await self.git_service.checkout(workspace_path, repo_obj.default_branch)
-
         # Update database
         await self.pr_dao.update(pr_id, commit_sha)
 
@@ -1182,8 +1306,8 @@ IMPORTANT INSTRUCTIONS:
                 )
 
         # Fallback to using patch from latest run
-        if not cumulative_diff and latest_run and latest_run.patch:
-            cumulative_diff = latest_run.patch
+        if not cumulative_diff and latest_run:
+            cumulative_diff = await self.run_dao.get_patch(latest_run.id)
 
         if not cumulative_diff:
             raise ValueError("Could not get diff for PR description generation")
@@ -1338,8 +1462,8 @@ IMPORTANT INSTRUCTIONS:
         Returns:
             Prompt string.
         """
-        # Truncate diff if too long
-        truncated_diff = diff[:10000] if len(diff) > 10000 else diff
+        # Condense diff if too long
+        truncated_diff = condense_diff(diff, 10000, instruction=task.title)
 
         prompt_parts = [
             "Create a PR Description based on the template, user instruction, and diff below.",
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
 import shutil
 import uuid
@@ -12,11 +14,16 @@ import git
 
 from dursor_api.config import settings
 from dursor_api.domain.models import Repo, RepoCloneRequest, RepoSelectRequest
+from dursor_api.services.git_clone import clone_workspace
+from dursor_api.services.git_mirror import GitMirrorCache
+from dursor_api.services.git_performance import apply_performance_profile, run_maintenance
 from dursor_api.storage.dao import RepoDAO
 
 if TYPE_CHECKING:
     from dursor_api.services.github_service import GitHubService
 
+logger = logging.getLogger(__name__)
+
 
 class RepoService:
     """Service for managing Git repositories."""
@@ -28,6 +35,11 @@ class RepoService:
         else:
             raise ValueError("workspaces_dir must be set in settings")
         self._github_service = github_service
+        self.mirrors: GitMirrorCache | None = None
+        if settings.git_mirror_cache:
+            self.mirrors = GitMirrorCache(
+                self.workspaces_dir / "mirrors", settings.git_mirror_refresh_seconds
+            )
 
     def set_github_service(self, github_service: GitHubService) -> None:
         """Set the GitHub service (for dependency injection)."""
@@ -46,6 +58,37 @@ class RepoService:
                 f"Please fix permissions with: chmod -R u+w {self.workspaces_dir}"
             )
 
+    def _apply_performance_profile(self, repo: git.Repo) -> None:
+        """Apply the git performance profile to a workspace (best effort).
+
+        Args:
+            repo: Workspace repository.
+        """
+        if not settings.git_performance_profile:
+            return
+        try:
+            apply_performance_profile(repo)
+        except (git.GitCommandError, OSError) as e:
+            logger.warning(f"Failed to apply git performance profile to {repo.working_dir}: {e}")
+
+    def _mirror_reference(
+        self, repo_url: str, full_clone: bool, fetch_url: str | None = None
+    ) -> Path | None:
+        """Bring the remote's mirror up to date for a new clone (blocking).
+
+        Args:
+            repo_url: Remote URL identifying the mirror.
+            full_clone: Whether the clone is a full clone. Mirrors are
+                blobless and cannot supply the blobs a full clone needs.
+            fetch_url: URL to fetch from, e.g. with credentials.
+
+        Returns:
+            Path to the mirror to clone with, or None to clone without one.
+        """
+        if self.mirrors is None or full_clone:
+            return None
+        return self.mirrors.ensure(repo_url, fetch_url=fetch_url)
+
     async def clone(self, data: RepoCloneRequest) -> Repo:
         """Clone a repository.
 
@@ -65,16 +108,25 @@ class RepoService:
         workspace_id = str(uuid.uuid4())
         workspace_path = self.workspaces_dir / workspace_id
 
-        # Clone the repository
-        repo = git.Repo.clone_from(
-            data.repo_url,
-            workspace_path,
-            depth=1,  # Shallow clone for faster initial clone
-        )
+        def _clone() -> git.Repo:
+            # Clone the repository (blobless partial clone unless a full clone is requested)
+            repo = clone_workspace(
+                data.repo_url,
+                workspace_path,
+                full_clone=data.full_clone,
+                sparse_paths=data.sparse_paths,
+                reference=self._mirror_reference(data.repo_url, data.full_clone),
+            )
+
+            # Checkout specific ref if provided
+            if data.ref:
+                repo.git.checkout(data.ref)
 
-        # Checkout specific ref if provided
-        if data.ref:
-            repo.git.checkout(data.ref)
+            self._apply_performance_profile(repo)
+            return repo
+
+        loop = asyncio.get_event_loop()
+        repo = await loop.run_in_executor(None, _clone)
 
         # Get repository info
         default_branch = repo.active_branch.name
@@ -86,6 +138,8 @@ class RepoService:
             default_branch=default_branch,
             latest_commit=latest_commit,
             workspace_path=str(workspace_path),
+            full_clone=data.full_clone,
+            sparse_paths=data.sparse_paths,
         )
 
     async def get(self, repo_id: str) -> Repo | None:
@@ -133,8 +187,15 @@ class RepoService:
             if data.branch:
                 workspace_path = Path(existing.workspace_path)
                 if workspace_path.exists():
-                    repo = git.Repo(workspace_path)
-                    repo.git.checkout(data.branch)
+                    branch = data.branch
+
+                    def _checkout() -> None:
+                        with git.Repo(workspace_path) as repo:
+                            repo.git.checkout(branch)
+                            self._apply_performance_profile(repo)
+
+                    loop = asyncio.get_event_loop()
+                    await loop.run_in_executor(None, _checkout)
             return existing
 
         # Ensure workspaces directory is writable before cloning
@@ -148,13 +209,20 @@ class RepoService:
         workspace_path = self.workspaces_dir / workspace_id
 
         # Clone the repository
-        branch = data.branch or "main"
-        repo = git.Repo.clone_from(
-            clone_url,
-            workspace_path,
-            depth=1,
-            branch=branch,
-        )
+        def _clone() -> git.Repo:
+            repo = clone_workspace(
+                clone_url,
+                workspace_path,
+                branch=data.branch or "main",
+                full_clone=data.full_clone,
+                sparse_paths=data.sparse_paths,
+                reference=self._mirror_reference(repo_url, data.full_clone, fetch_url=clone_url),
+            )
+            self._apply_performance_profile(repo)
+            return repo
+
+        loop = asyncio.get_event_loop()
+        repo = await loop.run_in_executor(None, _clone)
 
         # Get repository info
         default_branch = repo.active_branch.name
@@ -166,6 +234,8 @@ class RepoService:
             default_branch=default_branch,
             latest_commit=latest_commit,
             workspace_path=str(workspace_path),
+            full_clone=data.full_clone,
+            sparse_paths=data.sparse_paths,
         )
 
     async def update_workspace(self, repo_id: str) -> Repo | None:
@@ -190,6 +260,63 @@ class RepoService:
 
         return db_repo
 
+    def _maintain_workspace(self, workspace_path: Path) -> None:
+        """Apply the performance profile and run git maintenance on a workspace.
+
+        Args:
+            workspace_path: Path to the workspace repository.
+        """
+        with git.Repo(workspace_path) as repo:
+            self._apply_performance_profile(repo)
+            run_maintenance(repo)
+
+    def _maintain_mirror(self, mirror_path: Path) -> None:
+        """Run git maintenance on a bare mirror.
+
+        Args:
+            mirror_path: Path to the bare mirror repository.
+        """
+        with git.Repo(mirror_path) as repo:
+            run_maintenance(repo)
+
+    async def maintain_workspaces(self) -> None:
+        """Run git maintenance on every managed workspace and mirror.
+
+        Failures are logged per workspace so one broken clone does not stop
+        the others from being maintained.
+        """
+        loop = asyncio.get_event_loop()
+        for repo in await self.dao.list():
+            workspace_path = Path(repo.workspace_path)
+            if not (workspace_path / ".git").exists():
+                continue
+            try:
+                await loop.run_in_executor(None, self._maintain_workspace, workspace_path)
+            except (git.GitCommandError, git.InvalidGitRepositoryError, OSError) as e:
+                logger.warning(f"git maintenance failed for {workspace_path}: {e}")
+
+        # Mirrors only need their object store maintained.
+        for mirror_path in self.mirrors.list() if self.mirrors else []:
+            try:
+                await loop.run_in_executor(None, self._maintain_mirror, mirror_path)
+            except (git.GitCommandError, git.InvalidGitRepositoryError, OSError) as e:
+                logger.warning(f"git maintenance failed for mirror {mirror_path.name}: {e}")
+
+    async def run_maintenance_loop(self, interval: float) -> None:
+        """Run workspace maintenance periodically until cancelled.
+
+        Intended to be started as a background task from the app lifespan.
+
+        Args:
+            interval: Seconds between maintenance passes.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.maintain_workspaces()
+            except Exception:
+                logger.exception("Workspace maintenance failed")
+
     def create_working_copy(self, repo: Repo, run_id: str) -> Path:
         """Create a working copy of a repository for a run.
 
@@ -0,0 +1,371 @@
+"""Durable on-disk storage for run output logs.
+
+Each run (or breakdown) gets its own directory under ``data_dir/run_logs``
+containing append-only segment files and a sparse line-offset index:
+
+    run_logs/<run_id>/
+        000000000000.log   # segment starting at line 0
+        000000250000.log   # segment starting at line 250000 (after rollover)
+        index              # sparse index: (segment_start, byte_offset) pairs
+        complete           # marker written when the stream is finished
+
+Segment files hold one JSON record per line. The index stores an entry for
+every ``index_interval`` lines, so reading from an arbitrary ``from_line``
+only needs one seek plus a short forward scan.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+import struct
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO
+
+from dursor_api.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Index entry: (segment_start_line, byte_offset_in_segment), little-endian uint64
+_INDEX_ENTRY = struct.Struct("<QQ")
+
+INDEX_FILE = "index"
+COMPLETE_FILE = "complete"
+SEGMENT_SUFFIX = ".log"
+
+
+@dataclass
+class OutputLine:
+    """Represents a single line of CLI output."""
+
+    line_number: int
+    content: str
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass
+class _SegmentWriter:
+    """Open append handles for the active segment of a stream."""
+
+    segment_start: int
+    segment: BinaryIO
+    index: BinaryIO
+    segment_size: int
+    line_count: int
+
+
+def _segment_name(segment_start: int) -> str:
+    return f"{segment_start:012d}{SEGMENT_SUFFIX}"
+
+
+def _encode(line: OutputLine) -> bytes:
+    record = {
+        "line_number": line.line_number,
+        "content": line.content,
+        "timestamp": line.timestamp,
+    }
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _decode(raw: bytes) -> OutputLine:
+    record = json.loads(raw)
+    return OutputLine(
+        line_number=record["line_number"],
+        content=record["content"],
+        timestamp=record["timestamp"],
+    )
+
+
+class RunLogStore:
+    """Append-only, segmented log storage with a sparse line-offset index.
+
+    Writes are synchronous and small (one record per line), so callers may
+    invoke ``append`` directly from the event loop. Reads open their own file
+    handles and never go past a caller-supplied line bound, which makes them
+    safe to run in a thread pool while the writer keeps appending.
+    """
+
+    def __init__(
+        self,
+        logs_dir: Path | None = None,
+        index_interval: int = 256,
+        segment_max_bytes: int = 16 * 1024 * 1024,
+    ):
+        """Initialize RunLogStore.
+
+        Args:
+            logs_dir: Base directory for log segments. Defaults to data_dir/run_logs.
+            index_interval: Number of lines between sparse index entries.
+            segment_max_bytes: Size at which a new segment file is started.
+        """
+        if logs_dir:
+            self.logs_dir = logs_dir
+        elif settings.data_dir:
+            self.logs_dir = settings.data_dir / "run_logs"
+        else:
+            raise ValueError("logs_dir must be provided or data_dir set in settings")
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        self.index_interval = index_interval
+        self.segment_max_bytes = segment_max_bytes
+
+        # run_id -> open writer for streams currently being appended to
+        self._writers: dict[str, _SegmentWriter] = {}
+
+    # ============================================================
+    # Paths
+    # ============================================================
+
+    def _stream_dir(self, run_id: str) -> Path:
+        # IDs are UUIDs; guard against path traversal from user-supplied IDs anyway.
+        safe_id = run_id.replace("/", "_").replace("\\", "_").lstrip(".")
+        return self.logs_dir / safe_id
+
+    def exists(self, run_id: str) -> bool:
+        """Check whether any log data has been written for a stream."""
+        return (self._stream_dir(run_id) / INDEX_FILE).exists()
+
+    def is_complete(self, run_id: str) -> bool:
+        """Check whether a stream has been marked complete on disk."""
+        return (self._stream_dir(run_id) / COMPLETE_FILE).exists()
+
+    def completed_at(self, run_id: str) -> float | None:
+        """Get the completion time recorded on disk, if any."""
+        marker = self._stream_dir(run_id) / COMPLETE_FILE
+        try:
+            return marker.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    # ============================================================
+    # Writing
+    # ============================================================
+
+    def append(self, run_id: str, line: OutputLine) -> None:
+        """Append a line to a stream.
+
+        ``line.line_number`` must equal the current line count of the stream.
+
+        Args:
+            run_id: The run ID.
+            line: The output line to persist.
+        """
+        writer = self._writers.get(run_id) or self._open_writer(run_id)
+        if line.line_number != writer.line_count:
+            raise ValueError(
+                f"Out-of-order log line for {run_id}: "
+                f"expected {writer.line_count}, got {line.line_number}"
+            )
+
+        if writer.segment_size >= self.segment_max_bytes:
+            self._roll_segment(run_id, writer)
+
+        if line.line_number % self.index_interval == 0:
+            writer.index.write(_INDEX_ENTRY.pack(writer.segment_start, writer.segment_size))
+            writer.index.flush()
+
+        data = _encode(line)
+        writer.segment.write(data)
+        writer.segment.flush()
+        writer.segment_size += len(data)
+        writer.line_count += 1
+
+    def mark_complete(self, run_id: str) -> None:
+        """Close the stream's writer and record completion on disk.
+
+        The marker is written even if the stream has no lines, so followers
+        waiting for a stream that never produced output stop.
+        """
+        self.close(run_id)
+        stream_dir = self._stream_dir(run_id)
+        stream_dir.mkdir(parents=True, exist_ok=True)
+        (stream_dir / COMPLETE_FILE).touch()
+
+    def delete(self, run_id: str) -> None:
+        """Delete all data of a stream."""
+        self.close(run_id)
+        shutil.rmtree(self._stream_dir(run_id), ignore_errors=True)
+
+    def stream_ids(self) -> list[str]:
+        """List the IDs of all streams with data on disk."""
+        return [entry.name for entry in self.logs_dir.iterdir() if entry.is_dir()]
+
+    def close(self, run_id: str) -> None:
+        """Close open file handles for a stream (data stays on disk)."""
+        writer = self._writers.pop(run_id, None)
+        if writer:
+            writer.segment.close()
+            writer.index.close()
+
+    def _open_writer(self, run_id: str) -> _SegmentWriter:
+        stream_dir = self._stream_dir(run_id)
+        stream_dir.mkdir(parents=True, exist_ok=True)
+
+        # Resume an existing stream (e.g. after a restart) at its last segment.
+        line_count = self.line_count(run_id)
+        segments = self._segment_starts(run_id)
+        segment_start = segments[-1] if segments else 0
+        segment_path = stream_dir / _segment_name(segment_start)
+        self._truncate_partial_record(segment_path)
+
+        segment = open(segment_path, "ab")
+        index = open(stream_dir / INDEX_FILE, "ab")
+        # Drop index entries for lines that never made it to disk.
+        expected_entries = -(-line_count // self.index_interval)
+        index.truncate(expected_entries * _INDEX_ENTRY.size)
+        writer = _SegmentWriter(
+            segment_start=segment_start,
+            segment=segment,
+            index=index,
+            segment_size=segment.tell(),
+            line_count=line_count,
+        )
+        self._writers[run_id] = writer
+        return writer
+
+    @staticmethod
+    def _truncate_partial_record(segment_path: Path) -> None:
+        """Drop a trailing record left half-written by a crash."""
+        if not segment_path.exists():
+            return
+        with open(segment_path, "r+b") as f:
+            size = f.seek(0, 2)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            # Walk back to the last complete record.
+            pos = size - 1
+            while pos > 0:
+                step = min(pos, 64 * 1024)
+                f.seek(pos - step)
+                chunk = f.read(step)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    f.truncate(pos - step + newline + 1)
+                    return
+                pos -= step
+            f.truncate(0)
+
+    def _roll_segment(self, run_id: str, writer: _SegmentWriter) -> None:
+        writer.segment.close()
+        writer.segment_start = writer.line_count
+        writer.segment = open(self._stream_dir(run_id) / _segment_name(writer.segment_start), "ab")
+        writer.segment_size = 0
+
+    # ============================================================
+    # Reading
+    # ============================================================
+
+    def line_count(self, run_id: str) -> int:
+        """Get the number of lines stored for a stream."""
+        writer = self._writers.get(run_id)
+        if writer:
+            return writer.line_count
+
+        entries = self._read_index(run_id)
+        if not entries:
+            return 0
+
+        # Start from the last indexed line and count the remainder.
+        last = len(entries) - 1
+        count = last * self.index_interval
+        for _ in self._scan(run_id, entries[last], count, None):
+            count += 1
+        return count
+
+    def read(
+        self,
+        run_id: str,
+        from_line: int = 0,
+        to_line: int | None = None,
+    ) -> list[OutputLine]:
+        """Read lines ``[from_line, to_line)`` from a stream.
+
+        Args:
+            run_id: The run ID.
+            from_line: First line to read (0-based).
+            to_line: Line to stop before. None reads to the end.
+
+        Returns:
+            List of OutputLine objects.
+        """
+        return list(self.iter_lines(run_id, from_line, to_line))
+
+    def iter_lines(
+        self,
+        run_id: str,
+        from_line: int = 0,
+        to_line: int | None = None,
+    ) -> Iterator[OutputLine]:
+        """Lazily iterate lines ``[from_line, to_line)`` from a stream."""
+        if to_line is not None and from_line >= to_line:
+            return
+
+        entries = self._read_index(run_id)
+        slot = from_line // self.index_interval
+        if not entries:
+            return
+        if slot >= len(entries):
+            slot = len(entries) - 1
+
+        line_number = slot * self.index_interval
+        for raw in self._scan(run_id, entries[slot], line_number, to_line):
+            if line_number >= from_line:
+                yield _decode(raw)
+            line_number += 1
+
+    def _read_index(self, run_id: str) -> list[tuple[int, int]]:
+        index_path = self._stream_dir(run_id) / INDEX_FILE
+        try:
+            data = index_path.read_bytes()
+        except FileNotFoundError:
+            return []
+        usable = len(data) - len(data) % _INDEX_ENTRY.size
+        return [entry for entry in _INDEX_ENTRY.iter_unpack(data[:usable])]
+
+    def _segment_starts(self, run_id: str) -> list[int]:
+        stream_dir = self._stream_dir(run_id)
+        if not stream_dir.exists():
+            return []
+        return sorted(
+            int(p.stem) for p in stream_dir.glob(f"*{SEGMENT_SUFFIX}") if p.stem.isdigit()
+        )
+
+    def _scan(
+        self,
+        run_id: str,
+        entry: tuple[int, int],
+        line_number: int,
+        to_line: int | None,
+    ) -> Iterator[bytes]:
+        """Yield raw records starting at an index entry, crossing segment boundaries."""
+        segment_start, offset = entry
+        stream_dir = self._stream_dir(run_id)
+        while True:
+            segment_path = stream_dir / _segment_name(segment_start)
+            try:
+                f = open(segment_path, "rb")
+            except FileNotFoundError:
+                return
+            with f:
+                f.seek(offset)
+                for raw in f:
+                    if to_line is not None and line_number >= to_line:
+                        return
+                    if not raw.endswith(b"\n"):
+                        # Partially written record; stop at the last complete line.
+                        return
+                    yield raw
+                    line_number += 1
+            # Continue into the next segment, which is named after its first line.
+            if (
+                line_number == segment_start
+                or not (stream_dir / _segment_name(line_number)).exists()
+            ):
+                return
+            segment_start, offset = line_number, 0
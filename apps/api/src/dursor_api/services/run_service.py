@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import builtins
+import contextlib
 import logging
 import re
 from collections.abc import Callable, Coroutine
@@ -18,7 +19,7 @@ from typing import TYPE_CHECKING, Any
 from dursor_api.agents.llm_router import LLMConfig, LLMRouter
 from dursor_api.agents.patch_agent import PatchAgent
 from dursor_api.config import settings
-from dursor_api.domain.enums import ExecutorType, RunStatus
+from dursor_api.domain.enums import ExecutorType, PostRunStatus, RunStatus
 from dursor_api.domain.models import (
     SUMMARY_FILE_PATH,
     AgentConstraints,
@@ -26,15 +27,19 @@ from dursor_api.domain.models import (
     FileDiff,
     Run,
     RunCreate,
+    RunFile,
+    RunFilePatch,
+    RunSearchResult,
 )
 from dursor_api.executors.claude_code_executor import ClaudeCodeExecutor, ClaudeCodeOptions
 from dursor_api.executors.codex_executor import CodexExecutor, CodexOptions
 from dursor_api.executors.gemini_executor import GeminiExecutor, GeminiOptions
-from dursor_api.services.commit_message import ensure_english_commit_message
+from dursor_api.services.diff_parser import parse_diff, split_hunks
 from dursor_api.services.git_service import GitService
 from dursor_api.services.model_service import ModelService
+from dursor_api.services.post_run_pipeline import PostRunJob, PostRunPipeline
 from dursor_api.services.repo_service import RepoService
-from dursor_api.storage.dao import RunDAO, TaskDAO, UserPreferencesDAO
+from dursor_api.storage.dao import BacklogDAO, RunDAO, TaskDAO, UserPreferencesDAO
 
 logger = logging.getLogger(__name__)
 
@@ -114,6 +119,8 @@ class RunService:
         user_preferences_dao: UserPreferencesDAO | None = None,
         github_service: GitHubService | None = None,
         output_manager: OutputManager | None = None,
+        backlog_dao: BacklogDAO | None = None,
+        post_run_pipeline: PostRunPipeline | None = None,
     ):
         self.run_dao = run_dao
         self.task_dao = task_dao
@@ -123,8 +130,12 @@ class RunService:
         self.user_preferences_dao = user_preferences_dao
         self.github_service = github_service
         self.output_manager = output_manager
+        self.backlog_dao = backlog_dao
         self.queue = QueueAdapter()
         self.llm_router = LLMRouter()
+        self.post_run_pipeline = post_run_pipeline or PostRunPipeline(
+            run_dao, self.git_service, github_service, self.llm_router
+        )
         self.claude_executor = ClaudeCodeExecutor(
             ClaudeCodeOptions(claude_cli_path=settings.claude_cli_path)
         )
@@ -174,6 +185,7 @@ class RunService:
                 base_ref=data.base_ref or repo.default_branch,
                 executor_type=ExecutorType.CLAUDE_CODE,
                 message_id=data.message_id,
+                sparse_paths=await self._resolve_sparse_paths(task_id, data),
             )
             runs.append(run)
         elif data.executor_type == ExecutorType.CODEX_CLI:
@@ -185,6 +197,7 @@ class RunService:
                 base_ref=data.base_ref or repo.default_branch,
                 executor_type=ExecutorType.CODEX_CLI,
                 message_id=data.message_id,
+                sparse_paths=await self._resolve_sparse_paths(task_id, data),
             )
             runs.append(run)
         elif data.executor_type == ExecutorType.GEMINI_CLI:
@@ -196,6 +209,7 @@ class RunService:
                 base_ref=data.base_ref or repo.default_branch,
                 executor_type=ExecutorType.GEMINI_CLI,
                 message_id=data.message_id,
+                sparse_paths=await self._resolve_sparse_paths(task_id, data),
             )
             runs.append(run)
         else:
@@ -252,6 +266,49 @@ class RunService:
 
         return runs
 
+    async def _resolve_sparse_paths(
+        self, task_id: str, data: RunCreate
+    ) -> builtins.list[str] | None:
+        """Get the paths to seed a sparse worktree with, if one was requested.
+
+        Args:
+            task_id: Task ID.
+            data: Run creation data.
+
+        Returns:
+            Explicit sparse paths, the target files of the task's backlog item,
+            or None for a full checkout.
+        """
+        if data.sparse_paths:
+            return data.sparse_paths
+        if not data.sparse_checkout or not self.backlog_dao:
+            return None
+        item = await self.backlog_dao.get_by_task(task_id)
+        if not item or not item.target_files:
+            logger.info(f"No target files for task {task_id}; using a full worktree")
+            return None
+        return item.target_files
+
+    async def expand_sparse_checkout(
+        self, run_id: str, paths: builtins.list[str] | None
+    ) -> builtins.list[str] | None:
+        """Widen a run's sparse worktree, or turn it into a full checkout.
+
+        Args:
+            run_id: Run ID.
+            paths: Files or directories to add; None checks out the full tree.
+
+        Returns:
+            The resulting cone directories, or None for a full checkout.
+
+        Raises:
+            ValueError: If the run or its worktree is not found.
+        """
+        run = await self.run_dao.get(run_id)
+        if not run or not run.worktree_path:
+            raise ValueError(f"Run worktree not found: {run_id}")
+        return await self.git_service.expand_sparse_checkout(Path(run.worktree_path), paths)
+
     async def _create_cli_run(
         self,
         task_id: str,
@@ -260,6 +317,7 @@ class RunService:
         base_ref: str,
         executor_type: ExecutorType,
         message_id: str | None = None,
+        sparse_paths: builtins.list[str] | None = None,
     ) -> Run:
         """Create and start a CLI-based run (Claude Code, Codex, or Gemini).
 
@@ -274,6 +332,8 @@ class RunService:
             base_ref: Base branch to work from.
             executor_type: Type of CLI executor to use.
             message_id: ID of the triggering message.
+            sparse_paths: Files/directories for a sparse worktree (only used
+                when a new worktree is created).
 
         Returns:
             Created Run object.
@@ -293,31 +353,48 @@ class RunService:
             executor_type=executor_type,
         )
 
-        worktree_info = None
-
-        if existing_run and existing_run.worktree_path:
-            # Verify worktree is still valid (exists and is a valid git repo)
-            worktree_path = Path(existing_run.worktree_path)
-            if await self.git_service.is_valid_worktree(worktree_path):
-                # If we're working from the repo's default branch, ensure the existing worktree
-                # still contains the latest origin/<default>. Otherwise, create a fresh worktree
-                # from the latest default to avoid PRs being based on a stale main.
-                should_check_default = (base_ref == repo.default_branch) and bool(
-                    repo.default_branch
-                )
-                if should_check_default:
-                    default_ref = f"origin/{repo.default_branch}"
-                    up_to_date = await self.git_service.is_ancestor(
-                        repo_path=worktree_path,
-                        ancestor=default_ref,
-                        descendant="HEAD",
+        # Held from the reuse decision until the run records the worktree, so
+        # worktree GC cannot remove a worktree that is about to be reused.
+        reuse_lock = (
+            self.git_service.worktree_lock(Path(existing_run.worktree_path))
+            if existing_run and existing_run.worktree_path
+            else contextlib.nullcontext()
+        )
+        async with reuse_lock:
+            worktree_info = None
+
+            if existing_run and existing_run.worktree_path:
+                # Verify worktree is still valid (exists and is a valid git repo)
+                worktree_path = Path(existing_run.worktree_path)
+                if await self.git_service.is_valid_worktree(worktree_path):
+                    # If we're working from the repo's default branch, ensure the existing worktree
+                    # still contains the latest origin/<default>. Otherwise, create a fresh worktree
+                    # from the latest default to avoid PRs being based on a stale main.
+                    should_check_default = (base_ref == repo.default_branch) and bool(
+                        repo.default_branch
                     )
-                    if not up_to_date:
-                        logger.info(
-                            "Existing worktree is behind latest default; creating a new worktree "
-                            f"(worktree={worktree_path}, default={default_ref})"
+                    if should_check_default:
+                        default_ref = f"origin/{repo.default_branch}"
+                        up_to_date = await self.git_service.is_ancestor(
+                            repo_path=worktree_path,
+                            ancestor=default_ref,
+                            descendant="HEAD",
                         )
+                        if not up_to_date:
+                            logger.info(
+                                "Existing worktree is behind latest default; creating a new "
+                                f"worktree (worktree={worktree_path}, default={default_ref})"
+                            )
+                        else:
+                            worktree_info = WorktreeInfo(
+                                path=worktree_path,
+                                branch_name=existing_run.working_branch or "",
+                                base_branch=existing_run.base_ref or base_ref,
+                                created_at=existing_run.created_at,
+                            )
+                            logger.info(f"Reusing existing worktree: {worktree_path}")
                     else:
+                        # Reuse existing worktree (no default-base freshness check)
                         worktree_info = WorktreeInfo(
                             path=worktree_path,
                             branch_name=existing_run.working_branch or "",
@@ -326,47 +403,39 @@ class RunService:
                         )
                         logger.info(f"Reusing existing worktree: {worktree_path}")
                 else:
-                    # Reuse existing worktree (no default-base freshness check)
-                    worktree_info = WorktreeInfo(
-                        path=worktree_path,
-                        branch_name=existing_run.working_branch or "",
-                        base_branch=existing_run.base_ref or base_ref,
-                        created_at=existing_run.created_at,
-                    )
-                    logger.info(f"Reusing existing worktree: {worktree_path}")
-            else:
-                logger.warning(f"Worktree invalid or broken, will create new: {worktree_path}")
+                    logger.warning(f"Worktree invalid or broken, will create new: {worktree_path}")
 
-        # Create the run record
-        run = await self.run_dao.create(
-            task_id=task_id,
-            instruction=instruction,
-            executor_type=executor_type,
-            message_id=message_id,
-            base_ref=base_ref,
-        )
+            # Create the run record
+            run = await self.run_dao.create(
+                task_id=task_id,
+                instruction=instruction,
+                executor_type=executor_type,
+                message_id=message_id,
+                base_ref=base_ref,
+            )
 
-        if not worktree_info:
-            branch_prefix: str | None = None
-            if self.user_preferences_dao:
-                prefs = await self.user_preferences_dao.get()
-                branch_prefix = prefs.default_branch_prefix if prefs else None
+            if not worktree_info:
+                branch_prefix: str | None = None
+                if self.user_preferences_dao:
+                    prefs = await self.user_preferences_dao.get()
+                    branch_prefix = prefs.default_branch_prefix if prefs else None
+
+                # Create new worktree for this run
+                worktree_info = await self.git_service.create_worktree(
+                    repo=repo,
+                    base_branch=base_ref,
+                    run_id=run.id,
+                    branch_prefix=branch_prefix,
+                    sparse_paths=sparse_paths,
+                )
 
-            # Create new worktree for this run
-            worktree_info = await self.git_service.create_worktree(
-                repo=repo,
-                base_branch=base_ref,
-                run_id=run.id,
-                branch_prefix=branch_prefix,
+            # Update run with worktree info
+            await self.run_dao.update_worktree(
+                run.id,
+                working_branch=worktree_info.branch_name,
+                worktree_path=str(worktree_info.path),
             )
 
-        # Update run with worktree info
-        await self.run_dao.update_worktree(
-            run.id,
-            working_branch=worktree_info.branch_name,
-            worktree_path=str(worktree_info.path),
-        )
-
         # Update the run object with new info
         updated_run = await self.run_dao.get(run.id)
         if not updated_run:
@@ -407,6 +476,139 @@ class RunService:
         """
         return await self.run_dao.list(task_id)
 
+    async def search(
+        self,
+        query: str,
+        repo_id: str | None = None,
+        task_id: str | None = None,
+        executor_type: ExecutorType | None = None,
+        status: RunStatus | None = None,
+        limit: int = 50,
+    ) -> builtins.list[RunSearchResult]:
+        """Search runs by instruction, summary, error, logs and changed files.
+
+        Args:
+            query: Free-text query.
+            repo_id: Optional repository filter.
+            task_id: Optional task filter.
+            executor_type: Optional executor type filter.
+            status: Optional run status filter.
+            limit: Maximum number of results.
+
+        Returns:
+            Matching runs, best match first.
+        """
+        return await self.run_dao.search(
+            query,
+            repo_id=repo_id,
+            task_id=task_id,
+            executor_type=executor_type,
+            status=status,
+            limit=limit,
+        )
+
+    async def list_files(self, run_id: str) -> builtins.list[RunFile] | None:
+        """List per-file change stats of a run.
+
+        Runs stored before per-file patches existed are split from
+        ``run.patch`` on first access, which moves the patch into the rows.
+
+        Args:
+            run_id: Run ID.
+
+        Returns:
+            List of RunFile objects, or None if the run does not exist.
+        """
+        files = await self.run_dao.list_files(run_id)
+        if files:
+            return files
+        if not await self.run_dao.exists(run_id):
+            return None
+        patch = await self.run_dao.get_patch(run_id)
+        if patch:
+            await self.run_dao.replace_file_diffs(run_id, parse_diff(patch))
+            files = await self.run_dao.list_files(run_id)
+        return files
+
+    async def get_file_patch(
+        self,
+        run_id: str,
+        path: str,
+        hunk_start: int = 0,
+        hunk_limit: int | None = None,
+    ) -> RunFilePatch | None:
+        """Get one file's patch from a run, optionally a range of its hunks.
+
+        Args:
+            run_id: Run ID.
+            path: File path (new path for renames).
+            hunk_start: Index of the first hunk to return.
+            hunk_limit: Maximum number of hunks to return (None for all).
+
+        Returns:
+            RunFilePatch, or None if the run or file does not exist.
+        """
+        file_diff = await self.run_dao.get_file_diff(run_id, path)
+        if file_diff is None and await self.list_files(run_id):
+            file_diff = await self.run_dao.get_file_diff(run_id, path)
+        if file_diff is None:
+            return None
+        if not file_diff.patch:
+            file_diff.patch = await self._load_file_patch(run_id, file_diff)
+
+        header, hunks = split_hunks(file_diff.patch)
+        end = len(hunks) if hunk_limit is None else hunk_start + hunk_limit
+        return RunFilePatch(
+            path=file_diff.path,
+            old_path=file_diff.old_path,
+            header=header,
+            hunks=hunks[hunk_start:end],
+            hunk_start=hunk_start,
+            hunk_count=len(hunks),
+        )
+
+    async def _load_file_patch(self, run_id: str, file_diff: FileDiff) -> str:
+        """Load the patch of a CLI run's file from git.
+
+        The patch is taken from the run's commit and stored, or, while the
+        commit is still pending, from the worktree's index.
+
+        Args:
+            run_id: Run ID.
+            file_diff: Stored stats of the file.
+
+        Returns:
+            Unified diff string for the file (empty if it is unavailable).
+        """
+        run = await self.run_dao.get(run_id)
+        if not run:
+            return ""
+        worktree = Path(run.worktree_path) if run.worktree_path else None
+        if worktree is not None and not worktree.exists():
+            worktree = None
+
+        if not run.commit_sha:
+            if worktree is None:
+                return ""
+            return await self.git_service.get_file_diff(
+                worktree, file_diff.path, old_path=file_diff.old_path
+            )
+
+        # The worktree may be gone; the workspace shares its objects.
+        source = worktree
+        if source is None:
+            task = await self.task_dao.get(run.task_id)
+            repo = await self.repo_service.get(task.repo_id) if task else None
+            if not repo:
+                return ""
+            source = Path(repo.workspace_path)
+        patch = await self.git_service.get_file_diff(
+            source, file_diff.path, old_path=file_diff.old_path, commit=run.commit_sha
+        )
+        if patch:
+            await self.run_dao.set_file_patch(run_id, file_diff.path, patch)
+        return patch
+
     async def cancel(self, run_id: str) -> bool:
         """Cancel a run.
 
@@ -501,13 +703,17 @@ class RunService:
 
                 result = await agent.run(request)
 
+                # Store per-file patches; the run record keeps stats only
+                await self.run_dao.replace_file_diffs(run.id, result.files_changed)
+
                 # Update run with results
                 await self.run_dao.update_status(
                     run.id,
                     RunStatus.SUCCEEDED,
                     summary=result.summary,
-                    patch=result.patch,
-                    files_changed=result.files_changed,
+                    files_changed=[
+                        f.model_copy(update={"patch": ""}) for f in result.files_changed
+                    ],
                     logs=result.logs,
                     warnings=result.warnings,
                 )
@@ -525,6 +731,52 @@ class RunService:
                 logs=[f"Execution failed: {str(e)}"],
             )
 
+    async def resume_post_run_stages(self) -> int:
+        """Resubmit post-run stages interrupted by a restart.
+
+        Stages left pending or running are started again; runs whose
+        worktree no longer exists are marked failed.
+
+        Returns:
+            Number of runs resubmitted.
+        """
+        resumed = 0
+        for run, repo_url in await self.run_dao.list_pending_post_run():
+            if not run.worktree_path or not Path(run.worktree_path).exists():
+                await self.run_dao.update_post_run(
+                    run.id,
+                    commit_status=(
+                        PostRunStatus.FAILED
+                        if run.commit_status != PostRunStatus.SUCCEEDED
+                        else None
+                    ),
+                    push_status=PostRunStatus.SKIPPED,
+                    post_run_error="Worktree no longer exists",
+                )
+                continue
+            github_repo = None
+            if self.github_service:
+                try:
+                    github_repo = self._parse_github_url(repo_url)
+                except ValueError:
+                    pass
+            committed = run.commit_status == PostRunStatus.SUCCEEDED and run.commit_sha
+            self.post_run_pipeline.submit(
+                PostRunJob(
+                    run_id=run.id,
+                    worktree_path=Path(run.worktree_path),
+                    branch=run.working_branch or "",
+                    commit_message=self._generate_commit_message(run.instruction, run.summary),
+                    summary=run.summary or "",
+                    github_repo=github_repo if run.push_status != PostRunStatus.SKIPPED else None,
+                    commit_sha=run.commit_sha if committed else None,
+                )
+            )
+            resumed += 1
+        if resumed:
+            logger.info(f"Resumed post-run stages of {resumed} run(s)")
+        return resumed
+
     async def _execute_cli_run(
         self,
         run: Run,
@@ -539,9 +791,8 @@ class RunService:
         1. Execute CLI (file editing only)
         2. Stage all changes
         3. Get patch
-        4. Commit (automatic)
-        5. Push (automatic)
-        6. Save results
+        4. Save results (the run is succeeded from here on)
+        5. Commit and push in the background (PostRunPipeline)
 
         Args:
             run: Run object.
@@ -551,7 +802,6 @@ class RunService:
             repo: Repository object for push operations.
         """
         logs: list[str] = []
-        commit_sha: str | None = None
 
         # Map executor types to their executors and names
         executor_map: dict[
@@ -569,8 +819,13 @@ class RunService:
             await self.run_dao.update_status(run.id, RunStatus.RUNNING)
             logger.info(f"[{run.id[:8]}] Starting {executor_name} run")
 
+            # Don't let a previous run's pending commit pick up this run's edits
+            await self.post_run_pipeline.wait_for_worktree(worktree_info.path)
+
             # 1. Record pre-execution status
-            pre_status = await self.git_service.get_status(worktree_info.path)
+            pre_status = await self.git_service.get_status(
+                worktree_info.path, untracked_files="normal"
+            )
             logs.append(f"Pre-execution status: {pre_status.has_changes} changes")
 
             logs.append(f"Starting {executor_name} execution in {worktree_info.path}")
@@ -621,7 +876,8 @@ class RunService:
                     run.id,
                     RunStatus.FAILED,
                     error=result.error,
-                    logs=logs + result.logs,
+                    logs=self._persisted_logs(logs, result.logs),
+                    search_logs=logs + result.logs,
                     session_id=result.session_id or resume_session_id,
                 )
                 return
@@ -632,11 +888,12 @@ class RunService:
             # 5. Stage all changes
             await self.git_service.stage_all(worktree_info.path)
 
-            # 6. Get patch
-            patch = await self.git_service.get_diff(worktree_info.path, staged=True)
+            # 6. Get per-file stats (cheap). Patches are loaded per file when
+            # first viewed, from the run's commit (see get_file_patch).
+            files_changed = await self.git_service.get_changes(worktree_info.path, staged=True)
 
             # Skip commit/push if no changes
-            if not patch.strip():
+            if not files_changed:
                 logs.append("No changes detected, skipping commit/push")
                 await self.run_dao.update_status(
                     run.id,
@@ -644,13 +901,12 @@ class RunService:
                     summary="No changes made",
                     patch="",
                     files_changed=[],
-                    logs=logs + result.logs,
+                    logs=self._persisted_logs(logs, result.logs),
+                    search_logs=logs + result.logs,
                     session_id=result.session_id or resume_session_id,
                 )
                 return
 
-            # Parse diff to get file changes
-            files_changed = self._parse_diff(patch)
             logs.append(f"Detected {len(files_changed)} changed file(s)")
 
             # Determine final summary (priority: file > CLI output > generated)
@@ -658,45 +914,32 @@ class RunService:
                 summary_from_file or result.summary or self._generate_summary(files_changed)
             )
 
-            # 7. Commit (automatic)
-            commit_message = self._generate_commit_message(run.instruction, final_summary)
-            commit_message = await ensure_english_commit_message(
-                commit_message,
-                llm_router=self.llm_router,
-                hint=final_summary or "",
-            )
-            commit_sha = await self.git_service.commit(
-                worktree_info.path,
-                message=commit_message,
-            )
-            logs.append(f"Committed: {commit_sha[:8]}")
-
-            # 8. Push (automatic) - only if we have GitHub service configured
-            if self.github_service and repo:
-                try:
-                    owner, repo_name = self._parse_github_url(repo.repo_url)
-                    auth_url = await self.github_service.get_auth_url(owner, repo_name)
-                    await self.git_service.push(
-                        worktree_info.path,
-                        branch=worktree_info.branch_name,
-                        auth_url=auth_url,
-                    )
-                    logs.append(f"Pushed to branch: {worktree_info.branch_name}")
-                except Exception as push_error:
-                    logs.append(f"Push failed (will retry on PR creation): {push_error}")
-                    # Continue without failing - push can be retried during PR creation
-
-            # 9. Save results
+            # 7. Save results, then queue the background commit and push.
+            # The pending stage statuses are written with SUCCEEDED, before the
+            # job exists, so every status the job writes comes after them.
+            await self.run_dao.replace_file_diffs(run.id, files_changed)
+            github_repo = self._github_repo(repo)
             await self.run_dao.update_status(
                 run.id,
                 RunStatus.SUCCEEDED,
                 summary=final_summary,
-                patch=patch,
                 files_changed=files_changed,
-                logs=logs + result.logs,
+                logs=self._persisted_logs(logs, result.logs),
+                search_logs=logs + result.logs,
                 warnings=result.warnings,
                 session_id=result.session_id or resume_session_id,
-                commit_sha=commit_sha,
+                commit_status=PostRunStatus.PENDING,
+                push_status=PostRunStatus.PENDING if github_repo else PostRunStatus.SKIPPED,
+            )
+            self.post_run_pipeline.submit(
+                PostRunJob(
+                    run_id=run.id,
+                    worktree_path=worktree_info.path,
+                    branch=worktree_info.branch_name,
+                    commit_message=self._generate_commit_message(run.instruction, final_summary),
+                    summary=final_summary or "",
+                    github_repo=github_repo,
+                )
             )
 
         except Exception as e:
@@ -706,7 +949,6 @@ class RunService:
                 RunStatus.FAILED,
                 error=str(e),
                 logs=logs + [f"Execution failed: {str(e)}"],
-                commit_sha=commit_sha,
             )
 
         finally:
@@ -752,6 +994,28 @@ class RunService:
 
         return summary
 
+    def _persisted_logs(
+        self,
+        logs: builtins.list[str],
+        cli_logs: builtins.list[str],
+    ) -> builtins.list[str]:
+        """Build the log list stored on the run record.
+
+        When an OutputManager is available, CLI output has already been written
+        line by line to its on-disk log store, so only orchestration logs are
+        stored on the run instead of re-serializing the whole CLI transcript.
+
+        Args:
+            logs: Orchestration logs collected by RunService.
+            cli_logs: Raw output collected by the executor.
+
+        Returns:
+            Logs to persist in the runs table.
+        """
+        if self.output_manager:
+            return logs
+        return logs + cli_logs
+
     async def _log_output(self, run_id: str, line: str) -> None:
         """Log output from CLI execution.
 
@@ -788,68 +1052,14 @@ class RunService:
             return f"{first_line}\n\n{summary}"
         return first_line
 
-    def _parse_diff(self, diff: str) -> builtins.list[FileDiff]:
-        """Parse unified diff to extract file change information.
-
-        Args:
-            diff: Unified diff string.
-
-        Returns:
-            List of FileDiff objects.
-        """
-        files: builtins.list[FileDiff] = []
-        current_file: str | None = None
-        current_patch_lines: builtins.list[str] = []
-        added_lines = 0
-        removed_lines = 0
-
-        for line in diff.split("\n"):
-            if line.startswith("--- a/"):
-                # Save previous file if exists
-                if current_file:
-                    files.append(
-                        FileDiff(
-                            path=current_file,
-                            added_lines=added_lines,
-                            removed_lines=removed_lines,
-                            patch="\n".join(current_patch_lines),
-                        )
-                    )
-                # Reset for new file
-                current_patch_lines = [line]
-                added_lines = 0
-                removed_lines = 0
-            elif line.startswith("+++ b/"):
-                current_file = line[6:]
-                current_patch_lines.append(line)
-            elif line.startswith("--- /dev/null"):
-                # New file
-                current_patch_lines = [line]
-                added_lines = 0
-                removed_lines = 0
-            elif line.startswith("+++ b/") and current_file is None:
-                # New file path
-                current_file = line[6:]
-                current_patch_lines.append(line)
-            elif current_file:
-                current_patch_lines.append(line)
-                if line.startswith("+") and not line.startswith("+++"):
-                    added_lines += 1
-                elif line.startswith("-") and not line.startswith("---"):
-                    removed_lines += 1
-
-        # Save last file
-        if current_file:
-            files.append(
-                FileDiff(
-                    path=current_file,
-                    added_lines=added_lines,
-                    removed_lines=removed_lines,
-                    patch="\n".join(current_patch_lines),
-                )
-            )
-
-        return files
+    def _github_repo(self, repo: Any) -> tuple[str, str] | None:
+        """Get the (owner, repo) to push a run's branch to, if pushing is possible."""
+        if not self.github_service or not repo:
+            return None
+        try:
+            return self._parse_github_url(repo.repo_url)
+        except ValueError:
+            return None
 
     def _parse_github_url(self, repo_url: str) -> tuple[str, str]:
         """Parse GitHub URL to extract owner and repo name.
@@ -0,0 +1,76 @@
+"""Direct LLM calls for short texts: PR titles/descriptions and commit messages.
+
+Turning a diff into a few paragraphs does not need an agent: a single API call
+through LLMRouter takes seconds, while an agent CLI pays for startup, tool
+loops and a session, and occupies an executor. Callers use this path first
+and fall back to the CLI executor when it is unavailable (no model or API key
+configured) or fails.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+
+from dursor_api.agents.llm_router import LLMConfig, LLMRouter
+from dursor_api.config import settings
+from dursor_api.domain.enums import Provider
+
+logger = logging.getLogger(__name__)
+
+_API_KEY_ENV = {
+    Provider.ANTHROPIC: "ANTHROPIC_API_KEY",
+    Provider.OPENAI: "OPENAI_API_KEY",
+    Provider.GOOGLE: "GEMINI_API_KEY",
+}
+
+DEFAULT_SYSTEM_PROMPT = (
+    "You write git commit messages and pull request titles and descriptions "
+    "from task descriptions and diffs. Output only the requested text, "
+    "without commentary or surrounding code fences."
+)
+
+
+def text_model_config() -> LLMConfig | None:
+    """Get the configured text model.
+
+    Returns:
+        LLM configuration, or None if no model is configured or its
+        provider's API key is not set.
+    """
+    if not settings.text_model_name:
+        return None
+    provider = Provider(settings.text_model_provider)
+    api_key = os.environ.get(_API_KEY_ENV[provider], "")
+    if not api_key:
+        return None
+    return LLMConfig(provider=provider, model_name=settings.text_model_name, api_key=api_key)
+
+
+async def generate_text(
+    prompt: str,
+    *,
+    llm_router: LLMRouter,
+    system: str = DEFAULT_SYSTEM_PROMPT,
+) -> str | None:
+    """Generate text with the configured text model.
+
+    Args:
+        prompt: User prompt.
+        llm_router: Shared LLMRouter (clients are cached per model).
+        system: System prompt.
+
+    Returns:
+        Generated text, or None if the model is unavailable, the call failed
+        or the response was empty.
+    """
+    config = text_model_config()
+    if config is None:
+        return None
+    try:
+        client = llm_router.get_client(config)
+        text = await client.generate(messages=[{"role": "user", "content": prompt}], system=system)
+    except Exception as e:
+        logger.warning(f"Text generation with {config.model_name} failed: {e}")
+        return None
+    return text.strip() or None
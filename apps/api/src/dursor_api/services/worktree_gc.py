@@ -0,0 +1,312 @@
+"""Garbage collection of run worktrees.
+
+Worktrees are created per run under ``<workspaces_dir>/worktrees`` and reused
+by later runs of the same task. WorktreeGC reconciles that directory with the
+``runs`` table and removes:
+
+- worktrees that no run references (left behind by crashes or deleted rows),
+- worktrees of archived tasks and of tasks whose PR was merged,
+- worktrees whose runs have been idle longer than ``max_age``,
+- least recently used worktrees while a repository (or all repositories
+  together) is over its disk quota.
+
+Worktrees with a queued or running run are never removed, nor are worktrees
+holding changes that are not committed yet: a succeeded run's changes stay
+staged in its worktree until its background commit stage succeeds (or, if it
+failed, until the user deals with it). Branches are kept,
+so a removed worktree is simply recreated if the task is resumed. Every pass
+ends with ``git worktree prune`` in each workspace.
+
+The same pass removes output logs (RunLogStore) that no run references, e.g.
+of deleted runs and tasks or of past breakdowns, once they have been complete
+for ``orphan_log_grace``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from dursor_api.domain.enums import PostRunStatus, RunStatus, TaskKanbanStatus
+from dursor_api.domain.models import RunWorktree
+from dursor_api.services.git_service import GitService
+from dursor_api.services.output_manager import OutputManager
+from dursor_api.services.post_run_pipeline import PostRunPipeline
+from dursor_api.storage.dao import RepoDAO, RunDAO
+
+logger = logging.getLogger(__name__)
+
+_ACTIVE_STATUSES = (RunStatus.QUEUED, RunStatus.RUNNING)
+
+# Commit stage states in which the run's changes exist only in its worktree
+_UNCOMMITTED_STATUSES = (PostRunStatus.PENDING, PostRunStatus.RUNNING, PostRunStatus.FAILED)
+
+
+@dataclass
+class WorktreeGCResult:
+    """Outcome of one garbage collection pass."""
+
+    removed: list[Path] = field(default_factory=list)
+    freed_bytes: int = 0
+    total_bytes: int = 0  # Disk usage of the remaining worktrees
+    removed_logs: list[str] = field(default_factory=list)  # Stream IDs
+
+
+@dataclass
+class _Worktree:
+    """A worktree on disk, joined with the runs that use it."""
+
+    path: Path
+    size: int
+    mtime: float
+    repo_id: str | None = None
+    active: bool = False
+    retired: bool = False  # Task archived or PR merged
+    last_active_at: datetime | None = None
+
+
+class WorktreeGC:
+    """Removes abandoned run worktrees and enforces disk quotas."""
+
+    def __init__(
+        self,
+        run_dao: RunDAO,
+        repo_dao: RepoDAO,
+        git_service: GitService,
+        max_age: timedelta | None = None,
+        quota_per_repo_bytes: int = 0,
+        quota_total_bytes: int = 0,
+        orphan_grace: timedelta = timedelta(minutes=30),
+        output_manager: OutputManager | None = None,
+        orphan_log_grace: timedelta = timedelta(days=1),
+        post_run_pipeline: PostRunPipeline | None = None,
+    ):
+        """Initialize WorktreeGC.
+
+        Args:
+            run_dao: Run DAO.
+            repo_dao: Repo DAO.
+            git_service: Git service owning the worktrees directory.
+            max_age: Remove worktrees idle for longer than this (None: keep).
+            quota_per_repo_bytes: Disk quota per repository (0: unlimited).
+            quota_total_bytes: Disk quota for all worktrees (0: unlimited).
+            orphan_grace: Unreferenced worktrees younger than this are kept,
+                as a run may be between creating its worktree and recording it.
+            output_manager: Output manager whose unreferenced logs are removed
+                (None: logs are kept).
+            orphan_log_grace: How long unreferenced logs are kept after their
+                stream completed.
+            post_run_pipeline: Pipeline whose in-flight runs keep their worktrees.
+        """
+        self.run_dao = run_dao
+        self.repo_dao = repo_dao
+        self.git_service = git_service
+        self.max_age = max_age
+        self.quota_per_repo_bytes = quota_per_repo_bytes
+        self.quota_total_bytes = quota_total_bytes
+        self.orphan_grace = orphan_grace
+        self.output_manager = output_manager
+        self.orphan_log_grace = orphan_log_grace
+        self.post_run_pipeline = post_run_pipeline
+
+    async def collect(self) -> WorktreeGCResult:
+        """Run one garbage collection pass.
+
+        Returns:
+            What was removed and how much disk the remaining worktrees use.
+        """
+        loop = asyncio.get_event_loop()
+        on_disk = await loop.run_in_executor(None, self._scan)
+        for run in await self.run_dao.list_worktrees():
+            worktree = on_disk.get(os.path.normpath(run.worktree_path))
+            if worktree is None:
+                continue
+            worktree.repo_id = run.repo_id
+            worktree.active |= self._is_active(run)
+            worktree.retired |= (
+                run.task_kanban_status == TaskKanbanStatus.ARCHIVED.value
+                or run.pr_status == "merged"
+            )
+            if worktree.last_active_at is None or run.last_active_at > worktree.last_active_at:
+                worktree.last_active_at = run.last_active_at
+
+        result = WorktreeGCResult()
+        remaining: list[_Worktree] = []
+        for worktree in on_disk.values():
+            reason = self._removal_reason(worktree)
+            if not reason or not await self._remove(worktree, reason, result):
+                remaining.append(worktree)
+
+        remaining = await self._enforce_quotas(remaining, result)
+        result.total_bytes = sum(w.size for w in remaining)
+
+        for repo in await self.repo_dao.list():
+            if Path(repo.workspace_path).exists():
+                await self.git_service.prune_worktrees(Path(repo.workspace_path))
+
+        await self._remove_orphaned_logs(result)
+
+        if result.removed:
+            logger.info(
+                f"Worktree GC removed {len(result.removed)} worktrees, "
+                f"freed {result.freed_bytes / 1024**2:.1f} MiB, "
+                f"{result.total_bytes / 1024**2:.1f} MiB remain"
+            )
+        return result
+
+    async def run_gc_loop(self, interval: float) -> None:
+        """Run garbage collection periodically until cancelled.
+
+        Intended to be started as a background task from the app lifespan.
+
+        Args:
+            interval: Seconds between passes.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.collect()
+            except Exception:
+                logger.exception("Worktree GC failed")
+
+    def _is_active(self, run: RunWorktree) -> bool:
+        """Check whether a run keeps its worktree from being removed."""
+        return (
+            run.status in _ACTIVE_STATUSES
+            or run.commit_status in _UNCOMMITTED_STATUSES
+            or (
+                self.post_run_pipeline is not None and self.post_run_pipeline.is_pending(run.run_id)
+            )
+        )
+
+    def _removal_reason(self, worktree: _Worktree) -> str | None:
+        """Decide whether a worktree is removed regardless of quotas."""
+        if worktree.active:
+            return None
+        if worktree.repo_id is None:
+            age = time.time() - worktree.mtime
+            return "orphaned" if age > self.orphan_grace.total_seconds() else None
+        if worktree.retired:
+            return "task archived or merged"
+        if self.max_age and worktree.last_active_at:
+            if datetime.utcnow() - worktree.last_active_at > self.max_age:
+                return "stale"
+        return None
+
+    async def _enforce_quotas(
+        self, worktrees: list[_Worktree], result: WorktreeGCResult
+    ) -> list[_Worktree]:
+        """Remove least recently used worktrees until all quotas are met.
+
+        Returns:
+            The worktrees that were kept.
+        """
+        # Oldest first; active and not yet recorded worktrees are never candidates.
+        lru = sorted(
+            (w for w in worktrees if not w.active and w.repo_id is not None),
+            key=lambda w: w.last_active_at or datetime.min,
+        )
+        kept = list(worktrees)
+
+        if self.quota_per_repo_bytes:
+            usage: dict[str | None, int] = {}
+            for worktree in kept:
+                usage[worktree.repo_id] = usage.get(worktree.repo_id, 0) + worktree.size
+            for worktree in list(lru):
+                if usage[worktree.repo_id] <= self.quota_per_repo_bytes:
+                    continue
+                if not await self._remove(worktree, "over repository quota", result):
+                    continue
+                usage[worktree.repo_id] -= worktree.size
+                kept.remove(worktree)
+                lru.remove(worktree)
+
+        if self.quota_total_bytes:
+            total = sum(w.size for w in kept)
+            for worktree in lru:
+                if total <= self.quota_total_bytes:
+                    break
+                if not await self._remove(worktree, "over total quota", result):
+                    continue
+                total -= worktree.size
+                kept.remove(worktree)
+
+        return kept
+
+    async def _remove_orphaned_logs(self, result: WorktreeGCResult) -> None:
+        """Remove complete output logs that no run references."""
+        if self.output_manager is None:
+            return
+        log_store = self.output_manager.log_store
+        loop = asyncio.get_event_loop()
+        stream_ids = await loop.run_in_executor(None, log_store.stream_ids)
+        unreferenced = set(stream_ids) - await self.run_dao.existing_ids(stream_ids)
+        cutoff = time.time() - self.orphan_log_grace.total_seconds()
+        for stream_id in sorted(unreferenced):
+            completed_at = log_store.completed_at(stream_id)
+            if completed_at is not None and completed_at < cutoff:
+                await self.output_manager.delete_stream(stream_id)
+                result.removed_logs.append(stream_id)
+        if result.removed_logs:
+            logger.info(f"Worktree GC removed {len(result.removed_logs)} unreferenced logs")
+
+    async def _remove(self, worktree: _Worktree, reason: str, result: WorktreeGCResult) -> bool:
+        """Remove a worktree unless a run started using it since the scan.
+
+        Returns:
+            True if the worktree was removed.
+        """
+        async with self.git_service.worktree_lock(worktree.path):
+            path = os.path.normpath(worktree.path)
+            for run in await self.run_dao.list_worktrees():
+                if os.path.normpath(run.worktree_path) == path and self._is_active(run):
+                    logger.info(f"Keeping worktree {worktree.path}: run {run.run_id} uses it")
+                    return False
+            logger.info(f"Removing worktree {worktree.path} ({reason})")
+            await self.git_service.cleanup_worktree(worktree.path, delete_branch=False)
+        result.removed.append(worktree.path)
+        result.freed_bytes += worktree.size
+        return True
+
+    def _scan(self) -> dict[str, _Worktree]:
+        """Find worktree directories and measure their disk usage."""
+        worktrees: dict[str, _Worktree] = {}
+        root = self.git_service.worktrees_dir
+        if not root.exists():
+            return worktrees
+        for entry in os.scandir(root):
+            if entry.is_dir(follow_symlinks=False):
+                path = os.path.normpath(entry.path)
+                worktrees[path] = _Worktree(
+                    path=Path(path),
+                    size=_disk_usage(path),
+                    mtime=entry.stat(follow_symlinks=False).st_mtime,
+                )
+        return worktrees
+
+
+def _disk_usage(path: str) -> int:
+    """Get the disk usage of a directory tree in bytes (symlinks not followed)."""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            entries = list(os.scandir(stack.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            blocks = getattr(stat, "st_blocks", None)
+            total += blocks * 512 if blocks is not None else stat.st_size
+    return total
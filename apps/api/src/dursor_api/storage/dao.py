@@ -5,6 +5,7 @@ from __future__ import annotations
 import builtins
 import json
 import uuid
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
@@ -13,7 +14,9 @@ from dursor_api.domain.enums import (
     BrokenDownTaskType,
     EstimatedSize,
     ExecutorType,
+    FileChangeType,
     MessageRole,
+    PostRunStatus,
     PRCreationMode,
     Provider,
     RunStatus,
@@ -25,14 +28,21 @@ from dursor_api.domain.models import (
     FileDiff,
     Message,
     ModelProfile,
+    PRDraft,
     Repo,
     Run,
+    RunFile,
+    RunSearchResult,
+    RunWorktree,
     SubTask,
     Task,
     UserPreferences,
 )
 from dursor_api.storage.db import Database
 
+# Columns of runs_fts and of the runs_search view it indexes
+_RUN_SEARCH_COLUMNS = "instruction, summary, error, logs, files"
+
 
 def generate_id() -> str:
     """Generate a unique ID."""
@@ -44,6 +54,30 @@ def now_iso() -> str:
     return datetime.utcnow().isoformat()
 
 
+def to_fts_query(query: str) -> str:
+    """Convert free text into a safe FTS5 MATCH expression.
+
+    Every whitespace-separated term is quoted so punctuation in paths or error
+    messages is never parsed as FTS5 syntax; a trailing ``*`` keeps prefix
+    matching. Terms are ANDed together.
+
+    Args:
+        query: User-supplied search text.
+
+    Returns:
+        FTS5 query string (empty if the query has no terms).
+    """
+    terms = []
+    for term in query.split():
+        prefix = term.endswith("*")
+        term = term.rstrip("*")
+        if not term:
+            continue
+        quoted = '"' + term.replace('"', '""') + '"'
+        terms.append(quoted + "*" if prefix else quoted)
+    return " ".join(terms)
+
+
 class ModelProfileDAO:
     """DAO for ModelProfile."""
 
@@ -133,6 +167,8 @@ class RepoDAO:
         default_branch: str,
         latest_commit: str,
         workspace_path: str,
+        full_clone: bool = False,
+        sparse_paths: builtins.list[str] | None = None,
     ) -> Repo:
         """Create a new repo."""
         id = generate_id()
@@ -141,10 +177,20 @@ class RepoDAO:
         await self.db.connection.execute(
             """
             INSERT INTO repos
-            (id, repo_url, default_branch, latest_commit, workspace_path, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
+            (id, repo_url, default_branch, latest_commit, workspace_path,
+             full_clone, sparse_paths, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (id, repo_url, default_branch, latest_commit, workspace_path, created_at),
+            (
+                id,
+                repo_url,
+                default_branch,
+                latest_commit,
+                workspace_path,
+                1 if full_clone else 0,
+                json.dumps(sparse_paths) if sparse_paths else None,
+                created_at,
+            ),
         )
         await self.db.connection.commit()
 
@@ -154,6 +200,8 @@ class RepoDAO:
             default_branch=default_branch,
             latest_commit=latest_commit,
             workspace_path=workspace_path,
+            full_clone=full_clone,
+            sparse_paths=sparse_paths or None,
             created_at=datetime.fromisoformat(created_at),
         )
 
@@ -165,6 +213,12 @@ class RepoDAO:
             return None
         return self._row_to_model(row)
 
+    async def list(self) -> builtins.list[Repo]:
+        """List all repos."""
+        cursor = await self.db.connection.execute("SELECT * FROM repos ORDER BY created_at")
+        rows = await cursor.fetchall()
+        return [self._row_to_model(row) for row in rows]
+
     async def find_by_url(self, repo_url: str) -> Repo | None:
         """Find a repo by URL."""
         cursor = await self.db.connection.execute(
@@ -183,6 +237,8 @@ class RepoDAO:
             default_branch=row["default_branch"],
             latest_commit=row["latest_commit"],
             workspace_path=row["workspace_path"],
+            full_clone=bool(row["full_clone"]),
+            sparse_paths=json.loads(row["sparse_paths"]) if row["sparse_paths"] else None,
             created_at=datetime.fromisoformat(row["created_at"]),
         )
 
@@ -454,6 +510,7 @@ class RunDAO:
                 created_at,
             ),
         )
+        await self._add_to_search_index(id)
         await self.db.connection.commit()
 
         return Run(
@@ -505,8 +562,21 @@ class RunDAO:
         error: str | None = None,
         commit_sha: str | None = None,
         session_id: str | None = None,
+        search_logs: builtins.list[str] | None = None,
+        commit_status: PostRunStatus | None = None,
+        push_status: PostRunStatus | None = None,
     ) -> None:
-        """Update run status and results."""
+        """Update run status and results.
+
+        The run's search index entry is refreshed whenever searchable content
+        (summary, error, logs, changed files) changes. ``search_logs`` lets the
+        caller index a fuller transcript than the ``logs`` stored on the run,
+        e.g. CLI output that is kept in the run log store instead. It is
+        indexed without being stored, once per run: a CLI transcript is final
+        when the run finishes, and later updates leave it searchable.
+        ``commit_status``/``push_status`` are written in the same statement,
+        so a run never appears finished before its post-run stages are queued.
+        """
         updates = ["status = ?"]
         params: list[Any] = [status.value]
 
@@ -541,15 +611,89 @@ class RunDAO:
         if session_id is not None:
             updates.append("session_id = ?")
             params.append(session_id)
+        if commit_status is not None:
+            updates.append("commit_status = ?")
+            params.append(commit_status.value)
+        if push_status is not None:
+            updates.append("push_status = ?")
+            params.append(push_status.value)
 
         params.append(id)
 
+        searchable = any(value is not None for value in (summary, files_changed, logs, error))
+        if searchable:
+            await self._remove_from_search_index(id)
+        await self.db.connection.execute(
+            f"UPDATE runs SET {', '.join(updates)} WHERE id = ?",
+            params,
+        )
+        if searchable:
+            await self._add_to_search_index(id)
+        if search_logs is not None:
+            await self._index_output(id, search_logs)
+        await self.db.connection.commit()
+
+    async def update_post_run(
+        self,
+        id: str,
+        commit_status: PostRunStatus | None = None,
+        push_status: PostRunStatus | None = None,
+        commit_sha: str | None = None,
+        post_run_error: str | None = None,
+    ) -> None:
+        """Update the status of a run's background post-run stages.
+
+        Args:
+            id: Run ID.
+            commit_status: New commit stage status.
+            push_status: New push stage status.
+            commit_sha: SHA of the commit made by the commit stage.
+            post_run_error: Error of the last failed stage attempt.
+        """
+        updates: list[str] = []
+        params: list[Any] = []
+        if commit_status is not None:
+            updates.append("commit_status = ?")
+            params.append(commit_status.value)
+        if push_status is not None:
+            updates.append("push_status = ?")
+            params.append(push_status.value)
+        if commit_sha is not None:
+            updates.append("commit_sha = ?")
+            params.append(commit_sha)
+        if post_run_error is not None:
+            updates.append("post_run_error = ?")
+            params.append(post_run_error)
+        if not updates:
+            return
+
+        params.append(id)
         await self.db.connection.execute(
             f"UPDATE runs SET {', '.join(updates)} WHERE id = ?",
             params,
         )
         await self.db.connection.commit()
 
+    async def list_pending_post_run(self) -> builtins.list[tuple[Run, str]]:
+        """List runs whose post-run stages have not finished.
+
+        Returns:
+            Tuples of (run, repository URL).
+        """
+        cursor = await self.db.connection.execute(
+            """
+            SELECT r.*, repos.repo_url AS repo_url
+            FROM runs r
+            JOIN tasks t ON t.id = r.task_id
+            JOIN repos ON repos.id = t.repo_id
+            WHERE r.commit_status IN ('pending', 'running')
+               OR r.push_status IN ('pending', 'running')
+            ORDER BY r.created_at
+            """
+        )
+        rows = await cursor.fetchall()
+        return [(self._row_to_model(row), row["repo_url"]) for row in rows]
+
     async def update_worktree(
         self,
         id: str,
@@ -641,6 +785,299 @@ class RunDAO:
             return None
         return self._row_to_model(row)
 
+    async def existing_ids(self, ids: Iterable[str]) -> set[str]:
+        """Get which of the given IDs belong to existing runs."""
+        ids = builtins.list(ids)
+        existing: set[str] = set()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            cursor = await self.db.connection.execute(
+                f"SELECT id FROM runs WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            existing.update(row["id"] for row in await cursor.fetchall())
+        return existing
+
+    async def list_worktrees(self) -> builtins.list[RunWorktree]:
+        """List all runs that have a worktree, with task and PR state.
+
+        Returns:
+            One entry per run (runs of a task may share a worktree).
+        """
+        cursor = await self.db.connection.execute(
+            """
+            SELECT
+                r.id, r.task_id, t.repo_id, r.worktree_path, r.status, r.commit_status,
+                t.kanban_status,
+                (SELECT status FROM prs WHERE task_id = r.task_id
+                 ORDER BY updated_at DESC LIMIT 1) AS pr_status,
+                COALESCE(r.completed_at, r.started_at, r.created_at) AS last_active_at
+            FROM runs r
+            JOIN tasks t ON t.id = r.task_id
+            WHERE r.worktree_path IS NOT NULL
+            """
+        )
+        rows = await cursor.fetchall()
+        return [
+            RunWorktree(
+                run_id=row["id"],
+                task_id=row["task_id"],
+                repo_id=row["repo_id"],
+                worktree_path=row["worktree_path"],
+                status=RunStatus(row["status"]),
+                task_kanban_status=row["kanban_status"],
+                pr_status=row["pr_status"],
+                commit_status=(
+                    PostRunStatus(row["commit_status"]) if row["commit_status"] else None
+                ),
+                last_active_at=datetime.fromisoformat(row["last_active_at"]),
+            )
+            for row in rows
+        ]
+
+    async def exists(self, id: str) -> bool:
+        """Check whether a run exists."""
+        cursor = await self.db.connection.execute("SELECT 1 FROM runs WHERE id = ?", (id,))
+        return await cursor.fetchone() is not None
+
+    async def get_patch(self, id: str) -> str:
+        """Get a run's full patch.
+
+        Runs with per-file patches have them joined in patch order; older runs
+        return ``runs.patch``.
+
+        Args:
+            id: Run ID.
+
+        Returns:
+            Unified diff string. Empty if the run has no changes or if file
+            patches were not loaded yet (CLI runs: use their commit instead).
+        """
+        cursor = await self.db.connection.execute(
+            "SELECT patch FROM run_file_diffs WHERE run_id = ? ORDER BY position",
+            (id,),
+        )
+        patches = [row["patch"] for row in await cursor.fetchall()]
+        if patches:
+            return "" if not all(patches) else "\n".join(patches) + "\n"
+        cursor = await self.db.connection.execute("SELECT patch FROM runs WHERE id = ?", (id,))
+        row = await cursor.fetchone()
+        return (row["patch"] or "") if row else ""
+
+    async def list_files(self, run_id: str) -> builtins.list[RunFile]:
+        """List per-file change stats of a run in patch order."""
+        cursor = await self.db.connection.execute(
+            """
+            SELECT path, old_path, change_type, is_binary, added_lines, removed_lines,
+                hunk_count
+            FROM run_file_diffs
+            WHERE run_id = ?
+            ORDER BY position
+            """,
+            (run_id,),
+        )
+        rows = await cursor.fetchall()
+        return [self._row_to_run_file(row) for row in rows]
+
+    async def get_file_diff(self, run_id: str, path: str) -> FileDiff | None:
+        """Get one file's stored patch from a run."""
+        cursor = await self.db.connection.execute(
+            "SELECT * FROM run_file_diffs WHERE run_id = ? AND path = ?",
+            (run_id, path),
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return None
+        return FileDiff(
+            path=row["path"],
+            old_path=row["old_path"],
+            change_type=FileChangeType(row["change_type"]),
+            is_binary=bool(row["is_binary"]),
+            added_lines=row["added_lines"],
+            removed_lines=row["removed_lines"],
+            patch=row["patch"],
+        )
+
+    async def replace_file_diffs(self, run_id: str, files: Iterable[FileDiff]) -> None:
+        """Replace a run's per-file patch rows.
+
+        The rows are the only copy of the patch: ``runs.patch`` is cleared.
+
+        Args:
+            run_id: Run ID.
+            files: FileDiff objects with patch text, in patch order. CLI runs
+                store stats only; their patches are loaded on first access.
+        """
+        conn = self.db.connection
+        await conn.execute("DELETE FROM run_file_diffs WHERE run_id = ?", (run_id,))
+        await conn.execute("UPDATE runs SET patch = NULL WHERE id = ?", (run_id,))
+        await conn.executemany(
+            """
+            INSERT OR REPLACE INTO run_file_diffs (
+                run_id, path, position, old_path, change_type, is_binary,
+                added_lines, removed_lines, hunk_count, patch
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                (
+                    run_id,
+                    f.path,
+                    position,
+                    f.old_path,
+                    f.change_type.value,
+                    int(f.is_binary),
+                    f.added_lines,
+                    f.removed_lines,
+                    f.patch.count("\n@@"),
+                    f.patch,
+                )
+                for position, f in enumerate(files)
+            ),
+        )
+        await conn.commit()
+
+    async def set_file_patch(self, run_id: str, path: str, patch: str) -> None:
+        """Store the patch of a file whose stats were stored without it.
+
+        Args:
+            run_id: Run ID.
+            path: File path (new path for renames).
+            patch: Unified diff string for the file.
+        """
+        await self.db.connection.execute(
+            "UPDATE run_file_diffs SET patch = ?, hunk_count = ? WHERE run_id = ? AND path = ?",
+            (patch, patch.count("\n@@"), run_id, path),
+        )
+        await self.db.connection.commit()
+
+    async def search(
+        self,
+        query: str,
+        repo_id: str | None = None,
+        task_id: str | None = None,
+        executor_type: ExecutorType | None = None,
+        status: RunStatus | None = None,
+        limit: int = 50,
+    ) -> builtins.list[RunSearchResult]:
+        """Full-text search over run instructions, summaries, errors, logs and files.
+
+        Args:
+            query: Free-text query (terms are ANDed; ``term*`` matches prefixes).
+            repo_id: Only return runs of tasks in this repository.
+            task_id: Only return runs of this task.
+            executor_type: Only return runs of this executor type.
+            status: Only return runs with this status.
+            limit: Maximum number of results.
+
+        Returns:
+            Matching runs, best match first.
+        """
+        match = to_fts_query(query)
+        if not match:
+            return []
+
+        conditions: list[str] = []
+        params: list[Any] = [match, match]
+        if repo_id:
+            conditions.append("t.repo_id = ?")
+            params.append(repo_id)
+        if task_id:
+            conditions.append("r.task_id = ?")
+            params.append(task_id)
+        if executor_type:
+            conditions.append("r.executor_type = ?")
+            params.append(executor_type.value)
+        if status:
+            conditions.append("r.status = ?")
+            params.append(status.value)
+        params.append(limit)
+
+        # A run matches through its fields or its CLI output. Output is indexed
+        # without its text, so only field matches get a highlighted snippet.
+        cursor = await self.db.connection.execute(
+            f"""
+            WITH matches AS (
+                SELECT rowid AS key, rank, snippet(runs_fts, -1, '**', '**', '...', 16) AS snippet
+                FROM runs_fts WHERE runs_fts MATCH ?
+                UNION ALL
+                SELECT rowid, rank, '' FROM run_output_fts WHERE run_output_fts MATCH ?
+            )
+            SELECT
+                r.id, r.task_id, t.repo_id, r.model_name, r.executor_type, r.status,
+                r.instruction, r.summary, r.created_at,
+                MAX(m.snippet) AS snippet, MIN(m.rank) AS best_rank
+            FROM matches m
+            JOIN run_search_keys k ON k.key = m.key
+            JOIN runs r ON r.id = k.run_id
+            JOIN tasks t ON t.id = r.task_id
+            {"WHERE " + " AND ".join(conditions) if conditions else ""}
+            GROUP BY r.id
+            ORDER BY best_rank
+            LIMIT ?
+            """,
+            params,
+        )
+        rows = await cursor.fetchall()
+        return [
+            RunSearchResult(
+                id=row["id"],
+                task_id=row["task_id"],
+                repo_id=row["repo_id"],
+                model_name=row["model_name"],
+                executor_type=ExecutorType(row["executor_type"]),
+                status=RunStatus(row["status"]),
+                instruction=row["instruction"],
+                summary=row["summary"],
+                snippet=row["snippet"] or "",
+                created_at=datetime.fromisoformat(row["created_at"]),
+            )
+            for row in rows
+        ]
+
+    async def _add_to_search_index(self, id: str) -> None:
+        """Index a run's current fields in runs_fts (caller commits)."""
+        conn = self.db.connection
+        await conn.execute("INSERT OR IGNORE INTO run_search_keys (run_id) VALUES (?)", (id,))
+        await conn.execute(
+            f"INSERT INTO runs_fts (rowid, {_RUN_SEARCH_COLUMNS}) "
+            f"SELECT key, {_RUN_SEARCH_COLUMNS} FROM runs_search WHERE run_id = ?",
+            (id,),
+        )
+
+    async def _remove_from_search_index(self, id: str) -> None:
+        """Remove a run's indexed fields from runs_fts, before they change (caller commits)."""
+        await self.db.connection.execute(
+            f"INSERT INTO runs_fts (runs_fts, rowid, {_RUN_SEARCH_COLUMNS}) "
+            f"SELECT 'delete', key, {_RUN_SEARCH_COLUMNS} FROM runs_search WHERE run_id = ?",
+            (id,),
+        )
+
+    async def _index_output(self, id: str, output: builtins.list[str]) -> None:
+        """Index a run's CLI output in run_output_fts unless already indexed (caller commits)."""
+        conn = self.db.connection
+        await conn.execute(
+            """
+            INSERT INTO run_output_fts (rowid, output)
+            SELECT key, ? FROM run_search_keys WHERE run_id = ? AND NOT output_indexed
+            """,
+            ("\n".join(output), id),
+        )
+        await conn.execute(
+            "UPDATE run_search_keys SET output_indexed = 1 WHERE run_id = ?",
+            (id,),
+        )
+
+    def _row_to_run_file(self, row: Any) -> RunFile:
+        return RunFile(
+            path=row["path"],
+            old_path=row["old_path"],
+            change_type=FileChangeType(row["change_type"]),
+            is_binary=bool(row["is_binary"]),
+            added_lines=row["added_lines"],
+            removed_lines=row["removed_lines"],
+            hunk_count=row["hunk_count"],
+        )
+
     def _row_to_model(self, row: Any) -> Run:
         files_changed = []
         if row["files_changed"]:
@@ -680,6 +1117,9 @@ class RunDAO:
             base_ref=row["base_ref"],
             commit_sha=row["commit_sha"] if "commit_sha" in row.keys() else None,
             status=RunStatus(row["status"]),
+            commit_status=(PostRunStatus(row["commit_status"]) if row["commit_status"] else None),
+            push_status=PostRunStatus(row["push_status"]) if row["push_status"] else None,
+            post_run_error=row["post_run_error"],
             summary=row["summary"],
             patch=row["patch"],
             files_changed=files_changed,
@@ -768,6 +1208,27 @@ class PRDAO:
         rows = await cursor.fetchall()
         return [self._row_to_model(row) for row in rows]
 
+    async def list_by_url(self, url: str) -> builtins.list[PR]:
+        """List PR records with a GitHub PR URL."""
+        cursor = await self.db.connection.execute("SELECT * FROM prs WHERE url = ?", (url,))
+        rows = await cursor.fetchall()
+        return [self._row_to_model(row) for row in rows]
+
+    async def list_by_branch(self, url_prefix: str, branch: str) -> builtins.list[PR]:
+        """List PR records of a branch whose URL starts with a prefix.
+
+        Args:
+            url_prefix: PR URL prefix identifying the repository
+                (e.g. ``https://github.com/owner/repo/pull/``).
+            branch: Head branch name.
+        """
+        cursor = await self.db.connection.execute(
+            "SELECT * FROM prs WHERE branch = ? AND substr(url, 1, length(?)) = ?",
+            (branch, url_prefix, url_prefix),
+        )
+        rows = await cursor.fetchall()
+        return [self._row_to_model(row) for row in rows]
+
     async def update(self, id: str, latest_commit: str) -> None:
         """Update PR's latest commit."""
         await self.db.connection.execute(
@@ -784,6 +1245,37 @@ class PRDAO:
         )
         await self.db.connection.commit()
 
+    async def list_open(self, repo_id: str | None = None) -> builtins.list[PR]:
+        """List open PRs, optionally of one repository's tasks."""
+        if repo_id:
+            cursor = await self.db.connection.execute(
+                """
+                SELECT prs.* FROM prs
+                JOIN tasks t ON t.id = prs.task_id
+                WHERE prs.status = 'open' AND t.repo_id = ?
+                """,
+                (repo_id,),
+            )
+        else:
+            cursor = await self.db.connection.execute("SELECT * FROM prs WHERE status = 'open'")
+        rows = await cursor.fetchall()
+        return [self._row_to_model(row) for row in rows]
+
+    async def update_statuses(self, statuses: dict[str, str]) -> None:
+        """Update the status of many PRs in one transaction.
+
+        Args:
+            statuses: Dict mapping PR ID to status (open/merged/closed).
+        """
+        if not statuses:
+            return
+        now = now_iso()
+        await self.db.connection.executemany(
+            "UPDATE prs SET status = ?, updated_at = ? WHERE id = ?",
+            [(status, now, id) for id, status in statuses.items()],
+        )
+        await self.db.connection.commit()
+
     async def update_status(self, id: str, status: str) -> None:
         """Update PR status (open/merged/closed)."""
         await self.db.connection.execute(
@@ -808,6 +1300,80 @@ class PRDAO:
         )
 
 
+class PRDraftDAO:
+    """DAO for PRDraft (speculatively generated PR titles and descriptions)."""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    async def get(self, commit_sha: str, template_hash: str) -> PRDraft | None:
+        """Get the draft for a commit and PR template."""
+        cursor = await self.db.connection.execute(
+            "SELECT * FROM pr_drafts WHERE commit_sha = ? AND template_hash = ?",
+            (commit_sha, template_hash),
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return None
+        return PRDraft(
+            commit_sha=row["commit_sha"],
+            template_hash=row["template_hash"],
+            run_id=row["run_id"],
+            title=row["title"],
+            body=row["body"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+        )
+
+    async def upsert(
+        self, commit_sha: str, template_hash: str, run_id: str, title: str, body: str
+    ) -> None:
+        """Store the draft for a commit and PR template, replacing any previous one."""
+        await self.db.connection.execute(
+            """
+            INSERT OR REPLACE INTO pr_drafts (
+                commit_sha, template_hash, run_id, title, body, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (commit_sha, template_hash, run_id, title, body, now_iso()),
+        )
+        await self.db.connection.commit()
+
+
+class GitHubWebhookDeliveryDAO:
+    """DAO for processed GitHub webhook deliveries."""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    async def exists(self, delivery_id: str) -> bool:
+        """Check whether a delivery was already processed."""
+        cursor = await self.db.connection.execute(
+            "SELECT 1 FROM github_webhook_deliveries WHERE delivery_id = ?",
+            (delivery_id,),
+        )
+        return await cursor.fetchone() is not None
+
+    async def record(self, delivery_id: str, event: str) -> None:
+        """Record a processed delivery."""
+        await self.db.connection.execute(
+            """
+            INSERT OR IGNORE INTO github_webhook_deliveries (delivery_id, event, received_at)
+            VALUES (?, ?, ?)
+            """,
+            (delivery_id, event, now_iso()),
+        )
+        await self.db.connection.commit()
+
+    async def delete_older_than(self, cutoff: datetime) -> None:
+        """Delete deliveries received before a cutoff."""
+        await self.db.connection.execute(
+            "DELETE FROM github_webhook_deliveries WHERE received_at < ?",
+            (cutoff.isoformat(),),
+        )
+        await self.db.connection.commit()
+
+
 class UserPreferencesDAO:
     """DAO for UserPreferences (singleton)."""
 
@@ -1011,6 +1577,17 @@ class BacklogDAO:
             return None
         return self._row_to_model(row)
 
+    async def get_by_task(self, task_id: str) -> BacklogItem | None:
+        """Get the backlog item promoted to a task, if any."""
+        cursor = await self.db.connection.execute(
+            "SELECT * FROM backlog_items WHERE task_id = ? ORDER BY created_at DESC LIMIT 1",
+            (task_id,),
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return None
+        return self._row_to_model(row)
+
     async def list(
         self,
         repo_id: str | None = None,
@@ -73,6 +73,12 @@ class Database:
             )
             await conn.commit()
 
+        # Migration: Add post-run stage columns to runs table if they don't exist
+        for column in ("commit_status", "push_status", "post_run_error"):
+            if column not in column_names:
+                await conn.execute(f"ALTER TABLE runs ADD COLUMN {column} TEXT")
+                await conn.commit()
+
         # Migration: Add default_branch_prefix column to user_preferences table if it doesn't exist
         cursor = await conn.execute("PRAGMA table_info(user_preferences)")
         pref_columns = await cursor.fetchall()
@@ -89,6 +95,37 @@ class Database:
             )
             await conn.commit()
 
+        # Migration: Add clone options to repos table if they don't exist
+        cursor = await conn.execute("PRAGMA table_info(repos)")
+        repo_columns = await cursor.fetchall()
+        repo_column_names = [col["name"] for col in repo_columns]
+
+        if "full_clone" not in repo_column_names:
+            await conn.execute("ALTER TABLE repos ADD COLUMN full_clone INTEGER NOT NULL DEFAULT 0")
+            await conn.commit()
+
+        if "sparse_paths" not in repo_column_names:
+            await conn.execute("ALTER TABLE repos ADD COLUMN sparse_paths TEXT")
+            await conn.commit()
+
+        # Migration: Index runs created before the search index existed
+        cursor = await conn.execute("SELECT COALESCE(MAX(key), 0) AS last_key FROM run_search_keys")
+        key_row = await cursor.fetchone()
+        last_key = key_row["last_key"] if key_row else 0
+        cursor = await conn.execute(
+            "INSERT INTO run_search_keys (run_id) "
+            "SELECT id FROM runs WHERE id NOT IN (SELECT run_id FROM run_search_keys)"
+        )
+        if cursor.rowcount > 0:
+            # ('rebuild' cannot read the runs_search view: it uses json_each)
+            await conn.execute(
+                "INSERT INTO runs_fts (rowid, instruction, summary, error, logs, files) "
+                "SELECT key, instruction, summary, error, logs, files FROM runs_search "
+                "WHERE key > ?",
+                (last_key,),
+            )
+        await conn.commit()
+
     @property
     def connection(self) -> aiosqlite.Connection:
         """Get the database connection."""
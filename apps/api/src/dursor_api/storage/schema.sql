@@ -19,6 +19,8 @@ CREATE TABLE IF NOT EXISTS repos (
     default_branch TEXT NOT NULL,
     latest_commit TEXT NOT NULL,
     workspace_path TEXT NOT NULL,
+    full_clone INTEGER NOT NULL DEFAULT 0,  -- 0: blobless partial clone, 1: full clone
+    sparse_paths TEXT,  -- JSON array of sparse-checkout directories (NULL: whole tree)
     created_at TEXT NOT NULL DEFAULT (datetime('now'))
 );
 
@@ -63,6 +65,9 @@ CREATE TABLE IF NOT EXISTS runs (
     base_ref TEXT,
     commit_sha TEXT,                 -- latest commit SHA for the run
     status TEXT NOT NULL DEFAULT 'queued',  -- queued, running, succeeded, failed, canceled
+    commit_status TEXT,              -- post-run stage: pending, running, succeeded, failed, skipped
+    push_status TEXT,                -- post-run stage: pending, running, succeeded, failed, skipped
+    post_run_error TEXT,             -- last error of a post-run stage
     summary TEXT,
     patch TEXT,
     files_changed TEXT,              -- JSON array of FileDiff
@@ -79,6 +84,58 @@ CREATE INDEX IF NOT EXISTS idx_runs_message ON runs(message_id);
 CREATE INDEX IF NOT EXISTS idx_runs_model ON runs(model_id);
 CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status);
 
+-- Per-file patches of a run, so one file's diff can be served without the full patch
+CREATE TABLE IF NOT EXISTS run_file_diffs (
+    run_id TEXT NOT NULL REFERENCES runs(id),
+    path TEXT NOT NULL,
+    position INTEGER NOT NULL,       -- order of the file within the run's patch
+    old_path TEXT,                   -- previous path for renames/copies
+    change_type TEXT NOT NULL DEFAULT 'modified',  -- added, modified, deleted, renamed, copied
+    is_binary INTEGER NOT NULL DEFAULT 0,
+    added_lines INTEGER NOT NULL DEFAULT 0,
+    removed_lines INTEGER NOT NULL DEFAULT 0,
+    hunk_count INTEGER NOT NULL DEFAULT 0,
+    patch TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (run_id, path)
+);
+
+-- Stable integer keys of runs in the search indexes (runs.rowid may change on VACUUM)
+CREATE TABLE IF NOT EXISTS run_search_keys (
+    key INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL UNIQUE REFERENCES runs(id),
+    output_indexed INTEGER NOT NULL DEFAULT 0  -- CLI output added to run_output_fts
+);
+
+-- Searchable run fields as plain text (JSON arrays flattened)
+CREATE VIEW IF NOT EXISTS runs_search AS
+SELECT
+    k.key,
+    r.id AS run_id,
+    r.instruction,
+    COALESCE(r.summary, '') AS summary,
+    COALESCE(r.error, '') AS error,
+    COALESCE((SELECT group_concat(value, char(10)) FROM json_each(r.logs)), '') AS logs,
+    COALESCE(
+        (SELECT group_concat(json_extract(value, '$.path'), ' ') FROM json_each(r.files_changed)),
+        ''
+    ) AS files
+FROM run_search_keys k
+JOIN runs r ON r.id = k.run_id;
+
+-- Full-text search over run fields (maintained by RunDAO; external content, text stays in runs)
+CREATE VIRTUAL TABLE IF NOT EXISTS runs_fts USING fts5(
+    instruction,
+    summary,
+    error,
+    logs,                            -- orchestration logs, newline separated
+    files,                           -- changed file paths, space separated
+    content='runs_search',
+    content_rowid='key'
+);
+
+-- Full-text search over CLI output (contentless, output stays in the run log store)
+CREATE VIRTUAL TABLE IF NOT EXISTS run_output_fts USING fts5(output, content='');
+
 -- Pull Requests
 CREATE TABLE IF NOT EXISTS prs (
     id TEXT PRIMARY KEY,
@@ -96,6 +153,24 @@ CREATE TABLE IF NOT EXISTS prs (
 
 CREATE INDEX IF NOT EXISTS idx_prs_task ON prs(task_id);
 
+-- PR titles/descriptions generated ahead of PR creation, keyed by commit and template
+CREATE TABLE IF NOT EXISTS pr_drafts (
+    commit_sha TEXT NOT NULL,
+    template_hash TEXT NOT NULL,     -- sha256 of the PR template ('' when there is none)
+    run_id TEXT NOT NULL REFERENCES runs(id),
+    title TEXT NOT NULL,
+    body TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (commit_sha, template_hash)
+);
+
+-- GitHub webhook deliveries already processed (X-GitHub-Delivery), for idempotency
+CREATE TABLE IF NOT EXISTS github_webhook_deliveries (
+    delivery_id TEXT PRIMARY KEY,
+    event TEXT NOT NULL,
+    received_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
 -- GitHub App configuration (singleton table)
 CREATE TABLE IF NOT EXISTS github_app_config (
     id INTEGER PRIMARY KEY CHECK (id = 1),  -- Singleton constraint
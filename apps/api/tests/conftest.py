@@ -0,0 +1,47 @@
+"""Shared test fixtures."""
+
+import subprocess
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from dursor_api.storage.db import Database
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path: Path) -> AsyncIterator[Database]:
+    """Provide an initialized database in a temporary directory."""
+    database = Database(tmp_path / "test.db")
+    await database.initialize()
+    try:
+        yield database
+    finally:
+        await database.disconnect()
+
+
+def _run_git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def run_git() -> Callable[..., str]:
+    """Provide a helper running a git command in a repository.
+
+    The helper returns the command's stripped standard output.
+    """
+    return _run_git
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    """Provide an empty repository on branch main with a committer identity."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _run_git(repo, "init", "-q", "-b", "main")
+    _run_git(repo, "config", "user.email", "test@example.com")
+    _run_git(repo, "config", "user.name", "Test")
+    return repo
@@ -0,0 +1,48 @@
+"""Tests for diff condensing in PR prompts."""
+
+from dursor_api.services.diff_condenser import condense_diff
+
+
+def _file_diff(path: str, hunks: list[tuple[str, int]]) -> str:
+    """Build a git diff for one file from (hunk context, changed lines) pairs."""
+    parts = [f"diff --git a/{path} b/{path}", "index 1111111..2222222 100644"]
+    parts += [f"--- a/{path}", f"+++ b/{path}"]
+    for number, (context, changed) in enumerate(hunks):
+        start = number * 100 + 1
+        parts.append(f"@@ -{start},{changed} +{start},{changed} @@ {context}")
+        parts += [f"-old line {i} in {path}" for i in range(changed)]
+        parts += [f"+new line {i} in {path}" for i in range(changed)]
+    return "\n".join(parts) + "\n"
+
+
+def test_small_diff_is_unchanged() -> None:
+    """Test that diffs within the budget are returned as is."""
+    diff = _file_diff("a.py", [("def a():", 2)])
+    assert condense_diff(diff, budget=10000) == diff
+
+
+def test_large_diff_keeps_every_file_and_relevant_hunks() -> None:
+    """Test that all files are summarized and relevant, large hunks are kept."""
+    diff = "".join(
+        [
+            _file_diff("package-lock.json", [("", 200)]),
+            *(_file_diff(f"src/module_{i}.py", [(f"def helper_{i}(x):", 5)]) for i in range(30)),
+            _file_diff(
+                "src/auth/login.py",
+                [("class LoginForm:", 20), ("def unrelated():", 1)],
+            ),
+        ]
+    )
+    condensed = condense_diff(diff, budget=4000, instruction="Validate the login form")
+
+    assert len(condensed) <= 4000
+    assert condensed.startswith("# Changed files (32)")
+    summary = condensed.split("\n\n", 1)[0]
+    assert "M package-lock.json (+200 -200, 1 hunk)" in summary
+    assert "M src/module_29.py (+5 -5, 1 hunk): helper_29" in summary
+    assert "M src/auth/login.py (+21 -21, 2 hunks): LoginForm, unrelated" in summary
+
+    hunks = condensed.split("# Most significant hunks", 1)[1]
+    assert "@@ -1,20 +1,20 @@ class LoginForm:" in hunks
+    assert "+new line 19 in src/auth/login.py" in hunks
+    assert "package-lock.json" not in hunks
@@ -0,0 +1,71 @@
+"""Tests for the unified diff parser."""
+
+from dursor_api.domain.enums import FileChangeType
+from dursor_api.services.diff_parser import parse_diff
+
+GIT_DIFF = """diff --git a/added.txt b/added.txt
+new file mode 100644
+index 0000000..8ba3a16
+--- /dev/null
++++ b/added.txt
+@@ -0,0 +1 @@
++n
+diff --git a/bin.dat b/bin.dat
+index bdc955b..8835708 100644
+Binary files a/bin.dat and b/bin.dat differ
+diff --git a/gone.txt b/gone.txt
+deleted file mode 100644
+index 587be6b..0000000
+--- a/gone.txt
++++ /dev/null
+@@ -1 +0,0 @@
+-x
+diff --git a/keep.txt b/keep.txt
+index de98044..25188f8 100644
+--- a/keep.txt
++++ b/keep.txt
+@@ -1,3 +1,4 @@
+ a
+-b
++B
+ c
++-- sql comment
+diff --git a/mode.sh b/mode.sh
+old mode 100644
+new mode 100755
+diff --git a/old.txt b/new name.txt
+similarity index 100%
+rename from old.txt
+rename to new name.txt
+"""
+
+
+def test_parse_git_diff() -> None:
+    """Test new, binary, deleted, modified, mode-only and renamed files."""
+    files = parse_diff(GIT_DIFF)
+
+    assert [(f.path, f.change_type, f.added_lines, f.removed_lines) for f in files] == [
+        ("added.txt", FileChangeType.ADDED, 1, 0),
+        ("bin.dat", FileChangeType.MODIFIED, 0, 0),
+        ("gone.txt", FileChangeType.DELETED, 0, 1),
+        ("keep.txt", FileChangeType.MODIFIED, 2, 1),
+        ("mode.sh", FileChangeType.MODIFIED, 0, 0),
+        ("new name.txt", FileChangeType.RENAMED, 0, 0),
+    ]
+    assert files[1].is_binary
+    assert files[5].old_path == "old.txt"
+    assert files[3].patch.startswith("diff --git a/keep.txt b/keep.txt\n")
+    assert files[3].patch.endswith("+-- sql comment")
+
+
+def test_parse_plain_diff() -> None:
+    """Test diffs without git headers, as produced by LLMs."""
+    files = parse_diff(
+        "--- a/src/app.py\t2024-01-01\n+++ b/src/app.py\n@@ -1,2 +1,2 @@\n-old\n+new\n ctx\n"
+        "--- /dev/null\n+++ b/src/new.py\n@@ -0,0 +1 @@\n+print()\n"
+    )
+
+    assert [(f.path, f.change_type, f.added_lines, f.removed_lines) for f in files] == [
+        ("src/app.py", FileChangeType.MODIFIED, 1, 1),
+        ("src/new.py", FileChangeType.ADDED, 1, 0),
+    ]
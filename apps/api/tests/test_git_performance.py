@@ -0,0 +1,73 @@
+"""Tests for the managed workspace git performance profile."""
+
+from datetime import datetime
+from pathlib import Path
+
+import git
+import pytest
+
+from dursor_api.domain.models import Repo
+from dursor_api.services.git_performance import (
+    PROFILE_VERSION,
+    apply_performance_profile,
+    run_maintenance,
+)
+from dursor_api.services.git_service import GitService
+
+
+def _init_workspace(path: Path) -> git.Repo:
+    repo = git.Repo.init(path, initial_branch="main")
+    with repo.config_writer("repository") as writer:
+        writer.set_value("user", "email", "test@example.com")
+        writer.set_value("user", "name", "Test")
+    (path / "README.md").write_text("hello\n")
+    repo.index.add(["README.md"])
+    repo.index.commit("Initial commit")
+    return repo
+
+
+def _index_version(path: Path) -> int:
+    git_dir = Path(git.Repo(path).git_dir)
+    return int.from_bytes((git_dir / "index").read_bytes()[4:8], "big")
+
+
+def test_apply_performance_profile(tmp_path: Path) -> None:
+    """Test that the profile is applied once and recorded in the repo config."""
+    repo = _init_workspace(tmp_path)
+
+    assert apply_performance_profile(repo) is True
+    assert apply_performance_profile(repo) is False
+
+    reader = repo.config_reader("repository")
+    assert reader.get_value("core", "untrackedCache") is True
+    assert reader.get_value("core", "commitGraph") is True
+    assert reader.get_value("dursor", "performanceProfile") == PROFILE_VERSION
+    assert (Path(repo.git_dir) / "objects" / "info" / "commit-graph").exists()
+
+    run_maintenance(repo)
+
+
+@pytest.mark.asyncio
+async def test_worktrees_commit_after_profile(tmp_path: Path) -> None:
+    """Test that worktrees created under the profile get a v2 index and commit."""
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    repo = _init_workspace(workspace)
+    model = Repo(
+        id="r",
+        repo_url="https://example.com/r.git",
+        default_branch="main",
+        latest_commit="",
+        workspace_path=str(workspace),
+        created_at=datetime.now(),
+    )
+    service = GitService(tmp_path / "workspaces")
+
+    assert apply_performance_profile(repo) is True
+    info = await service.create_worktree(model, "main", "run00001")
+
+    assert _index_version(info.path) == 2
+    (info.path / "change.txt").write_text("change\n")
+    await service.stage_all(info.path)
+    sha = await service.commit(info.path, message="change")
+    assert git.Repo(info.path).head.commit.hexsha == sha
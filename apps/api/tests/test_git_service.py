@@ -0,0 +1,269 @@
+"""Tests for GitService change inspection."""
+
+import asyncio
+import subprocess
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+import git
+import pytest
+
+from dursor_api.domain.enums import FileChangeType
+from dursor_api.domain.models import Repo
+from dursor_api.services.git_service import GitService, _parse_porcelain_v2
+
+
+@pytest.mark.asyncio
+async def test_get_changes_and_file_diff(
+    tmp_path: Path, git_repo: Path, run_git: Callable[..., str]
+) -> None:
+    """Test numstat-based change stats and on-demand per-file patches."""
+    repo = git_repo
+    (repo / "keep.txt").write_text("a\nb\nc\n")
+    (repo / "old.txt").write_text("one\ntwo\nthree\nfour\n")
+    (repo / "gone.txt").write_text("x\n")
+    run_git(repo, "add", "-A")
+    run_git(repo, "commit", "-qm", "init")
+
+    (repo / "keep.txt").write_text("a\nB\nc\nd\n")
+    (repo / "gone.txt").unlink()
+    (repo / "old.txt").rename(repo / "new name.txt")
+    (repo / "image.bin").write_bytes(b"\x00\x01\x02")
+
+    service = GitService(tmp_path / "workspaces")
+    await service.stage_all(repo)
+    changes = {f.path: f for f in await service.get_changes(repo)}
+
+    assert changes["keep.txt"].added_lines == 2
+    assert changes["keep.txt"].removed_lines == 1
+    assert changes["gone.txt"].change_type == FileChangeType.DELETED
+    assert changes["new name.txt"].change_type == FileChangeType.RENAMED
+    assert changes["new name.txt"].old_path == "old.txt"
+    assert changes["image.bin"].change_type == FileChangeType.ADDED
+    assert changes["image.bin"].is_binary
+    assert all(f.patch == "" for f in changes.values())
+
+    patch = await service.get_file_diff(repo, "keep.txt")
+    assert "+B" in patch and "new name.txt" not in patch
+
+    sha = await service.commit(repo, message="change")
+    committed = await service.get_changes(repo, commit=sha)
+    assert {f.path for f in committed} == set(changes)
+    rename = await service.get_file_diff(repo, "new name.txt", old_path="old.txt", commit=sha)
+    assert "rename from old.txt" in rename
+
+
+@pytest.mark.asyncio
+async def test_diff_from_base_up_to_commit(
+    tmp_path: Path, git_repo: Path, run_git: Callable[..., str]
+) -> None:
+    """Test that a cumulative diff stops at the given head commit."""
+    repo = git_repo
+    (repo / "a.txt").write_text("a\n")
+    run_git(repo, "add", "-A")
+    run_git(repo, "commit", "-qm", "init")
+    run_git(repo, "checkout", "-qb", "run")
+    (repo / "b.txt").write_text("b\n")
+    run_git(repo, "add", "-A")
+    run_git(repo, "commit", "-qm", "run")
+    run_commit = git.Repo(repo).head.commit.hexsha
+    (repo / "c.txt").write_text("c\n")
+    run_git(repo, "add", "-A")
+    run_git(repo, "commit", "-qm", "later")
+
+    service = GitService(tmp_path / "workspaces")
+    diff = await service.get_diff_from_base(repo, base_ref="main", head=run_commit)
+    assert "b.txt" in diff and "c.txt" not in diff
+    assert "c.txt" in await service.get_diff_from_base(repo, base_ref="main")
+
+
+@pytest.mark.asyncio
+async def test_worktree_validity_uses_cached_repo(
+    tmp_path: Path, git_repo: Path, run_git: Callable[..., str]
+) -> None:
+    """Test that Repo objects are reused and removed worktrees are detected."""
+    repo = git_repo
+    (repo / "a.txt").write_text("a\n")
+    run_git(repo, "add", "-A")
+    run_git(repo, "commit", "-qm", "init")
+    worktree = tmp_path / "wt"
+    run_git(repo, "worktree", "add", "-q", "-b", "work", str(worktree))
+
+    service = GitService(tmp_path / "workspaces")
+    assert service._repos.get(worktree) is service._repos.get(worktree)
+    assert await service.is_valid_worktree(worktree)
+    assert await service.get_ref_sha(worktree, "HEAD") == await service.get_head_sha(worktree)
+
+    run_git(repo, "worktree", "remove", "--force", str(worktree))
+    assert not await service.is_valid_worktree(worktree)
+
+
+@pytest.mark.asyncio
+async def test_sparse_worktree_from_target_files(
+    tmp_path: Path, git_repo: Path, run_git: Callable[..., str]
+) -> None:
+    """Test that sparse worktrees check out only the target directories."""
+    workspace = git_repo
+    for path in ("README.md", "api/src/app.py", "api/tests/test_app.py", "web/index.ts"):
+        (workspace / path).parent.mkdir(parents=True, exist_ok=True)
+        (workspace / path).write_text(f"{path}\n")
+    run_git(workspace, "add", "-A")
+    run_git(workspace, "commit", "-qm", "init")
+    repo = Repo(
+        id="r",
+        repo_url="https://example.com/r.git",
+        default_branch="main",
+        latest_commit="",
+        workspace_path=str(workspace),
+        created_at=datetime.now(),
+    )
+
+    service = GitService(tmp_path / "workspaces")
+    info = await service.create_worktree(
+        repo, "main", "run12345", sparse_paths=["api/src/app.py", "api/src/new.py", "api/src"]
+    )
+
+    assert info.sparse_dirs == ["api/src"]
+    assert (info.path / "README.md").exists()
+    assert (info.path / "api/src/app.py").exists()
+    assert not (info.path / "api/tests").exists()
+    assert not (info.path / "web").exists()
+
+    assert await service.expand_sparse_checkout(info.path, ["web"]) == ["api/src", "web"]
+    assert (info.path / "web/index.ts").exists()
+
+    # Files written outside the cone are still staged.
+    (info.path / "docs").mkdir()
+    (info.path / "docs/guide.md").write_text("guide\n")
+    await service.stage_all(info.path)
+    assert {f.path for f in await service.get_changes(info.path)} == {"docs/guide.md"}
+
+    assert await service.expand_sparse_checkout(info.path) is None
+    assert (info.path / "api/tests/test_app.py").exists()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pushes_leave_config_untouched(
+    tmp_path: Path, run_git: Callable[..., str]
+) -> None:
+    """Test that worktrees of one repo push concurrently without rewriting origin."""
+    remote = tmp_path / "remote.git"
+    run_git(tmp_path, "init", "-q", "--bare", "-b", "main", str(remote))
+    workspace = tmp_path / "ws"
+    run_git(tmp_path, "clone", "-q", remote.as_uri(), str(workspace))
+    run_git(workspace, "config", "user.email", "test@example.com")
+    run_git(workspace, "config", "user.name", "Test")
+    (workspace / "a.txt").write_text("a\n")
+    run_git(workspace, "add", "-A")
+    run_git(workspace, "commit", "-qm", "init")
+    run_git(workspace, "push", "-q", "origin", "HEAD:main")
+
+    branches = [f"work{i}" for i in range(4)]
+    for branch in branches:
+        run_git(workspace, "worktree", "add", "-q", "-b", branch, str(tmp_path / branch))
+        (tmp_path / branch / f"{branch}.txt").write_text(f"{branch}\n")
+        run_git(tmp_path / branch, "add", "-A")
+        run_git(tmp_path / branch, "commit", "-qm", branch)
+
+    service = GitService(tmp_path / "workspaces")
+    await asyncio.gather(
+        *(service.push(tmp_path / b, b, auth_url=remote.as_uri()) for b in branches)
+    )
+
+    refs = subprocess.run(
+        ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads"],
+        cwd=remote,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    assert set(branches) <= set(refs)
+    config = (workspace / ".git" / "config").read_text()
+    assert "pushurl" not in config
+    assert config.count(f"url = {remote.as_uri()}") == 1
+
+
+def test_parse_porcelain_v2_status() -> None:
+    """Test staged, unstaged, deleted, renamed and untracked entries in one pass."""
+    sha = "0" * 40
+    output = "\0".join(
+        [
+            f"1 .D N... 100644 100644 000000 {sha} {sha} gone.txt",
+            f"1 MM N... 100644 100644 100644 {sha} {sha} both changed.txt",
+            f"2 R. N... 100644 100644 100644 {sha} {sha} R100 new.txt",
+            "old.txt",
+            "? untracked dir/",
+            "",
+        ]
+    )
+
+    status = _parse_porcelain_v2(output)
+
+    assert status.staged == ["both changed.txt", "new.txt"]
+    assert status.modified == ["both changed.txt"]
+    assert status.deleted == ["gone.txt"]
+    assert status.untracked == ["untracked dir/"]
+
+
+@pytest.mark.asyncio
+async def test_commit_patch_without_checkout(
+    tmp_path: Path, git_repo: Path, run_git: Callable[..., str]
+) -> None:
+    """Test plumbing commits with a 3-way fallback, with and without a checkout."""
+    workspace = git_repo
+    (workspace / "f.txt").write_text("a\nb\nc\n")
+    run_git(workspace, "add", "-A")
+    run_git(workspace, "commit", "-qm", "init")
+    # A patch made against the initial commit...
+    (workspace / "f.txt").write_text("a\nB\nc\n")
+    patch = subprocess.run(
+        ["git", "diff"], cwd=workspace, check=True, capture_output=True, text=True
+    ).stdout
+    run_git(workspace, "checkout", "-q", "--", "f.txt")
+    # ...applied to branches that have moved on (context no longer matches).
+    (workspace / "f.txt").write_text("x\na\nb\nc\n")
+    run_git(workspace, "commit", "-qam", "prepend")
+    run_git(workspace, "branch", "free")
+    run_worktree = tmp_path / "run"
+    run_git(workspace, "worktree", "add", "-q", "-b", "busy", str(run_worktree))
+
+    def show(rev: str) -> str:
+        return subprocess.run(
+            ["git", "show", rev], cwd=workspace, check=True, capture_output=True, text=True
+        ).stdout
+
+    service = GitService(tmp_path / "workspaces")
+    free_sha, busy_sha = await asyncio.gather(
+        service.commit_patch(workspace, "free", patch, "Apply to free"),
+        service.commit_patch(workspace, "busy", patch, "Apply to busy"),
+    )
+
+    assert show(f"{free_sha}:f.txt") == show(f"{busy_sha}:f.txt") == "x\na\nB\nc\n"
+    # Both branches moved; the checked-out one was fast-forwarded in its
+    # worktree, and the workspace's files are untouched.
+    assert show("free").startswith(f"commit {free_sha}")
+    assert show("busy").startswith(f"commit {busy_sha}")
+    assert (workspace / "f.txt").read_text() == "x\na\nb\nc\n"
+    assert (run_worktree / "f.txt").read_text() == "x\na\nB\nc\n"
+    for path in (workspace, run_worktree):
+        status = subprocess.run(
+            ["git", "status", "--porcelain"], cwd=path, capture_output=True, text=True
+        ).stdout
+        assert status == ""
+
+    # A second update builds on the first.
+    (run_worktree / "f.txt").write_text("x\na\nB\nc\nd\n")
+    second_patch = subprocess.run(
+        ["git", "diff"], cwd=run_worktree, check=True, capture_output=True, text=True
+    ).stdout
+    run_git(run_worktree, "checkout", "-q", "--", "f.txt")
+    second_sha = await service.commit_patch(workspace, "busy", second_patch, "Append d")
+    assert show("busy").startswith(f"commit {second_sha}")
+    assert show(f"{second_sha}^").startswith(f"commit {busy_sha}")
+    assert (run_worktree / "f.txt").read_text() == "x\na\nB\nc\nd\n"
+
+    with pytest.raises(git.GitCommandError):
+        await service.commit_patch(
+            workspace, "free", patch.replace("-b\n+B", "-q\n+Q"), "Bad", three_way=False
+        )
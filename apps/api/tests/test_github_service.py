@@ -0,0 +1,64 @@
+"""Tests for GitHubService conditional requests and rate limit tracking."""
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from dursor_api.services import github_service
+from dursor_api.services.github_service import GitHubService
+from dursor_api.storage.db import Database
+
+
+class _TokenGitHub(GitHubService):
+    async def _get_installation_token(self) -> str | None:
+        return "token"
+
+
+@pytest.mark.asyncio
+async def test_get_responses_are_revalidated_from_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that ETags are sent back and 304s are served from the cache."""
+    requests: list[httpx.Request] = []
+    branches = [{"name": "main"}]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        headers = {
+            "ETag": f'"v{len(branches)}"',
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": str(5000 - len(requests)),
+            "X-RateLimit-Used": str(len(requests)),
+            "X-RateLimit-Reset": "1800000000",
+            "X-RateLimit-Resource": "core",
+        }
+        if request.headers.get("If-None-Match") == headers["ETag"]:
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, json=branches, headers=headers)
+
+    client_class = httpx.AsyncClient
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(
+        github_service.httpx, "AsyncClient", lambda: client_class(transport=transport)
+    )
+    monkeypatch.setattr(github_service, "RESPONSE_CACHE_SIZE", 1)
+
+    github = _TokenGitHub(Database(tmp_path / "test.db"))
+    assert await github.list_branches("o", "r") == ["main"]
+    assert "If-None-Match" not in requests[0].headers
+
+    assert await github.list_branches("o", "r") == ["main"]
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    branches.append({"name": "feature"})
+    assert await github.list_branches("o", "r") == ["main", "feature"]
+
+    # The cache is bounded: another URL evicts the branches response.
+    await github.find_pull_request_by_head("o", "r", head="o:feature")
+    await github.list_branches("o", "r")
+    assert "If-None-Match" not in requests[-1].headers
+
+    [core] = github.rate_limits()
+    assert (core.resource, core.limit, core.remaining, core.used) == ("core", 5000, 4995, 5)
+    assert core.reset_at.timestamp() == 1800000000
@@ -0,0 +1,111 @@
+"""Tests for GitHub webhook ingestion."""
+
+import hashlib
+import hmac
+import json
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from dursor_api.config import settings
+from dursor_api.dependencies import get_github_webhook_service
+from dursor_api.routes import webhooks_router
+from dursor_api.services.github_webhook import GitHubWebhookService
+from dursor_api.storage.dao import PRDAO, GitHubWebhookDeliveryDAO, RepoDAO, TaskDAO
+from dursor_api.storage.db import Database
+
+SECRET = "webhook-secret"
+
+# Trimmed payloads as recorded from GitHub deliveries
+PR_MERGED = {
+    "action": "closed",
+    "number": 7,
+    "pull_request": {
+        "html_url": "https://github.com/o/r/pull/7",
+        "number": 7,
+        "state": "closed",
+        "merged": True,
+        "head": {"ref": "feature", "sha": "b" * 40},
+        "base": {"ref": "main", "sha": "c" * 40},
+    },
+    "repository": {"full_name": "o/r", "html_url": "https://github.com/o/r"},
+}
+PUSH = {
+    "ref": "refs/heads/feature",
+    "before": "a" * 40,
+    "after": "d" * 40,
+    "deleted": False,
+    "repository": {"full_name": "o/r", "html_url": "https://github.com/o/r"},
+}
+
+
+def _headers(event: str, delivery_id: str, body: bytes) -> dict[str, str]:
+    digest = hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+    return {
+        "Content-Type": "application/json",
+        "X-GitHub-Event": event,
+        "X-GitHub-Delivery": delivery_id,
+        "X-Hub-Signature-256": f"sha256={digest}",
+    }
+
+
+async def _deliver(
+    client: AsyncClient, event: str, delivery_id: str, payload: dict[str, Any]
+) -> Any:
+    body = json.dumps(payload).encode()
+    response = await client.post(
+        "/v1/webhooks/github", content=body, headers=_headers(event, delivery_id, body)
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_github_webhook_updates_prs(db: Database, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that pull_request and push events update PRs once per delivery."""
+    monkeypatch.setattr(settings, "github_webhook_secret", SECRET)
+    repo = await RepoDAO(db).create("https://github.com/o/r.git", "main", "abc", "/missing")
+    task = await TaskDAO(db).create(repo.id, "task")
+    pr_dao = PRDAO(db)
+    pr = await pr_dao.create(
+        task.id, 7, "https://github.com/o/r/pull/7", "feature", "t", "", "a" * 40
+    )
+    other = await pr_dao.create(
+        task.id, 8, "https://github.com/o/other/pull/8", "feature", "t", "", "a" * 40
+    )
+
+    app = FastAPI()
+    app.include_router(webhooks_router, prefix="/v1")
+    service = GitHubWebhookService(pr_dao, GitHubWebhookDeliveryDAO(db))
+    app.dependency_overrides[get_github_webhook_service] = lambda: service
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        result = await _deliver(client, "push", "delivery-1", PUSH)
+        assert (result["duplicate"], result["updated"]) == (False, 1)
+        updated = await pr_dao.get(pr.id)
+        assert updated is not None and updated.latest_commit == "d" * 40
+
+        result = await _deliver(client, "pull_request", "delivery-2", PR_MERGED)
+        assert result["updated"] == 1
+        updated = await pr_dao.get(pr.id)
+        assert updated is not None
+        assert (updated.status, updated.latest_commit) == ("merged", "b" * 40)
+
+        # A redelivery is a no-op.
+        await pr_dao.update_status(pr.id, "open")
+        result = await _deliver(client, "pull_request", "delivery-2", PR_MERGED)
+        assert result["duplicate"] is True
+        updated = await pr_dao.get(pr.id)
+        assert updated is not None and updated.status == "open"
+
+        # Same branch name in another repository is untouched.
+        untouched = await pr_dao.get(other.id)
+        assert untouched is not None
+        assert (untouched.status, untouched.latest_commit) == ("open", "a" * 40)
+
+        body = json.dumps(PUSH).encode()
+        headers = _headers("push", "delivery-3", body)
+        headers["X-Hub-Signature-256"] = "sha256=" + "0" * 64
+        response = await client.post("/v1/webhooks/github", content=body, headers=headers)
+        assert response.status_code == 401
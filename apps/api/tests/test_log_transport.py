@@ -0,0 +1,48 @@
+"""Tests for following output streams through a LogTransport."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from dursor_api.services.log_transport import FileTailTransport
+from dursor_api.services.output_manager import OutputManager
+from dursor_api.services.run_log_store import RunLogStore
+
+
+def _manager(logs_dir: Path) -> OutputManager:
+    store = RunLogStore(logs_dir)
+    return OutputManager(log_store=store, transport=FileTailTransport(store, poll_interval=0.01))
+
+
+async def _collect(manager: OutputManager, run_id: str) -> list[str]:
+    return [line.content async for line in manager.subscribe(run_id)]
+
+
+@pytest.mark.asyncio
+async def test_subscriber_attached_before_first_line(tmp_path: Path) -> None:
+    """Test that an early subscriber gets every line and stops on completion."""
+    manager = _manager(tmp_path)
+    subscriber = asyncio.create_task(_collect(manager, "run-1"))
+    await asyncio.sleep(0.05)
+
+    for i in range(3):
+        await manager.publish_async("run-1", f"line {i}")
+    await manager.mark_complete("run-1")
+
+    assert await asyncio.wait_for(subscriber, timeout=5) == ["line 0", "line 1", "line 2"]
+
+
+@pytest.mark.asyncio
+async def test_stream_without_output_completes(tmp_path: Path) -> None:
+    """Test that subscribers of a run that never published a line stop."""
+    manager = _manager(tmp_path)
+    early = asyncio.create_task(_collect(manager, "run-1"))
+    await asyncio.sleep(0.05)
+
+    await manager.mark_complete("run-1")
+
+    assert await asyncio.wait_for(early, timeout=5) == []
+    # Late subscribers, including ones in another worker process, stop as well.
+    assert await asyncio.wait_for(_collect(manager, "run-1"), timeout=5) == []
+    assert await asyncio.wait_for(_collect(_manager(tmp_path), "run-1"), timeout=5) == []
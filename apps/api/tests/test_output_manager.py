@@ -0,0 +1,72 @@
+"""Tests for OutputManager memory management."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from dursor_api.services.output_manager import OutputManager
+from dursor_api.services.run_log_store import RunLogStore
+
+
+@pytest.mark.asyncio
+async def test_memory_budget_evicts_completed_streams_first(tmp_path: Path) -> None:
+    """Test that completed streams are evicted LRU-first and remain readable from disk."""
+    manager = OutputManager(log_store=RunLogStore(tmp_path), memory_budget_bytes=1)
+    for i in range(3):
+        await manager.publish_async("done", f"done {i}")
+        await manager.publish_async("active", f"active {i}")
+    await manager.mark_complete("done")
+
+    evicted = await manager.enforce_memory_budget()
+    stats = await manager.get_stats()
+
+    assert evicted == 1
+    assert stats["buffered_bytes"] <= 1
+    assert stats["active_runs"] == 1
+    assert [line.content for line in await manager.get_history("done")] == [
+        "done 0",
+        "done 1",
+        "done 2",
+    ]
+    assert [line.content for line in await manager.get_history("active", 1)] == [
+        "active 1",
+        "active 2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_history_beyond_memory_tail_is_read_from_disk(tmp_path: Path) -> None:
+    """Test that only max_history lines stay in memory and history stays complete."""
+    manager = OutputManager(log_store=RunLogStore(tmp_path), max_history=2)
+    for i in range(5):
+        await manager.publish_async("run-1", f"line {i}")
+
+    assert [line.content for line in manager._streams["run-1"]] == ["line 3", "line 4"]
+    history = await manager.get_history("run-1")
+    assert [line.content for line in history] == [f"line {i}" for i in range(5)]
+    assert [line.line_number for line in history] == list(range(5))
+    assert [line.content for line in await manager.get_history("run-1", 1, 2)] == [
+        "line 1",
+        "line 2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_maintenance_drops_old_and_abandoned_streams(tmp_path: Path) -> None:
+    """Test that maintenance frees completed and idle streams but keeps watched ones."""
+    manager = OutputManager(log_store=RunLogStore(tmp_path), cleanup_after=0)
+    await manager.publish_async("done", "done 0")
+    await manager.mark_complete("done")
+    await manager.publish_async("idle", "idle 0")
+    await manager.publish_async("watched", "watched 0")
+    manager._subscribers["watched"].append(asyncio.Queue())
+
+    stats = await manager.run_maintenance()
+
+    assert (stats["cleaned_up"], stats["evicted"]) == (2, 0)
+    assert set(manager._streams) == {"watched"}
+    # Dropped streams are reloaded from disk on demand.
+    assert [line.content for line in await manager.get_history("done")] == ["done 0"]
+    assert await manager.is_complete("done")
+    assert not await manager.is_complete("idle")
@@ -0,0 +1,172 @@
+"""Tests for the background post-run pipeline."""
+
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from dursor_api.config import settings
+from dursor_api.domain.enums import ExecutorType, PostRunStatus, RunStatus
+from dursor_api.domain.models import PRCreate, PRUpdate
+from dursor_api.services.crypto_service import CryptoService
+from dursor_api.services.git_service import GitService
+from dursor_api.services.github_service import GitHubService
+from dursor_api.services.model_service import ModelService
+from dursor_api.services.post_run_pipeline import PostRunJob, PostRunPipeline
+from dursor_api.services.pr_service import PRService
+from dursor_api.services.repo_service import RepoService
+from dursor_api.storage.dao import PRDAO, ModelProfileDAO, PRDraftDAO, RepoDAO, RunDAO, TaskDAO
+from dursor_api.storage.db import Database
+
+
+@pytest.mark.asyncio
+async def test_commit_stage_records_status_and_serializes_worktree(
+    tmp_path: Path, db: Database, git_repo: Path, run_git: Callable[..., str]
+) -> None:
+    """Test that jobs on one worktree commit in order and push is skipped without GitHub."""
+    repo = git_repo
+    (repo / "a.txt").write_text("a\n")
+    run_git(repo, "add", "-A")
+    run_git(repo, "commit", "-qm", "init")
+
+    repo_dao, task_dao, run_dao = RepoDAO(db), TaskDAO(db), RunDAO(db)
+    repo_obj = await repo_dao.create("https://example.com/r.git", "main", "abc", str(repo))
+    task = await task_dao.create(repo_obj.id, "task")
+    git_service = GitService(tmp_path / "workspaces")
+    pipeline = PostRunPipeline(run_dao, git_service, retry_delay=0)
+
+    run_ids = []
+    for name in ("first", "second"):
+        run = await run_dao.create(task.id, name, ExecutorType.CLAUDE_CODE)
+        await run_dao.update_post_run(
+            run.id, commit_status=PostRunStatus.PENDING, push_status=PostRunStatus.SKIPPED
+        )
+        await pipeline.wait_for_worktree(repo)
+        (repo / f"{name}.txt").write_text(f"{name}\n")
+        await git_service.stage_all(repo)
+        pipeline.submit(PostRunJob(run.id, repo, "main", f"Add {name}", name))
+        run_ids.append(run.id)
+
+    for run_id in run_ids:
+        await pipeline.wait_for_run(run_id)
+    assert not pipeline.is_pending(run_ids[-1])
+
+    shas = []
+    for run_id in run_ids:
+        stored = await run_dao.get(run_id)
+        assert stored is not None
+        assert stored.commit_status == PostRunStatus.SUCCEEDED
+        assert stored.push_status == PostRunStatus.SKIPPED
+        assert stored.commit_sha
+        shas.append(stored.commit_sha)
+
+    log = subprocess.run(
+        ["git", "log", "--format=%H %s", "-2"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.splitlines()
+    assert log == [f"{shas[1]} Add second", f"{shas[0]} Add first"]
+
+
+@pytest.mark.asyncio
+async def test_pr_creation_refuses_runs_whose_commit_failed(
+    tmp_path: Path, db: Database, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a PR is not created from a branch missing the run's changes."""
+    monkeypatch.setattr(settings, "workspaces_dir", tmp_path / "workspaces")
+    repo_dao, task_dao, run_dao = RepoDAO(db), TaskDAO(db), RunDAO(db)
+    repo_obj = await repo_dao.create("https://github.com/o/r.git", "main", "abc", "/missing")
+    task = await task_dao.create(repo_obj.id, "task")
+    run = await run_dao.create(task.id, "add a", ExecutorType.CLAUDE_CODE)
+    git_service = GitService(tmp_path / "workspaces")
+    pipeline = PostRunPipeline(run_dao, git_service, max_attempts=1, retry_delay=0)
+
+    # The worktree is not a repository, so the commit stage fails.
+    pipeline.submit(PostRunJob(run.id, tmp_path / "missing", "b", "Add a", "a"))
+    pr_service = PRService(
+        PRDAO(db),
+        task_dao,
+        run_dao,
+        RepoService(repo_dao),
+        GitHubService(db),
+        ModelService(ModelProfileDAO(db), CryptoService("test-key")),
+        git_service,
+        pipeline,
+    )
+    with pytest.raises(ValueError, match="Committing the changes of run .* failed"):
+        await pr_service.create(task.id, PRCreate(selected_run_id=run.id, title="t"))
+
+    stored = await run_dao.get(run.id)
+    assert stored is not None and stored.commit_status == PostRunStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_pr_prep_drafts_after_commit(tmp_path: Path, db: Database, git_repo: Path) -> None:
+    """Test that the PR draft stage runs for committed runs and drafts are cached."""
+    repo = git_repo
+    (repo / "a.txt").write_text("a\n")
+
+    repo_dao, task_dao, run_dao = RepoDAO(db), TaskDAO(db), RunDAO(db)
+    draft_dao = PRDraftDAO(db)
+    repo_obj = await repo_dao.create("https://example.com/r.git", "main", "abc", str(repo))
+    task = await task_dao.create(repo_obj.id, "task")
+    run = await run_dao.create(task.id, "add a", ExecutorType.CLAUDE_CODE)
+    git_service = GitService(tmp_path / "workspaces")
+    pipeline = PostRunPipeline(run_dao, git_service, retry_delay=0)
+
+    async def prepare(run_id: str) -> None:
+        stored = await run_dao.get(run_id)
+        assert stored is not None and stored.commit_sha
+        await draft_dao.upsert(stored.commit_sha, "", run_id, "Add a", "Adds a.")
+
+    pipeline.pr_prep = prepare
+    await git_service.stage_all(repo)
+    pipeline.submit(PostRunJob(run.id, repo, "main", "Add a", "a"))
+    await pipeline.wait_for_run(run.id)
+    await pipeline.wait_for_pr_prep(run.id)
+
+    stored = await run_dao.get(run.id)
+    assert stored is not None and stored.commit_sha
+    draft = await draft_dao.get(stored.commit_sha, "")
+    assert draft is not None
+    assert (draft.title, draft.body, draft.run_id) == ("Add a", "Adds a.", run.id)
+    assert await draft_dao.get(stored.commit_sha, "other-template") is None
+
+
+@pytest.mark.asyncio
+async def test_pr_update_refuses_while_a_run_works_on_the_branch(
+    tmp_path: Path, db: Database, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a PR branch's worktree is not fast-forwarded under a running run."""
+    monkeypatch.setattr(settings, "workspaces_dir", tmp_path / "workspaces")
+    repo_dao, task_dao, run_dao = RepoDAO(db), TaskDAO(db), RunDAO(db)
+    pr_dao = PRDAO(db)
+    repo_obj = await repo_dao.create("https://github.com/o/r.git", "main", "abc", "/missing")
+    task = await task_dao.create(repo_obj.id, "task")
+    running = await run_dao.create(task.id, "more", ExecutorType.CLAUDE_CODE)
+    await run_dao.update_worktree(running.id, "dursor/pr", str(tmp_path / "wt"))
+    await run_dao.update_status(running.id, RunStatus.RUNNING)
+    selected = await run_dao.create(task.id, "patch", ExecutorType.CLAUDE_CODE)
+    await run_dao.update_status(selected.id, RunStatus.SUCCEEDED, patch="diff")
+    pr = await pr_dao.create(
+        task.id, 1, "https://github.com/o/r/pull/1", "dursor/pr", "t", None, "abc"
+    )
+
+    git_service = GitService(tmp_path / "workspaces")
+    pr_service = PRService(
+        pr_dao,
+        task_dao,
+        run_dao,
+        RepoService(repo_dao),
+        GitHubService(db),
+        ModelService(ModelProfileDAO(db), CryptoService("test-key")),
+        git_service,
+        PostRunPipeline(run_dao, git_service, retry_delay=0),
+    )
+    with pytest.raises(ValueError, match=f"Run {running.id} is still working on dursor/pr"):
+        await pr_service.update(
+            task.id, pr.id, PRUpdate(selected_run_id=selected.id, message="Update")
+        )
@@ -0,0 +1,87 @@
+"""Tests for bulk PR status sync."""
+
+import re
+from typing import Any
+
+import pytest
+
+from dursor_api.services import github_service
+from dursor_api.services.github_service import GitHubService
+from dursor_api.services.kanban_service import KanbanService
+from dursor_api.storage.dao import PRDAO, RepoDAO, RunDAO, TaskDAO
+from dursor_api.storage.db import Database
+
+
+class _GraphQLGitHub(GitHubService):
+    """Answers PR GraphQL queries from a dict of PR number -> GraphQL state."""
+
+    def __init__(self, db: Database, states: dict[int, str]):
+        super().__init__(db)
+        self.states = states
+        self.requests: list[dict[str, Any]] = []
+
+    async def _github_request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        assert (method, endpoint) == ("POST", "/graphql")
+        self.requests.append(kwargs["json"])
+        if kwargs["json"]["variables"]["name"] == "gone":
+            return {"data": {"repository": None}, "errors": [{"message": "Not found"}]}
+        numbers = [
+            int(n) for n in re.findall(r"pullRequest\(number: (\d+)\)", kwargs["json"]["query"])
+        ]
+        repository: dict[str, Any] = {}
+        for number in numbers:
+            state = self.states.get(number)
+            repository[f"pr{number}"] = state and {
+                "number": number,
+                "state": "CLOSED" if state == "MERGED" else state,
+                "merged": state == "MERGED",
+                "mergedAt": "2026-01-01T00:00:00Z" if state == "MERGED" else None,
+            }
+        return {"data": {"repository": repository}}
+
+
+@pytest.mark.asyncio
+async def test_sync_open_pr_statuses_batches_queries(
+    db: Database, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that open PRs are synced in chunked GraphQL queries and one DB update."""
+    monkeypatch.setattr(github_service, "PR_STATUS_BATCH_SIZE", 2)
+    repo_dao, task_dao, pr_dao = RepoDAO(db), TaskDAO(db), PRDAO(db)
+    repo = await repo_dao.create("https://github.com/o/r.git", "main", "abc", "/missing")
+    task = await task_dao.create(repo.id, "task")
+    prs = {}
+    for number in (1, 2, 3, 4, 5):
+        prs[number] = await pr_dao.create(
+            task.id, number, f"https://github.com/o/r/pull/{number}", f"b{number}", "t", "", "c"
+        )
+    await pr_dao.update_status(prs[5].id, "merged")
+
+    github = _GraphQLGitHub(db, {1: "OPEN", 2: "MERGED", 3: "CLOSED"})
+    kanban = KanbanService(task_dao, RunDAO(db), pr_dao, github)
+    result = await kanban.sync_open_pr_statuses()
+
+    # PRs 1-4 are open locally: two queries of two; PR 4 was not found.
+    assert len(github.requests) == 2
+    assert github.requests[0]["variables"] == {"owner": "o", "name": "r"}
+    assert (result.checked, result.updated) == (3, 2)
+    statuses = {pr.number: pr.status for pr in await pr_dao.list(task.id)}
+    assert statuses == {1: "open", 2: "merged", 3: "closed", 4: "open", 5: "merged"}
+
+
+@pytest.mark.asyncio
+async def test_sync_open_pr_statuses_skips_failing_repository(db: Database) -> None:
+    """Test that a repository whose query fails does not block the others."""
+    repo_dao, task_dao, pr_dao = RepoDAO(db), TaskDAO(db), PRDAO(db)
+    repo = await repo_dao.create("https://github.com/o/r.git", "main", "abc", "/missing")
+    task = await task_dao.create(repo.id, "task")
+    gone = await pr_dao.create(task.id, 1, "https://github.com/o/gone/pull/1", "b", "t", "", "c")
+    kept = await pr_dao.create(task.id, 2, "https://github.com/o/r/pull/2", "b", "t", "", "c")
+
+    github = _GraphQLGitHub(db, {1: "MERGED", 2: "MERGED"})
+    kanban = KanbanService(task_dao, RunDAO(db), pr_dao, github)
+    result = await kanban.sync_open_pr_statuses()
+
+    assert len(github.requests) == 2
+    assert (result.checked, result.updated) == (1, 1)
+    statuses = {pr.id: pr.status for pr in await pr_dao.list(task.id)}
+    assert statuses == {gone.id: "open", kept.id: "merged"}
@@ -0,0 +1,104 @@
+"""Tests for per-file run diff storage."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from dursor_api.config import settings
+from dursor_api.domain.enums import FileChangeType, RunStatus
+from dursor_api.services.crypto_service import CryptoService
+from dursor_api.services.diff_parser import iter_file_diffs, split_hunks
+from dursor_api.services.git_service import GitService
+from dursor_api.services.model_service import ModelService
+from dursor_api.services.repo_service import RepoService
+from dursor_api.services.run_service import RunService
+from dursor_api.storage.dao import ModelProfileDAO, RepoDAO, RunDAO, TaskDAO
+from dursor_api.storage.db import Database
+
+PATCH = """diff --git a/a.py b/a.py
+--- a/a.py
++++ b/a.py
+@@ -1 +1 @@
+-x = 1
++x = 2
+@@ -10 +10 @@
+-y = 1
++y = 2
+diff --git a/b.py b/b.py
+new file mode 100644
+--- /dev/null
++++ b/b.py
+@@ -0,0 +1 @@
++print()
+"""
+
+
+@pytest.mark.asyncio
+async def test_store_and_read_file_diffs(db: Database) -> None:
+    """Test that per-file patches are stored in order and split into hunks."""
+    repo = await RepoDAO(db).create("https://example.com/r.git", "main", "abc", "/tmp/r")
+    task = await TaskDAO(db).create(repo.id, "Task")
+    run_dao = RunDAO(db)
+    run = await run_dao.create(task.id, "Change things")
+    await run_dao.update_status(run.id, RunStatus.SUCCEEDED, patch=PATCH)
+
+    # The rows replace the run's patch instead of copying it.
+    await run_dao.replace_file_diffs(run.id, iter_file_diffs(PATCH))
+    stored_run = await run_dao.get(run.id)
+    assert stored_run is not None and not stored_run.patch
+    assert await run_dao.get_patch(run.id) == PATCH
+    files = await run_dao.list_files(run.id)
+
+    assert [(f.path, f.change_type, f.hunk_count) for f in files] == [
+        ("a.py", FileChangeType.MODIFIED, 2),
+        ("b.py", FileChangeType.ADDED, 1),
+    ]
+    file_diff = await run_dao.get_file_diff(run.id, "a.py")
+    assert file_diff is not None
+    header, hunks = split_hunks(file_diff.patch)
+    assert header.endswith("+++ b/a.py")
+    assert hunks == ["@@ -1 +1 @@\n-x = 1\n+x = 2", "@@ -10 +10 @@\n-y = 1\n+y = 2"]
+    assert await run_dao.get_file_diff(run.id, "missing.py") is None
+
+
+@pytest.mark.asyncio
+async def test_file_patch_loaded_from_run_commit(
+    tmp_path: Path,
+    db: Database,
+    git_repo: Path,
+    run_git: Callable[..., str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that CLI run patches are loaded from the run's commit on first access."""
+    workspace = git_repo
+    (workspace / "a.py").write_text("x = 1\n")
+    run_git(workspace, "add", "-A")
+    run_git(workspace, "commit", "-qm", "init")
+    (workspace / "a.py").write_text("x = 2\n")
+    run_git(workspace, "commit", "-qam", "change")
+    sha = run_git(workspace, "rev-parse", "HEAD")
+
+    monkeypatch.setattr(settings, "workspaces_dir", tmp_path)
+    repo = await RepoDAO(db).create("https://example.com/r.git", "main", sha, str(workspace))
+    task = await TaskDAO(db).create(repo.id, "Task")
+    run_dao = RunDAO(db)
+    run = await run_dao.create(task.id, "Change things")
+    git_service = GitService(tmp_path)
+    # Stats only, as stored when a CLI run finishes; the worktree is gone.
+    await run_dao.replace_file_diffs(run.id, await git_service.get_changes(workspace, commit=sha))
+    await run_dao.update_status(run.id, RunStatus.SUCCEEDED, commit_sha=sha)
+    service = RunService(
+        run_dao,
+        TaskDAO(db),
+        ModelService(ModelProfileDAO(db), CryptoService("")),
+        RepoService(RepoDAO(db)),
+        git_service,
+    )
+
+    patch = await service.get_file_patch(run.id, "a.py")
+    assert patch is not None
+    assert patch.hunks == ["@@ -1 +1 @@\n-x = 1\n+x = 2"]
+    stored = await run_dao.get_file_diff(run.id, "a.py")
+    assert stored is not None and stored.patch.startswith("diff --git a/a.py b/a.py")
+    assert [f.hunk_count for f in await run_dao.list_files(run.id)] == [1]
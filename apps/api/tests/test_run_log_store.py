@@ -0,0 +1,87 @@
+"""Tests for the on-disk run log store."""
+
+from pathlib import Path
+
+import pytest
+
+from dursor_api.services.output_manager import OutputManager
+from dursor_api.services.run_log_store import OutputLine, RunLogStore
+
+
+def _write_lines(store: RunLogStore, run_id: str, count: int, start: int = 0) -> None:
+    for i in range(start, start + count):
+        store.append(run_id, OutputLine(line_number=i, content=f"line {i}", timestamp=1.0))
+
+
+def test_read_from_any_line(tmp_path: Path) -> None:
+    """Test reading from arbitrary offsets across index entries and segments."""
+    store = RunLogStore(tmp_path, index_interval=4, segment_max_bytes=200)
+    _write_lines(store, "run-1", 50)
+
+    assert store.line_count("run-1") == 50
+    assert [line.content for line in store.read("run-1", 0, 3)] == ["line 0", "line 1", "line 2"]
+    assert [line.line_number for line in store.read("run-1", 37)] == list(range(37, 50))
+    assert store.read("run-1", 50) == []
+    assert len(list(tmp_path.joinpath("run-1").glob("*.log"))) > 1
+
+
+def test_reopen_after_restart(tmp_path: Path) -> None:
+    """Test that a new store instance recovers line counts and keeps appending."""
+    store = RunLogStore(tmp_path, index_interval=4, segment_max_bytes=200)
+    _write_lines(store, "run-1", 10)
+    store.mark_complete("run-1")
+
+    reopened = RunLogStore(tmp_path, index_interval=4, segment_max_bytes=200)
+    assert reopened.exists("run-1")
+    assert reopened.is_complete("run-1")
+    assert reopened.line_count("run-1") == 10
+
+    _write_lines(reopened, "run-1", 5, start=10)
+    assert [line.line_number for line in reopened.read("run-1", 8)] == list(range(8, 15))
+
+
+def test_partial_record_is_dropped(tmp_path: Path) -> None:
+    """Test that a half-written trailing record is ignored and overwritten."""
+    store = RunLogStore(tmp_path, index_interval=4)
+    _write_lines(store, "run-1", 3)
+    store.close("run-1")
+
+    segment = next(tmp_path.joinpath("run-1").glob("*.log"))
+    with open(segment, "ab") as f:
+        f.write(b'{"line_number":3,"con')
+
+    reopened = RunLogStore(tmp_path, index_interval=4)
+    assert reopened.line_count("run-1") == 3
+    _write_lines(reopened, "run-1", 1, start=3)
+    assert [line.content for line in reopened.read("run-1", 2)] == ["line 2", "line 3"]
+
+
+@pytest.mark.asyncio
+async def test_failed_append_is_dropped_without_breaking_the_stream(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a line failing to persist leaves no torn record or numbering gap."""
+    store = RunLogStore(tmp_path)
+    manager = OutputManager(log_store=store)
+    await manager.publish_async("run-1", "line 0")
+
+    def torn_append(run_id: str, line: OutputLine) -> None:
+        segment = store._writers[run_id].segment
+        segment.write(b'{"n": 1, "c": "lo')
+        segment.flush()
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(store, "append", torn_append)
+    await manager.publish_async("run-1", "lost")
+    monkeypatch.undo()
+    await manager.publish_async("run-1", "line 1")
+
+    history = await manager.get_history("run-1")
+    assert [(line.line_number, line.content) for line in history] == [
+        (0, "line 0"),
+        (1, "line 1"),
+    ]
+    assert [line.content for line in RunLogStore(tmp_path).read("run-1")] == [
+        "line 0",
+        "line 1",
+    ]
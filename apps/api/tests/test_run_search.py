@@ -0,0 +1,50 @@
+"""Tests for full-text run search."""
+
+import pytest
+
+from dursor_api.domain.enums import ExecutorType, RunStatus
+from dursor_api.domain.models import FileDiff
+from dursor_api.storage.dao import RepoDAO, RunDAO, TaskDAO
+from dursor_api.storage.db import Database
+
+
+@pytest.mark.asyncio
+async def test_search_runs_with_filters(db: Database) -> None:
+    """Test that status updates are indexed and searchable with filters."""
+    repo = await RepoDAO(db).create("https://example.com/r.git", "main", "abc", "/tmp/r")
+    task = await TaskDAO(db).create(repo.id, "Task")
+    run_dao = RunDAO(db)
+
+    failed = await run_dao.create(task.id, "Fix login", ExecutorType.CLAUDE_CODE)
+    await run_dao.update_status(
+        failed.id,
+        RunStatus.FAILED,
+        error="exit code 1",
+        logs=["Starting"],
+        search_logs=["Starting", "TypeError: cannot read property 'token'"],
+    )
+    succeeded = await run_dao.create(task.id, "Refactor auth", ExecutorType.CODEX_CLI)
+    await run_dao.update_status(
+        succeeded.id,
+        RunStatus.SUCCEEDED,
+        summary="Moved token handling",
+        files_changed=[FileDiff(path="src/auth/token_store.py")],
+    )
+
+    assert [r.id for r in await run_dao.search("TypeError")] == [failed.id]
+    assert [r.id for r in await run_dao.search("auth/token_store.py")] == [succeeded.id]
+    assert {r.id for r in await run_dao.search("token")} == {failed.id, succeeded.id}
+    assert [r.id for r in await run_dao.search("tok*", status=RunStatus.SUCCEEDED)] == [
+        succeeded.id
+    ]
+    assert await run_dao.search("token", executor_type=ExecutorType.GEMINI_CLI) == []
+    assert await run_dao.search('"(') == []
+    assert "**login**" in (await run_dao.search("login", repo_id=repo.id))[0].snippet
+
+    # A later update without the transcript keeps it searchable, and the
+    # integer keys of the index survive a VACUUM.
+    await run_dao.update_status(failed.id, RunStatus.FAILED, error="worktree removed")
+    await db.connection.execute("VACUUM")
+    assert [r.id for r in await run_dao.search("TypeError")] == [failed.id]
+    assert [r.id for r in await run_dao.search("worktree removed")] == [failed.id]
+    assert await run_dao.search("exit code") == []
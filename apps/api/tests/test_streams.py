@@ -0,0 +1,59 @@
+"""Tests for the multiplexed log WebSocket."""
+
+import asyncio
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from dursor_api.dependencies import get_output_manager, get_run_service
+from dursor_api.routes import streams_router
+from dursor_api.services.output_manager import OutputManager
+from dursor_api.services.run_log_store import RunLogStore
+
+
+class _NoRuns:
+    async def get(self, run_id: str) -> None:
+        return None
+
+
+def test_multiplexes_subscriptions(tmp_path: Path) -> None:
+    """Test that one socket serves several streams and reports per-stream errors."""
+    manager = OutputManager(log_store=RunLogStore(tmp_path))
+
+    async def publish() -> None:
+        for stream_id in ("bd-1", "bd-2"):
+            for i in range(3):
+                await manager.publish_async(stream_id, f"{stream_id} {i}")
+            await manager.mark_complete(stream_id)
+
+    asyncio.run(publish())
+
+    app = FastAPI()
+    app.include_router(streams_router, prefix="/v1")
+    app.dependency_overrides[get_output_manager] = lambda: manager
+    app.dependency_overrides[get_run_service] = lambda: _NoRuns()
+
+    with TestClient(app).websocket_connect("/v1/streams/logs") as ws:
+        ws.send_json({"type": "subscribe", "stream_id": "missing-run"})
+        assert ws.receive_json() == {
+            "type": "error",
+            "stream_id": "missing-run",
+            "detail": "Run not found",
+        }
+
+        ws.send_json({"type": "subscribe", "stream_id": "bd-1", "kind": "breakdown"})
+        ws.send_json(
+            {"type": "subscribe", "stream_id": "bd-2", "kind": "breakdown", "from_line": 2}
+        )
+        received: dict[str, list[str]] = {"bd-1": [], "bd-2": []}
+        completed: set[str] = set()
+        while len(completed) < 2:
+            message = ws.receive_json()
+            if message["type"] == "line":
+                received[message["stream_id"]].append(message["content"])
+            else:
+                assert message["type"] == "complete"
+                completed.add(message["stream_id"])
+
+    assert received == {"bd-1": ["bd-1 0", "bd-1 1", "bd-1 2"], "bd-2": ["bd-2 2"]}
@@ -0,0 +1,93 @@
+"""Tests for direct text generation and its fallbacks."""
+
+import pytest
+
+from dursor_api.agents.llm_router import LLMClient, LLMConfig, LLMRouter
+from dursor_api.config import Settings, settings
+from dursor_api.domain.enums import Provider
+from dursor_api.services.commit_message import ensure_english_commit_message
+from dursor_api.services.text_generation import generate_text, text_model_config
+
+
+class _StubClient(LLMClient):
+    def __init__(self, config: LLMConfig, reply: str | Exception):
+        super().__init__(config)
+        self.reply = reply
+        self.prompts: list[str] = []
+
+    async def generate(self, messages: list[dict[str, str]], system: str | None = None) -> str:
+        self.prompts.append(messages[-1]["content"])
+        if isinstance(self.reply, Exception):
+            raise self.reply
+        return self.reply
+
+
+class _StubRouter(LLMRouter):
+    def __init__(self, reply: str | Exception):
+        super().__init__()
+        self.reply = reply
+        self.client: _StubClient | None = None
+
+    def get_client(self, config: LLMConfig) -> LLMClient:
+        self.client = _StubClient(config, self.reply)
+        return self.client
+
+
+@pytest.fixture
+def anthropic_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "text_model_provider", "anthropic")
+    monkeypatch.setattr(settings, "text_model_name", "test-model")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
+
+
+def test_text_model_config_requires_model_and_key(
+    monkeypatch: pytest.MonkeyPatch, anthropic_model: None
+) -> None:
+    """Test that the direct path is only enabled with a model name and API key."""
+    config = text_model_config()
+    assert config is not None
+    assert (config.provider, config.model_name, config.api_key) == (
+        Provider.ANTHROPIC,
+        "test-model",
+        "key",
+    )
+
+    monkeypatch.delenv("ANTHROPIC_API_KEY")
+    assert text_model_config() is None
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
+    monkeypatch.setattr(settings, "text_model_name", "")
+    assert text_model_config() is None
+
+
+@pytest.mark.asyncio
+async def test_generate_text_returns_none_on_failure(anthropic_model: None) -> None:
+    """Test that failures and empty replies return None so callers fall back."""
+    router = _StubRouter("  TITLE: Add x\n---DESCRIPTION---\nAdds x.\n")
+    assert await generate_text("prompt", llm_router=router) == (
+        "TITLE: Add x\n---DESCRIPTION---\nAdds x."
+    )
+    assert await generate_text("prompt", llm_router=_StubRouter(RuntimeError("boom"))) is None
+    assert await generate_text("prompt", llm_router=_StubRouter("   ")) is None
+
+
+@pytest.mark.asyncio
+async def test_commit_message_rewrite_uses_text_model(anthropic_model: None) -> None:
+    """Test that non-English commit messages are rewritten with the text model."""
+    router = _StubRouter("Add login form")
+    assert await ensure_english_commit_message("ログインフォームを追加", llm_router=router) == (
+        "Add login form"
+    )
+    assert router.client is not None
+    assert "ログインフォームを追加" in router.client.prompts[0]
+
+    failing = _StubRouter(RuntimeError("boom"))
+    assert await ensure_english_commit_message("修正", llm_router=failing) == "Update changes"
+
+
+def test_text_model_is_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an API key alone does not enable the direct path."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "key")
+    default = Settings.model_fields["text_model_name"].default
+    monkeypatch.setattr(settings, "text_model_name", default)
+    assert text_model_config() is None
@@ -0,0 +1,157 @@
+"""Tests for worktree garbage collection."""
+
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from dursor_api.domain.enums import (
+    ExecutorType,
+    PostRunStatus,
+    RunStatus,
+    TaskBaseKanbanStatus,
+)
+from dursor_api.domain.models import RunWorktree
+from dursor_api.services.git_service import GitService
+from dursor_api.services.output_manager import OutputManager
+from dursor_api.services.run_log_store import RunLogStore
+from dursor_api.services.worktree_gc import WorktreeGC
+from dursor_api.storage.dao import RepoDAO, RunDAO, TaskDAO
+from dursor_api.storage.db import Database
+
+
+@pytest.mark.asyncio
+async def test_collect_reconciles_and_enforces_quota(tmp_path: Path, db: Database) -> None:
+    """Test orphan, archived and over-quota removal while active runs are kept."""
+    git_service = GitService(tmp_path / "workspaces")
+    repo_dao, task_dao, run_dao = RepoDAO(db), TaskDAO(db), RunDAO(db)
+    repo = await repo_dao.create("https://example.com/r.git", "main", "abc", "/missing")
+
+    async def add_run(name: str, status: RunStatus, archived: bool = False) -> Path:
+        task = await task_dao.create(repo.id, name)
+        if archived:
+            await task_dao.update_kanban_status(task.id, TaskBaseKanbanStatus.ARCHIVED)
+        run = await run_dao.create(task.id, name, ExecutorType.CLAUDE_CODE)
+        path = git_service.worktrees_dir / f"run_{name}"
+        path.mkdir()
+        (path / "data.bin").write_bytes(b"x" * 64 * 1024)
+        await run_dao.update_worktree(run.id, f"dursor/{name}", str(path))
+        await run_dao.update_status(run.id, status)
+        return path
+
+    old = await add_run("old", RunStatus.SUCCEEDED)
+    new = await add_run("new", RunStatus.SUCCEEDED)
+    running = await add_run("running", RunStatus.RUNNING)
+    archived = await add_run("archived", RunStatus.FAILED, archived=True)
+    # Make "old" the least recently used.
+    await db.connection.execute(
+        "UPDATE runs SET completed_at = '2000-01-01T00:00:00' WHERE instruction = 'old'"
+    )
+    orphan = git_service.worktrees_dir / "run_orphan"
+    orphan.mkdir()
+    os.utime(orphan, (time.time() - 7200, time.time() - 7200))
+    fresh_orphan = git_service.worktrees_dir / "run_fresh"
+    fresh_orphan.mkdir()
+
+    gc = WorktreeGC(run_dao, repo_dao, git_service, quota_per_repo_bytes=150 * 1024)
+    result = await gc.collect()
+
+    assert set(result.removed) == {orphan, archived, old}
+    assert new.exists() and running.exists() and fresh_orphan.exists()
+    assert result.freed_bytes >= 2 * 64 * 1024
+
+
+@pytest.mark.asyncio
+async def test_collect_keeps_worktrees_reused_during_the_pass(
+    tmp_path: Path, db: Database, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a worktree a new run picks up after the scan is not removed."""
+    git_service = GitService(tmp_path / "workspaces")
+    repo_dao, task_dao, run_dao = RepoDAO(db), TaskDAO(db), RunDAO(db)
+    repo = await repo_dao.create("https://example.com/r.git", "main", "abc", "/missing")
+    task = await task_dao.create(repo.id, "task")
+    run = await run_dao.create(task.id, "first", ExecutorType.CLAUDE_CODE)
+    path = git_service.worktrees_dir / "run_first"
+    path.mkdir()
+    await run_dao.update_worktree(run.id, "dursor/first", str(path))
+    await run_dao.update_status(run.id, RunStatus.SUCCEEDED)
+    await db.connection.execute("UPDATE runs SET completed_at = '2000-01-01T00:00:00'")
+
+    list_worktrees = run_dao.list_worktrees
+
+    async def reuse_after_scan() -> list[RunWorktree]:
+        worktrees = await list_worktrees()
+        monkeypatch.undo()
+        follow_up = await run_dao.create(task.id, "again", ExecutorType.CLAUDE_CODE)
+        await run_dao.update_worktree(follow_up.id, "dursor/first", str(path))
+        return worktrees
+
+    monkeypatch.setattr(run_dao, "list_worktrees", reuse_after_scan)
+    gc = WorktreeGC(run_dao, repo_dao, git_service, max_age=timedelta(days=1))
+    result = await gc.collect()
+
+    assert result.removed == []
+    assert path.exists()
+
+
+@pytest.mark.asyncio
+async def test_collect_removes_unreferenced_logs(tmp_path: Path, db: Database) -> None:
+    """Test that complete logs of deleted runs are removed after the grace period."""
+    git_service = GitService(tmp_path / "workspaces")
+    repo_dao, task_dao, run_dao = RepoDAO(db), TaskDAO(db), RunDAO(db)
+    repo = await repo_dao.create("https://example.com/r.git", "main", "abc", "/missing")
+    task = await task_dao.create(repo.id, "task")
+    run = await run_dao.create(task.id, "task", ExecutorType.CLAUDE_CODE)
+
+    log_store = RunLogStore(tmp_path / "logs")
+    output_manager = OutputManager(log_store=log_store)
+    for stream_id in (run.id, "deleted", "recent", "unfinished"):
+        await output_manager.publish_async(stream_id, "line")
+        if stream_id != "unfinished":
+            await output_manager.mark_complete(stream_id)
+    long_ago = time.time() - 3 * 86400
+    for stream_id in (run.id, "deleted"):
+        os.utime(log_store.logs_dir / stream_id / "complete", (long_ago, long_ago))
+
+    gc = WorktreeGC(run_dao, repo_dao, git_service, output_manager=output_manager)
+    result = await gc.collect()
+
+    assert result.removed_logs == ["deleted"]
+    assert sorted(log_store.stream_ids()) == sorted([run.id, "recent", "unfinished"])
+    assert await output_manager.get_history("deleted") == []
+
+
+@pytest.mark.asyncio
+async def test_collect_keeps_worktrees_with_uncommitted_changes(
+    tmp_path: Path, db: Database
+) -> None:
+    """Test that succeeded runs keep their worktree until their commit stage succeeds."""
+    git_service = GitService(tmp_path / "workspaces")
+    repo_dao, task_dao, run_dao = RepoDAO(db), TaskDAO(db), RunDAO(db)
+    repo = await repo_dao.create("https://example.com/r.git", "main", "abc", "/missing")
+
+    paths = {}
+    for commit_status in PostRunStatus:
+        name = commit_status.value
+        task = await task_dao.create(repo.id, name)
+        run = await run_dao.create(task.id, name, ExecutorType.CLAUDE_CODE)
+        path = git_service.worktrees_dir / f"run_{name}"
+        path.mkdir(parents=True)
+        await run_dao.update_worktree(run.id, f"dursor/{name}", str(path))
+        await run_dao.update_status(run.id, RunStatus.SUCCEEDED, commit_status=commit_status)
+        await db.connection.execute(
+            "UPDATE runs SET completed_at = '2000-01-01T00:00:00' WHERE id = ?", (run.id,)
+        )
+        paths[commit_status] = path
+
+    gc = WorktreeGC(run_dao, repo_dao, git_service, max_age=timedelta(days=1))
+    result = await gc.collect()
+
+    assert set(result.removed) == {
+        paths[PostRunStatus.SUCCEEDED],
+        paths[PostRunStatus.SKIPPED],
+    }
+    for status in (PostRunStatus.PENDING, PostRunStatus.RUNNING, PostRunStatus.FAILED):
+        assert paths[status].exists()
@@ -1,6 +1,9 @@
 'use client';
 
-import { useState, useMemo, useCallback } from 'react';
+import { useState, useEffect, useCallback } from 'react';
+import useSWR from 'swr';
+import { runsApi } from '@/lib/api';
+import type { RunFile } from '@/types';
 import { cn } from '@/lib/utils';
 import {
   DocumentIcon,
@@ -15,11 +18,16 @@ import {
 } from '@heroicons/react/24/outline';
 
 interface DiffViewerProps {
-  patch: string;
+  runId: string;
 }
 
 type ViewMode = 'unified' | 'split';
 
+// Files expanded (and fetched) when the viewer opens
+const AUTO_EXPAND_FILES = 5;
+// Hunks fetched per request for one file
+const HUNK_PAGE_SIZE = 50;
+
 interface ParsedFile {
   path: string;
   hunks: ParsedHunk[];
@@ -41,22 +49,78 @@ interface ParsedLine {
   newLineNumber: number | null;
 }
 
-export function DiffViewer({ patch }: DiffViewerProps) {
+interface LoadedFile {
+  hunks: ParsedHunk[];
+  rawHunks: string[];
+  hunkCount: number;
+}
+
+export function DiffViewer({ runId }: DiffViewerProps) {
+  // File list with stats only; each file's hunks are fetched when it is expanded.
+  const { data: files, isLoading } = useSWR(`run-files-${runId}`, () =>
+    runsApi.listFiles(runId)
+  );
+  const [loadedFiles, setLoadedFiles] = useState<Record<string, LoadedFile>>({});
+  const [loadingFiles, setLoadingFiles] = useState<Set<string>>(new Set());
+  const [failedFiles, setFailedFiles] = useState<Set<string>>(new Set());
   const [expandedFiles, setExpandedFiles] = useState<Set<string>>(new Set());
   const [collapsedHunks, setCollapsedHunks] = useState<Set<string>>(new Set());
   const [viewMode, setViewMode] = useState<ViewMode>('unified');
   const [copiedPath, setCopiedPath] = useState<string | null>(null);
   const [copiedPatch, setCopiedPatch] = useState(false);
 
-  // Parse patch into files
-  const files = useMemo(() => parsePatch(patch), [patch]);
+  useEffect(() => {
+    setLoadedFiles({});
+    setFailedFiles(new Set());
+    setCollapsedHunks(new Set());
+  }, [runId]);
 
-  // Initialize all files as expanded
-  useState(() => {
-    if (files.length > 0) {
-      setExpandedFiles(new Set(files.map((f) => f.path)));
+  // Expand the first files once the list is known
+  useEffect(() => {
+    if (files) {
+      setExpandedFiles(new Set(files.slice(0, AUTO_EXPAND_FILES).map((f) => f.path)));
     }
-  });
+  }, [files]);
+
+  const loadHunks = useCallback(
+    async (path: string, hunkStart: number) => {
+      setLoadingFiles((prev) => new Set(prev).add(path));
+      try {
+        const filePatch = await runsApi.getFileDiff(runId, path, hunkStart, HUNK_PAGE_SIZE);
+        setLoadedFiles((prev) => {
+          const previous = hunkStart > 0 ? prev[path] : undefined;
+          const rawHunks = [...(previous?.rawHunks ?? []), ...filePatch.hunks];
+          return {
+            ...prev,
+            [path]: {
+              hunks: rawHunks.map(parseHunk),
+              rawHunks,
+              hunkCount: filePatch.hunk_count,
+            },
+          };
+        });
+      } catch {
+        // Expanding the file again retries
+        setFailedFiles((prev) => new Set(prev).add(path));
+      } finally {
+        setLoadingFiles((prev) => {
+          const next = new Set(prev);
+          next.delete(path);
+          return next;
+        });
+      }
+    },
+    [runId]
+  );
+
+  // Fetch the first hunks of expanded files that were not loaded yet
+  useEffect(() => {
+    expandedFiles.forEach((path) => {
+      if (!loadedFiles[path] && !loadingFiles.has(path) && !failedFiles.has(path)) {
+        loadHunks(path, 0);
+      }
+    });
+  }, [expandedFiles, loadedFiles, loadingFiles, failedFiles, loadHunks]);
 
   const toggleFile = useCallback((path: string) => {
     setExpandedFiles((prev) => {
@@ -68,6 +132,14 @@ export function DiffViewer({ patch }: DiffViewerProps) {
       }
       return next;
     });
+    setFailedFiles((prev) => {
+      if (!prev.has(path)) {
+        return prev;
+      }
+      const next = new Set(prev);
+      next.delete(path);
+      return next;
+    });
   }, []);
 
   const toggleHunk = useCallback((key: string) => {
@@ -83,18 +155,18 @@ export function DiffViewer({ patch }: DiffViewerProps) {
   }, []);
 
   const expandAll = useCallback(() => {
-    setExpandedFiles(new Set(files.map((f) => f.path)));
+    setExpandedFiles(new Set((files ?? []).map((f) => f.path)));
     setCollapsedHunks(new Set());
   }, [files]);
 
   const collapseAll = useCallback(() => {
     setExpandedFiles(new Set());
     setCollapsedHunks(new Set(
-      files.flatMap((f, fi) =>
-        f.hunks.map((_, hi) => `${fi}-${hi}`)
+      (files ?? []).flatMap((f, fi) =>
+        (loadedFiles[f.path]?.hunks ?? []).map((_, hi) => `${fi}-${hi}`)
       )
     ));
-  }, [files]);
+  }, [files, loadedFiles]);
 
   const copyPath = useCallback(async (path: string) => {
     try {
@@ -106,18 +178,26 @@ export function DiffViewer({ patch }: DiffViewerProps) {
     }
   }, []);
 
+  // The full patch is only assembled (one request per file) when it is copied or downloaded
+  const fetchFullPatch = useCallback(async () => {
+    const filePatches = await Promise.all(
+      (files ?? []).map((f) => runsApi.getFileDiff(runId, f.path))
+    );
+    return filePatches.map((fp) => [fp.header, ...fp.hunks].join('\n')).join('\n') + '\n';
+  }, [files, runId]);
+
   const copyPatch = useCallback(async () => {
     try {
-      await navigator.clipboard.writeText(patch);
+      await navigator.clipboard.writeText(await fetchFullPatch());
       setCopiedPatch(true);
       setTimeout(() => setCopiedPatch(false), 2000);
     } catch {
       // Ignore clipboard errors
     }
-  }, [patch]);
+  }, [fetchFullPatch]);
 
-  const downloadPatch = useCallback(() => {
-    const blob = new Blob([patch], { type: 'text/plain' });
+  const downloadPatch = useCallback(async () => {
+    const blob = new Blob([await fetchFullPatch()], { type: 'text/plain' });
     const url = URL.createObjectURL(blob);
     const a = document.createElement('a');
     a.href = url;
@@ -126,7 +206,7 @@ export function DiffViewer({ patch }: DiffViewerProps) {
     a.click();
     document.body.removeChild(a);
     URL.revokeObjectURL(url);
-  }, [patch]);
+  }, [fetchFullPatch]);
 
   const scrollToFile = useCallback((path: string) => {
     const element = document.getElementById(`file-${path.replace(/[^a-zA-Z0-9]/g, '-')}`);
@@ -137,7 +217,15 @@ export function DiffViewer({ patch }: DiffViewerProps) {
     setExpandedFiles((prev) => new Set([...prev, path]));
   }, []);
 
-  if (!patch) {
+  if (isLoading) {
+    return (
+      <div className="flex items-center justify-center py-12 text-gray-500 text-sm">
+        Loading changes...
+      </div>
+    );
+  }
+
+  if (!files || files.length === 0) {
     return (
       <div className="flex flex-col items-center justify-center py-12 text-center">
         <DocumentIcon className="w-12 h-12 text-gray-700 mb-3" />
@@ -146,8 +234,8 @@ export function DiffViewer({ patch }: DiffViewerProps) {
     );
   }
 
-  const totalAdded = files.reduce((sum, f) => sum + f.addedLines, 0);
-  const totalRemoved = files.reduce((sum, f) => sum + f.removedLines, 0);
+  const totalAdded = files.reduce((sum, f) => sum + f.added_lines, 0);
+  const totalRemoved = files.reduce((sum, f) => sum + f.removed_lines, 0);
 
   return (
     <div className="flex flex-col h-full">
@@ -256,9 +344,9 @@ export function DiffViewer({ patch }: DiffViewerProps) {
                   {getFileName(file.path)}
                 </span>
                 <span className="text-xs text-gray-600 flex-shrink-0">
-                  <span className="text-green-500">+{file.addedLines}</span>
+                  <span className="text-green-500">+{file.added_lines}</span>
                   {' '}
-                  <span className="text-red-500">-{file.removedLines}</span>
+                  <span className="text-red-500">-{file.removed_lines}</span>
                 </span>
               </button>
             ))}
@@ -298,9 +386,9 @@ export function DiffViewer({ patch }: DiffViewerProps) {
                     </div>
                     <div className="flex items-center gap-3 flex-shrink-0">
                       <span className="text-xs">
-                        <span className="text-green-400">+{file.addedLines}</span>
+                        <span className="text-green-400">+{file.added_lines}</span>
                         {' '}
-                        <span className="text-red-400">-{file.removedLines}</span>
+                        <span className="text-red-400">-{file.removed_lines}</span>
                       </span>
                       <button
                         onClick={(e) => {
@@ -321,23 +409,19 @@ export function DiffViewer({ patch }: DiffViewerProps) {
 
                   {/* Hunks */}
                   {isExpanded && (
-                    <div className="overflow-x-auto">
-                      {viewMode === 'unified' ? (
-                        <UnifiedView
-                          file={file}
-                          fileIndex={fileIndex}
-                          collapsedHunks={collapsedHunks}
-                          toggleHunk={toggleHunk}
-                        />
-                      ) : (
-                        <SplitView
-                          file={file}
-                          fileIndex={fileIndex}
-                          collapsedHunks={collapsedHunks}
-                          toggleHunk={toggleHunk}
-                        />
-                      )}
-                    </div>
+                    <FileHunks
+                      file={file}
+                      loaded={loadedFiles[file.path]}
+                      isLoading={loadingFiles.has(file.path)}
+                      failed={failedFiles.has(file.path)}
+                      fileIndex={fileIndex}
+                      viewMode={viewMode}
+                      collapsedHunks={collapsedHunks}
+                      toggleHunk={toggleHunk}
+                      loadMore={() =>
+                        loadHunks(file.path, loadedFiles[file.path]?.rawHunks.length ?? 0)
+                      }
+                    />
                   )}
                 </div>
               );
@@ -349,6 +433,84 @@ export function DiffViewer({ patch }: DiffViewerProps) {
   );
 }
 
+// Hunks of one expanded file, fetched page by page
+function FileHunks({
+  file,
+  loaded,
+  isLoading,
+  failed,
+  fileIndex,
+  viewMode,
+  collapsedHunks,
+  toggleHunk,
+  loadMore,
+}: {
+  file: RunFile;
+  loaded: LoadedFile | undefined;
+  isLoading: boolean;
+  failed: boolean;
+  fileIndex: number;
+  viewMode: ViewMode;
+  collapsedHunks: Set<string>;
+  toggleHunk: (key: string) => void;
+  loadMore: () => void;
+}) {
+  if (!loaded) {
+    return (
+      <div className="px-3 py-2 text-xs text-gray-500 bg-gray-950">
+        {failed ? 'Diff unavailable' : 'Loading diff...'}
+      </div>
+    );
+  }
+
+  if (file.is_binary || loaded.hunkCount === 0) {
+    return (
+      <div className="px-3 py-2 text-xs text-gray-500 bg-gray-950">
+        {file.is_binary ? 'Binary file' : 'No content changes'}
+      </div>
+    );
+  }
+
+  const parsedFile: ParsedFile = {
+    path: file.path,
+    hunks: loaded.hunks,
+    addedLines: file.added_lines,
+    removedLines: file.removed_lines,
+  };
+  const remaining = loaded.hunkCount - loaded.hunks.length;
+
+  return (
+    <div className="overflow-x-auto">
+      {viewMode === 'unified' ? (
+        <UnifiedView
+          file={parsedFile}
+          fileIndex={fileIndex}
+          collapsedHunks={collapsedHunks}
+          toggleHunk={toggleHunk}
+        />
+      ) : (
+        <SplitView
+          file={parsedFile}
+          fileIndex={fileIndex}
+          collapsedHunks={collapsedHunks}
+          toggleHunk={toggleHunk}
+        />
+      )}
+      {remaining > 0 && (
+        <button
+          onClick={loadMore}
+          disabled={isLoading}
+          className="w-full px-3 py-1.5 text-xs text-blue-400 hover:bg-gray-800 transition-colors bg-gray-950 border-t border-gray-800"
+        >
+          {isLoading
+            ? 'Loading...'
+            : `Show ${Math.min(remaining, HUNK_PAGE_SIZE)} more of ${remaining} hunks`}
+        </button>
+      )}
+    </div>
+  );
+}
+
 // Unified view component
 function UnifiedView({
   file,
@@ -564,90 +726,38 @@ function getFileName(path: string): string {
   return parts[parts.length - 1];
 }
 
-// Parse patch into structured format
-function parsePatch(patch: string): ParsedFile[] {
-  const files: ParsedFile[] = [];
-  const lines = patch.split('\n');
-
-  let currentFile: ParsedFile | null = null;
-  let currentHunk: ParsedHunk | null = null;
-  let oldLineNum = 0;
-  let newLineNum = 0;
+// Parse one hunk ("@@ ... @@" header and its lines) into structured format
+function parseHunk(hunk: string): ParsedHunk {
+  const [header, ...lines] = hunk.split('\n');
+  const match = header.match(/@@ -(\d+)(?:,\d+)? \+(\d+)(?:,\d+)? @@/);
+  let oldLineNum = match ? parseInt(match[1], 10) : 1;
+  let newLineNum = match ? parseInt(match[2], 10) : 1;
+  const parsed: ParsedHunk = { header, lines: [], oldStart: oldLineNum, newStart: newLineNum };
 
   for (const line of lines) {
-    if (line.startsWith('diff ') || line.startsWith('--- ')) {
-      continue;
-    }
-
-    if (line.startsWith('+++ ')) {
-      // New file
-      if (currentFile) {
-        if (currentHunk) {
-          currentFile.hunks.push(currentHunk);
-        }
-        files.push(currentFile);
-      }
-
-      let path = line.slice(4).trim();
-      if (path.startsWith('b/')) {
-        path = path.slice(2);
-      }
-
-      currentFile = { path, hunks: [], addedLines: 0, removedLines: 0 };
-      currentHunk = null;
-      continue;
-    }
-
-    if (line.startsWith('@@')) {
-      // New hunk
-      if (currentFile && currentHunk) {
-        currentFile.hunks.push(currentHunk);
-      }
-
-      // Parse hunk header: @@ -oldStart,oldCount +newStart,newCount @@
-      const match = line.match(/@@ -(\d+)(?:,\d+)? \+(\d+)(?:,\d+)? @@/);
-      oldLineNum = match ? parseInt(match[1], 10) : 1;
-      newLineNum = match ? parseInt(match[2], 10) : 1;
-
-      currentHunk = { header: line, lines: [], oldStart: oldLineNum, newStart: newLineNum };
-      continue;
-    }
-
-    if (currentHunk && currentFile) {
-      if (line.startsWith('+') && !line.startsWith('+++')) {
-        currentHunk.lines.push({
-          content: line,
-          type: 'add',
-          oldLineNumber: null,
-          newLineNumber: newLineNum++,
-        });
-        currentFile.addedLines++;
-      } else if (line.startsWith('-') && !line.startsWith('---')) {
-        currentHunk.lines.push({
-          content: line,
-          type: 'remove',
-          oldLineNumber: oldLineNum++,
-          newLineNumber: null,
-        });
-        currentFile.removedLines++;
-      } else {
-        currentHunk.lines.push({
-          content: line,
-          type: 'context',
-          oldLineNumber: oldLineNum++,
-          newLineNumber: newLineNum++,
-        });
-      }
-    }
-  }
-
-  // Push last file and hunk
-  if (currentFile) {
-    if (currentHunk) {
-      currentFile.hunks.push(currentHunk);
+    if (line.startsWith('+')) {
+      parsed.lines.push({
+        content: line,
+        type: 'add',
+        oldLineNumber: null,
+        newLineNumber: newLineNum++,
+      });
+    } else if (line.startsWith('-')) {
+      parsed.lines.push({
+        content: line,
+        type: 'remove',
+        oldLineNumber: oldLineNum++,
+        newLineNumber: null,
+      });
+    } else {
+      parsed.lines.push({
+        content: line,
+        type: 'context',
+        oldLineNumber: oldLineNum++,
+        newLineNumber: newLineNum++,
+      });
     }
-    files.push(currentFile);
   }
 
-  return files;
+  return parsed;
 }
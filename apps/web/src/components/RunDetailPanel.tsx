@@ -245,7 +245,7 @@ export function RunDetailPanel({
               {getStatusBadge()}
             </div>
           </div>
-          {run.status === 'succeeded' && run.patch && !prResult && (
+          {run.status === 'succeeded' && run.files_changed.length > 0 && !prResult && (
             <Button
               variant="success"
               size="sm"
@@ -382,6 +382,7 @@ export function RunDetailPanel({
         {/* Failed status */}
         {run.status === 'failed' && (
           <FailedStatusDisplay
+            runId={run.id}
             error={run.error}
             logs={run.logs}
             activeTab={activeTab}
@@ -450,22 +451,15 @@ export function RunDetailPanel({
             )}
 
             {activeTab === 'diff' && (
-              <DiffViewer patch={run.patch || ''} />
+              <DiffViewer runId={run.id} />
             )}
 
             {activeTab === 'logs' && (
-              <div className="font-mono text-xs space-y-1 bg-gray-800/50 rounded-lg p-3">
-                {!run.logs || run.logs.length === 0 ? (
-                  <p className="text-gray-500 text-center py-4">No logs available.</p>
-                ) : (
-                  run.logs.map((log, i) => (
-                    <div key={i} className="text-gray-400 leading-relaxed">
-                      <span className="text-gray-600 mr-2 select-none">{i + 1}</span>
-                      {log}
-                    </div>
-                  ))
-                )}
-              </div>
+              <StreamingLogs
+                runId={run.id}
+                isRunning={false}
+                initialLogs={run.logs}
+              />
             )}
           </>
         )}
@@ -477,6 +471,7 @@ export function RunDetailPanel({
 // --- Sub-components ---
 
 interface FailedStatusDisplayProps {
+  runId: string;
   error: string | null | undefined;
   logs: string[] | null | undefined;
   activeTab: Tab;
@@ -486,6 +481,7 @@ interface FailedStatusDisplayProps {
 }
 
 function FailedStatusDisplay({
+  runId,
   error,
   logs,
   activeTab,
@@ -589,18 +585,7 @@ function FailedStatusDisplay({
     return (
       <div className="space-y-4">
         <ErrorSummary />
-        <div className="font-mono text-xs space-y-1 bg-gray-800/50 rounded-lg p-3">
-          {!logs || logs.length === 0 ? (
-            <p className="text-gray-500 text-center py-4">No logs available.</p>
-          ) : (
-            logs.map((log, i) => (
-              <div key={i} className="text-gray-400 leading-relaxed">
-                <span className="text-gray-600 mr-2 select-none">{i + 1}</span>
-                {log}
-              </div>
-            ))
-          )}
-        </div>
+        <StreamingLogs runId={runId} isRunning={false} initialLogs={logs ?? []} />
       </div>
     );
   }
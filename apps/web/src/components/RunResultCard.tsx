@@ -161,7 +161,7 @@ export function RunResultCard({
               {/* Tab Content */}
               <div className="p-4 max-h-96 overflow-y-auto" role="tabpanel">
                 {activeTab === 'summary' && <SummaryTab run={run} />}
-                {activeTab === 'diff' && <DiffViewer patch={run.patch || ''} />}
+                {activeTab === 'diff' && <DiffViewer runId={run.id} />}
                 {activeTab === 'logs' && <LogsTab logs={run.logs} />}
               </div>
             </>
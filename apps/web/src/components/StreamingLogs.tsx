@@ -10,7 +10,7 @@ interface StreamingLogsProps {
   runId: string;
   /** Whether the run is currently running */
   isRunning: boolean;
-  /** Initial logs to display (from previous fetches) */
+  /** Orchestration logs of the run (run.logs), shown before the CLI output */
   initialLogs?: string[];
   /** Optional class name for the container */
   className?: string;
@@ -21,6 +21,8 @@ interface StreamingLogsProps {
  *
  * Features:
  * - Real-time polling of CLI output (500ms interval)
+ * - Paged loading of the stored output of finished runs
+ * - Orchestration logs shown together with the CLI output
  * - Auto-scroll to bottom (toggleable)
  * - Line numbers
  * - Error handling
@@ -32,16 +34,17 @@ export function StreamingLogs({
   initialLogs = [],
   className,
 }: StreamingLogsProps) {
-  const [lines, setLines] = useState<string[]>(initialLogs);
+  const [output, setOutput] = useState<string[]>([]);
   const [streamActive, setStreamActive] = useState(false);
   const [autoScroll, setAutoScroll] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const containerRef = useRef<HTMLDivElement>(null);
   const cleanupRef = useRef<(() => void) | null>(null);
-  const linesLengthRef = useRef(initialLogs.length);
+  const outputLengthRef = useRef(0);
 
   // Derive isConnected from isRunning and streamActive
   const isConnected = isRunning && streamActive;
+  const lineCount = initialLogs.length + output.length;
 
   // Handle scroll to detect if user manually scrolled up
   const handleScroll = useCallback(() => {
@@ -57,24 +60,19 @@ export function StreamingLogs({
     if (autoScroll && containerRef.current) {
       containerRef.current.scrollTop = containerRef.current.scrollHeight;
     }
-  }, [lines, autoScroll]);
+  }, [lineCount, autoScroll]);
 
-  // Update linesLengthRef when lines change
+  // Update outputLengthRef when output changes
   useEffect(() => {
-    linesLengthRef.current = lines.length;
-  }, [lines.length]);
+    outputLengthRef.current = output.length;
+  }, [output.length]);
 
-  // SSE connection effect
+  // Output polling effect. Finished runs page through their stored output
+  // (kept in the run log store) until it is complete.
   useEffect(() => {
-    // Only connect if running
-    if (!isRunning) {
-      return;
-    }
-
-    // Start streaming from the current line count
-    // This avoids duplicate lines if we already have some from initialLogs
-    // Using ref to avoid reconnection loops when lines change
-    const fromLine = linesLengthRef.current;
+    // Continue from the output already loaded, e.g. when the run finishes.
+    // Using ref to avoid reconnection loops when output changes
+    const fromLine = outputLengthRef.current;
 
     // Use a microtask to set initial state to avoid synchronous setState in effect
     queueMicrotask(() => {
@@ -82,22 +80,35 @@ export function StreamingLogs({
       setStreamActive(true);
     });
 
-    const cleanup = runsApi.streamLogs(runId, {
-      fromLine,
-      onLine: (outputLine: OutputLine) => {
-        setLines((prev) => {
+    // Lines of one page are applied in a single state update
+    let pending: OutputLine[] = [];
+    const flush = () => {
+      const received = pending;
+      pending = [];
+      setOutput((prev) => {
+        const newOutput = [...prev];
+        for (const outputLine of received) {
           // Avoid duplicates by checking line number
-          if (outputLine.line_number < prev.length) {
-            return prev;
+          if (outputLine.line_number < newOutput.length) {
+            continue;
           }
           // Fill any gaps with empty lines if needed
-          const newLines = [...prev];
-          while (newLines.length < outputLine.line_number) {
-            newLines.push('');
+          while (newOutput.length < outputLine.line_number) {
+            newOutput.push('');
           }
-          newLines.push(outputLine.content);
-          return newLines;
-        });
+          newOutput.push(outputLine.content);
+        }
+        return newOutput;
+      });
+    };
+
+    const cleanup = runsApi.streamLogs(runId, {
+      fromLine,
+      onLine: (outputLine: OutputLine) => {
+        if (pending.length === 0) {
+          queueMicrotask(flush);
+        }
+        pending.push(outputLine);
       },
       onComplete: () => {
         setStreamActive(false);
@@ -156,15 +167,18 @@ export function StreamingLogs({
         onScroll={handleScroll}
         className="font-mono text-xs bg-gray-900 rounded-lg p-3 overflow-y-auto max-h-[500px] min-h-[200px]"
       >
-        {lines.length === 0 ? (
+        {lineCount === 0 ? (
           <div className="text-gray-500 text-center py-8">
             {isRunning ? 'Waiting for output...' : 'No logs available.'}
           </div>
         ) : (
-          lines.map((line, i) => (
+          [...initialLogs, ...output].map((line, i) => (
             <div
               key={i}
-              className="text-gray-400 leading-relaxed whitespace-pre-wrap hover:bg-gray-800/50 -mx-2 px-2"
+              className={cn(
+                'text-gray-400 leading-relaxed whitespace-pre-wrap hover:bg-gray-800/50 -mx-2 px-2',
+                i === initialLogs.length && i > 0 && 'mt-2 pt-2 border-t border-gray-800'
+              )}
             >
               <span className="text-gray-600 mr-3 select-none inline-block w-8 text-right">
                 {i + 1}
@@ -184,7 +198,7 @@ export function StreamingLogs({
       </div>
 
       {/* Scroll to bottom button (shown when not at bottom) */}
-      {!autoScroll && lines.length > 10 && (
+      {!autoScroll && lineCount > 10 && (
         <button
           onClick={scrollToBottom}
           className="absolute bottom-4 right-4 bg-blue-600 hover:bg-blue-500 text-white text-xs px-3 py-1.5 rounded-full shadow-lg transition-colors flex items-center gap-1.5"
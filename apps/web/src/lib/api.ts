@@ -20,6 +20,9 @@ import type {
   MessageCreate,
   Run,
   RunCreate,
+  RunFile,
+  RunFilePatch,
+  SparseCheckoutState,
   RunsCreated,
   OutputLine,
   PR,
@@ -27,11 +30,13 @@ import type {
   PRCreateAuto,
   PRCreated,
   PRCreateLink,
+  PRStatusSyncResult,
   PRSyncResult,
   PRUpdate,
   PRUpdated,
   GitHubAppConfig,
   GitHubAppConfigSave,
+  GitHubRateLimit,
   GitHubRepository,
   UserPreferences,
   UserPreferencesSave,
@@ -123,6 +128,8 @@ export const githubApi = {
 
   listBranches: (owner: string, repo: string) =>
     fetchApi<string[]>(`/github/repos/${owner}/${repo}/branches`),
+
+  getRateLimits: () => fetchApi<GitHubRateLimit[]>('/github/rate-limit'),
 };
 
 // Tasks
@@ -171,21 +178,55 @@ export const runsApi = {
   cancel: (runId: string) =>
     fetchApi<void>(`/runs/${runId}/cancel`, { method: 'POST' }),
 
+  /**
+   * List changed files of a run (stats only, no patch text).
+   */
+  listFiles: (runId: string) => fetchApi<RunFile[]>(`/runs/${runId}/files`),
+
+  /**
+   * Get one file's diff, optionally limited to a range of hunks.
+   */
+  getFileDiff: (runId: string, path: string, hunkStart: number = 0, hunkLimit?: number) => {
+    const params = new URLSearchParams({ hunk_start: String(hunkStart) });
+    if (hunkLimit !== undefined) {
+      params.set('hunk_limit', String(hunkLimit));
+    }
+    const encodedPath = path.split('/').map(encodeURIComponent).join('/');
+    return fetchApi<RunFilePatch>(`/runs/${runId}/files/${encodedPath}/diff?${params}`);
+  },
+
+  /**
+   * Widen a run's sparse worktree; omit paths to check out the full tree.
+   */
+  expandSparseCheckout: (runId: string, paths?: string[]) =>
+    fetchApi<SparseCheckoutState>(`/runs/${runId}/sparse-checkout`, {
+      method: 'POST',
+      body: JSON.stringify({ paths: paths ?? null }),
+    }),
+
   /**
    * Get logs for a run (REST endpoint for polling).
    */
-  getLogs: (runId: string, fromLine: number = 0) =>
-    fetchApi<{
+  getLogs: (runId: string, fromLine: number = 0, limit?: number) => {
+    const params = new URLSearchParams({ from_line: String(fromLine) });
+    if (limit !== undefined) {
+      params.set('limit', String(limit));
+    }
+    return fetchApi<{
       logs: OutputLine[];
       is_complete: boolean;
       total_lines: number;
       run_status: string;
-    }>(`/runs/${runId}/logs?from_line=${fromLine}`),
+      source: 'output' | 'run';
+    }>(`/runs/${runId}/logs?${params}`);
+  },
 
   /**
-   * Stream run logs by polling the logs endpoint.
+   * Stream run output by polling the logs endpoint.
    *
-   * This uses polling to fetch logs in real-time from OutputManager.
+   * This uses polling to fetch output in real-time from OutputManager, one
+   * page at a time. Lines served from the run record (runs without streamed
+   * output) are skipped, as they are the run's own logs.
    *
    * @param runId - The run ID to stream logs for
    * @param options - Streaming options
@@ -203,17 +244,20 @@ export const runsApi = {
     let cancelled = false;
     let nextLine = options.fromLine ?? 0;
     const pollInterval = 500; // Poll every 500ms for responsiveness
+    const pageSize = 1000;
 
     const poll = async () => {
       if (cancelled) return;
 
       try {
-        const result = await runsApi.getLogs(runId, nextLine);
+        const result = await runsApi.getLogs(runId, nextLine, pageSize);
 
         // Send new lines
-        for (const log of result.logs) {
-          if (cancelled) break;
-          options.onLine(log);
+        if (result.source === 'output') {
+          for (const log of result.logs) {
+            if (cancelled) break;
+            options.onLine(log);
+          }
         }
 
         // Update next line position
@@ -227,9 +271,9 @@ export const runsApi = {
           return;
         }
 
-        // Continue polling if still running
+        // Continue polling if still running; fetch the next page right away
         if (!cancelled) {
-          setTimeout(poll, pollInterval);
+          setTimeout(poll, result.logs.length === pageSize ? 0 : pollInterval);
         }
       } catch (error) {
         if (!cancelled) {
@@ -415,6 +459,13 @@ export const kanbanApi = {
     fetchApi<PR>(`/kanban/tasks/${taskId}/prs/${prId}/sync-status`, {
       method: 'POST',
     }),
+
+  syncOpenPRStatuses: (repoId?: string) => {
+    const params = repoId ? `?repo_id=${repoId}` : '';
+    return fetchApi<PRStatusSyncResult>(`/kanban/prs/sync-status${params}`, {
+      method: 'POST',
+    });
+  },
 };
 
 // Backlog
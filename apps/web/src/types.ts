@@ -5,9 +5,11 @@
 // Enums
 export type Provider = 'openai' | 'anthropic' | 'google';
 export type RunStatus = 'queued' | 'running' | 'succeeded' | 'failed' | 'canceled';
+export type PostRunStatus = 'pending' | 'running' | 'succeeded' | 'failed' | 'skipped';
 export type MessageRole = 'user' | 'assistant' | 'system';
 export type ExecutorType = 'patch_agent' | 'claude_code' | 'codex_cli' | 'gemini_cli';
 export type PRCreationMode = 'create' | 'link';
+export type FileChangeType = 'added' | 'modified' | 'deleted' | 'renamed' | 'copied';
 
 // Model Profile
 export interface ModelProfile {
@@ -32,12 +34,16 @@ export interface Repo {
   default_branch: string;
   latest_commit: string;
   workspace_path: string;
+  full_clone: boolean;
+  sparse_paths: string[] | null;
   created_at: string;
 }
 
 export interface RepoCloneRequest {
   repo_url: string;
   ref?: string;
+  full_clone?: boolean;
+  sparse_paths?: string[];
 }
 
 // Task
@@ -91,11 +97,32 @@ export interface RunSummary {
 export interface FileDiff {
   path: string;
   old_path?: string;
+  change_type?: FileChangeType;
+  is_binary?: boolean;
   added_lines: number;
   removed_lines: number;
   patch: string;
 }
 
+export interface RunFile {
+  path: string;
+  old_path?: string;
+  change_type: FileChangeType;
+  is_binary: boolean;
+  added_lines: number;
+  removed_lines: number;
+  hunk_count: number;
+}
+
+export interface RunFilePatch {
+  path: string;
+  old_path?: string;
+  header: string;
+  hunks: string[];
+  hunk_start: number;
+  hunk_count: number;
+}
+
 export interface Run {
   id: string;
   task_id: string;
@@ -109,6 +136,9 @@ export interface Run {
   instruction: string;
   base_ref: string | null;
   commit_sha: string | null;
+  commit_status: PostRunStatus | null;
+  push_status: PostRunStatus | null;
+  post_run_error: string | null;
   status: RunStatus;
   summary: string | null;
   patch: string | null;
@@ -127,6 +157,12 @@ export interface RunCreate {
   base_ref?: string;
   executor_type?: ExecutorType;
   message_id?: string;
+  sparse_checkout?: boolean;
+  sparse_paths?: string[];
+}
+
+export interface SparseCheckoutState {
+  sparse_dirs: string[] | null;
 }
 
 export interface RunsCreated {
@@ -200,6 +236,11 @@ export interface PRSyncResult {
   pr: PRCreated | null;
 }
 
+export interface PRStatusSyncResult {
+  checked: number;
+  updated: number;
+}
+
 export interface PRUpdated {
   url: string;
   latest_commit: string;
@@ -232,10 +273,21 @@ export interface GitHubRepository {
   private: boolean;
 }
 
+export interface GitHubRateLimit {
+  resource: string;
+  limit: number;
+  remaining: number;
+  used: number;
+  reset_at: string;
+  updated_at: string;
+}
+
 export interface RepoSelectRequest {
   owner: string;
   repo: string;
   branch?: string;
+  full_clone?: boolean;
+  sparse_paths?: string[];
 }
 
 // User Preferences